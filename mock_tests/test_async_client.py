@@ -0,0 +1,271 @@
+import asyncio
+import json
+import time
+import uuid
+from concurrent import futures
+
+import grpc
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_SERVER_URL
+from weaviate.proto.v1 import search_get_pb2, weaviate_pb2_grpc
+
+MOCK_GRPC_PORT = 23538
+
+
+class SearchServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def Search(self, request, context):
+        results = [
+            search_get_pb2.SearchResult(
+                properties=search_get_pb2.PropertiesResult(
+                    non_ref_properties={"name": f"{request.collection} {i}"}
+                )
+            )
+            for i in range(request.limit)
+        ]
+        return search_get_pb2.SearchReply(took=0.1, results=results)
+
+
+def test_async_data_and_query(weaviate_mock):
+    obj_uuid = str(uuid.uuid4())
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json({"id": obj_uuid})
+    weaviate_mock.expect_request(f"/v1/objects/Test/{obj_uuid}", method="GET").respond_with_json(
+        {"id": obj_uuid, "properties": {"name": "test"}}
+    )
+    weaviate_mock.expect_request(f"/v1/objects/Test/{obj_uuid}", method="HEAD").respond_with_data(
+        status=204
+    )
+    weaviate_mock.expect_request(f"/v1/objects/Test/{obj_uuid}", method="PATCH").respond_with_data(
+        status=204
+    )
+    weaviate_mock.expect_request(f"/v1/objects/Test/{obj_uuid}", method="DELETE").respond_with_data(
+        status=204
+    )
+    weaviate_mock.expect_request("/v1/objects/Test/" + str(uuid.UUID(int=0))).respond_with_data(
+        status=404
+    )
+
+    queries = []
+
+    def graphql_handler(request: Request):
+        queries.append(request.json["query"])
+        return Response(json.dumps({"data": {"Get": {"Test": [{"name": "test"}]}}}))
+
+    weaviate_mock.expect_request("/v1/graphql").respond_with_handler(graphql_handler)
+
+    async def run():
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            assert await client.is_ready()
+            assert await client.data_object.create({"name": "test"}, "Test", obj_uuid) == obj_uuid
+            obj = await client.data_object.get_by_id(obj_uuid, class_name="Test")
+            assert obj["properties"] == {"name": "test"}
+            assert await client.data_object.exists(obj_uuid, class_name="Test")
+            assert await client.data_object.get_by_id(uuid.UUID(int=0), class_name="Test") is None
+            await client.data_object.update({"name": "new"}, "Test", obj_uuid)
+            await client.data_object.delete(obj_uuid, class_name="Test")
+
+            # many queries share the event loop
+            results = await asyncio.gather(
+                *[client.query.get("Test", ["name"]).with_limit(i + 1).do() for i in range(20)]
+            )
+            assert all(res == {"data": {"Get": {"Test": [{"name": "test"}]}}} for res in results)
+            await client.query.aggregate("Test").with_meta_count().do()
+            await client.query.raw("{Get {Test {name}}}")
+
+    asyncio.run(run())
+    assert len(queries) == 22
+    assert "Aggregate" in queries[20]
+
+
+def test_async_errors(weaviate_mock):
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json(
+        {"error": [{"message": "id already exists"}]}, status=422
+    )
+    weaviate_mock.expect_request("/v1/schema/Test").respond_with_json({}, status=500)
+
+    async def run():
+        client = weaviate.AsyncClient(MOCK_SERVER_URL)
+        await client.connect()
+        with pytest.raises(weaviate.ObjectAlreadyExistsException):
+            await client.data_object.create({"name": "test"}, "Test", uuid.uuid4())
+        with pytest.raises(weaviate.UnexpectedStatusCodeException):
+            await client.schema.exists("Test")
+        await client.close()
+
+        unreachable = weaviate.AsyncClient("http://127.0.0.1:1")
+        with pytest.raises(RequestsConnectionError):
+            await unreachable.connect()
+        await unreachable.close()
+
+    asyncio.run(run())
+
+    with pytest.raises(ValueError):
+        weaviate.AsyncClient(
+            MOCK_SERVER_URL, auth_client_secret=weaviate.AuthClientPassword("user", "pw")
+        )
+
+
+def test_async_schema(weaviate_mock):
+    created = []
+
+    def handler(request: Request):
+        created.append((request.path, request.json))
+        return Response(json.dumps(request.json))
+
+    weaviate_mock.expect_request("/v1/schema", method="POST").respond_with_handler(handler)
+    weaviate_mock.expect_request("/v1/schema/Test/properties").respond_with_handler(handler)
+    weaviate_mock.expect_request("/v1/schema/Test", method="GET").respond_with_json(
+        {"class": "Test"}
+    )
+    weaviate_mock.expect_request("/v1/schema/Test", method="DELETE").respond_with_json({})
+
+    async def run():
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            await client.schema.create_class(
+                {
+                    "class": "Test",
+                    "properties": [
+                        {"name": "name", "dataType": ["text"]},
+                        {"name": "ref", "dataType": ["Test"]},
+                    ],
+                }
+            )
+            assert await client.schema.exists("Test")
+            assert await client.schema.get("Test") == {"class": "Test"}
+            await client.schema.delete_class("Test")
+
+    asyncio.run(run())
+    assert created == [
+        ("/v1/schema", {"class": "Test", "properties": [{"name": "name", "dataType": ["text"]}]}),
+        ("/v1/schema/Test/properties", {"name": "ref", "dataType": ["Test"]}),
+    ]
+
+
+def test_async_batch_concurrency(weaviate_mock):
+    sent_objects = []
+    sent_references = []
+
+    def objects_handler(request: Request):
+        sent_objects.extend(obj["id"] for obj in request.json["objects"])
+        return Response(json.dumps([{**obj, "result": {}} for obj in request.json["objects"]]))
+
+    def references_handler(request: Request):
+        sent_references.extend(request.json)
+        return Response(json.dumps([{**ref, "result": {}} for ref in request.json]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def run():
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            post = client._connection.post
+
+            async def counting_post(*args, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await post(*args, **kwargs)
+                finally:
+                    in_flight -= 1
+
+            client._connection.post = counting_post
+            results = []
+            added = []
+            batch = client.batch.configure(
+                batch_size=10, concurrent_requests=3, callback=results.extend
+            )
+            async with batch:
+                for i in range(95):
+                    added.append(await batch.add_data_object({"i": i}, "test"))
+                    if i % 10 == 0:
+                        await batch.add_reference(added[-1], "test", "ref", added[-1], "test")
+            assert batch.shape == (0, 0)
+            assert len(results) == 95 + 10
+            return added
+
+    added = asyncio.run(run())
+    assert sorted(sent_objects) == sorted(added)
+    assert len(sent_references) == 10
+    assert max_in_flight == 3
+
+
+def test_async_batch_references_wait_for_objects(weaviate_mock):
+    events = []
+
+    def objects_handler(request: Request):
+        time.sleep(0.1)
+        events.extend(("object", obj["id"]) for obj in request.json["objects"])
+        return Response(json.dumps([{**obj, "result": {}} for obj in request.json["objects"]]))
+
+    def references_handler(request: Request):
+        events.extend(("reference", ref["to"].split("/")[-1]) for ref in request.json)
+        return Response(json.dumps([{**ref, "result": {}} for ref in request.json]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    async def run():
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            batch = client.batch.configure(batch_size=5)
+            # the first five objects are in flight, the sixth one is not sent yet
+            added = [await batch.add_data_object({"i": i}, "Test") for i in range(6)]
+            for uuid_ in added[1:]:
+                await batch.add_reference(added[0], "Test", "ref", uuid_, "Test")
+            assert batch.shape == (0, 0)
+            await batch.flush()
+            return added
+
+    added = asyncio.run(run())
+    # the full reference batch is only sent after all objects are created
+    assert events == [("object", uuid_) for uuid_ in added] + [
+        ("reference", uuid_) for uuid_ in added[1:]
+    ]
+
+
+def test_async_batch_error(weaviate_mock):
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json({}, status=500)
+
+    async def run():
+        async with weaviate.AsyncClient(MOCK_SERVER_URL) as client:
+            batch = client.batch.configure(batch_size=5)
+            for i in range(12):
+                await batch.add_data_object({"i": i}, "Test")
+            with pytest.raises(weaviate.UnexpectedStatusCodeException):
+                await batch.flush()
+            # the error is raised once
+            await batch.flush()
+
+    asyncio.run(run())
+
+
+def test_async_query_over_grpc(weaviate_mock):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(SearchServicer(), server)
+    server.add_insecure_port(f"{MOCK_IP}:{MOCK_GRPC_PORT}")
+    server.start()
+
+    async def run():
+        async with weaviate.AsyncClient(
+            MOCK_SERVER_URL,
+            additional_config=weaviate.Config(grpc_port_experimental=MOCK_GRPC_PORT),
+        ) as client:
+            assert client._connection.grpc_stub is not None
+            return await asyncio.gather(
+                *[client.query.get("Test", ["name"]).with_limit(i).do() for i in range(1, 4)]
+            )
+
+    try:
+        results = asyncio.run(run())
+    finally:
+        server.stop(None)
+    assert results[2] == {
+        "data": {"Get": {"Test": [{"name": "Test 0"}, {"name": "Test 1"}, {"name": "Test 2"}]}}
+    }
@@ -1,4 +1,5 @@
 import json
+import time
 from typing import Optional
 
 import pytest
@@ -283,3 +284,102 @@ def test_callback_for_successful_responses(weaviate_mock, capfd):
     # callback output for each object
     print_output, err = capfd.readouterr()
     assert print_output.count("\n") == n
+
+
+def test_delayed_retry(weaviate_mock):
+    """Test that objects with errors are retried in later batches with a backoff."""
+    attempts_per_object = {}
+    mixed_requests = 0
+    always_failing = uuid.uuid4()
+
+    # every object fails in its first request, one object always fails
+    def handler(request: Request):
+        nonlocal mixed_requests
+        objects = request.json["objects"]
+        retried = 0
+        for obj in objects:
+            attempts_per_object[obj["id"]] = attempts_per_object.get(obj["id"], 0) + 1
+            if attempts_per_object[obj["id"]] == 1 or obj["id"] == str(always_failing):
+                obj["result"] = {"errors": {"error": [{"message": "I'm an error message"}]}}
+            else:
+                obj["result"] = {}
+                retried += 1
+        if 0 < retried < len(objects):
+            mixed_requests += 1
+        return Response(json.dumps(objects))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    results = []
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=10,
+        dynamic=False,
+        callback=results.extend,
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=2, backoff=0.01),
+    )
+    with client.batch as batch:
+        batch.add_data_object({"name": "fail"}, "test", always_failing)
+        for i in range(99):
+            batch.add_data_object({"name": "test" + str(i)}, "test", uuid.uuid4())
+            if i % 10 == 0:
+                time.sleep(0.02)
+        assert batch.stats.delayed_retries > 0
+
+    assert len(results) == 100
+    attempts = {result["id"]: result["attempts"] for result in results}
+    assert attempts.pop(str(always_failing)) == 3
+    assert attempts_per_object[str(always_failing)] == 3
+    assert set(attempts.values()) == {2}
+    # retried objects are sent together with new ones
+    assert mixed_requests > 0
+    assert client.batch.stats.delayed_retries == 0
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_delayed_retry_holds_back_references(weaviate_mock, streaming):
+    """Test that references are sent after the delayed retries of their objects are done."""
+    attempts_per_object = {}
+    attempts_at_reference = {}
+    retried, always_failing, target = (str(uuid.uuid4()) for _ in range(3))
+
+    def objects_handler(request: Request):
+        objects = request.json["objects"]
+        for obj in objects:
+            attempts_per_object[obj["id"]] = attempts_per_object.get(obj["id"], 0) + 1
+            if attempts_per_object[obj["id"]] == 1 or obj["id"] == always_failing:
+                obj["result"] = {"errors": {"error": [{"message": "I'm an error message"}]}}
+            else:
+                obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    def references_handler(request: Request):
+        references = request.json
+        for reference in references:
+            from_uuid = reference["from"].rsplit("/", 2)[-2]
+            attempts_at_reference[from_uuid] = attempts_per_object.get(from_uuid, 0)
+            reference["result"] = {}
+        return Response(json.dumps(references))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=3,
+        dynamic=False,
+        streaming=streaming,
+        callback=None,
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=2, backoff=0.1),
+    )
+    with client.batch as batch:
+        batch.add_data_object({"name": "retried"}, "Test", retried)
+        batch.add_data_object({"name": "always failing"}, "Test", always_failing)
+        batch.add_data_object({"name": "target"}, "Test", target)
+        batch.add_reference(retried, "Test", "ref", target, "Test")
+        batch.add_reference(always_failing, "Test", "ref", target, "Test")
+
+    # the references are sent after the successful retry and after the last failed attempt
+    assert attempts_at_reference == {retried: 2, always_failing: 3}
+    assert len(client.batch._retrying_objects) == 0
+    client.batch.shutdown()
@@ -0,0 +1,86 @@
+import json
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _table(num_rows: int):
+    return pa.table(
+        {
+            "name": [f"name{i}" for i in range(num_rows)],
+            "count": list(range(num_rows)),
+            "id": [str(uuid.UUID(int=i)) for i in range(num_rows)],
+            "vector": pa.array(
+                [[float(i), 0.5] for i in range(num_rows)], type=pa.list_(pa.float32(), 2)
+            ),
+        }
+    )
+
+
+@pytest.fixture
+def batch_objects(weaviate_mock):
+    objects = []
+
+    def handler(request: Request):
+        objects.extend(request.json["objects"])
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+    return objects
+
+
+def test_import_arrow(batch_objects):
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=4, dynamic=False)
+    with client.batch as batch:
+        num_objects = batch.import_arrow(
+            _table(10).to_batches(max_chunksize=3), "Test", vector_column="vector", id_column="id"
+        )
+
+    assert num_objects == 10
+    assert len(batch_objects) == 10
+    assert batch_objects[3] == {
+        "class": "Test",
+        "properties": {"name": "name3", "count": 3},
+        "vector": [3.0, 0.5],
+        "id": str(uuid.UUID(int=3)),
+    }
+
+
+def test_import_single_record_batch(batch_objects):
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=4, dynamic=False)
+    with client.batch as batch:
+        num_objects = batch.import_arrow(_table(5).to_batches()[0], "Test", id_column="id")
+
+    assert num_objects == 5
+    assert [obj["properties"]["name"] for obj in batch_objects] == [f"name{i}" for i in range(5)]
+
+
+def test_import_parquet(batch_objects, tmp_path):
+    path = str(tmp_path / "data.parquet")
+    pq.write_table(_table(25), path)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=10, dynamic=False)
+    with client.batch as batch:
+        num_objects = batch.import_parquet(
+            path, "Test", vector_column="vector", properties=["name"], rows_per_read=7
+        )
+
+    assert num_objects == 25
+    assert [obj["properties"] for obj in batch_objects] == [{"name": f"name{i}"} for i in range(25)]
+    assert all(len(obj["vector"]) == 2 for obj in batch_objects)
+
+
+def test_import_arrow_unknown_column(batch_objects):
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    with pytest.raises(ValueError):
+        client.batch.import_arrow(_table(2), "Test", vector_column="embedding")
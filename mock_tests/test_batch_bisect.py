@@ -0,0 +1,93 @@
+import json
+import time
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.exceptions import UnexpectedStatusCodeException
+
+
+def test_bisect_isolates_poison_objects(weaviate_mock):
+    added = []
+    request_sizes = []
+
+    # weaviate fails for the whole batch if it contains a poison object
+    def handler(request: Request):
+        objects = request.json["objects"]
+        request_sizes.append(len(objects))
+        if any(obj["properties"]["poison"] for obj in objects):
+            return Response(json.dumps({"error": [{"message": "vectorizer failed"}]}), status=500)
+        added.extend(obj["id"] for obj in objects)
+        for obj in objects:
+            obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    results = []
+    poison = [str(uuid.uuid4()), str(uuid.uuid4())]
+    healthy = []
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=16, dynamic=False, callback=results.extend, min_bisect_size=1)
+    with client.batch as batch:
+        for i in range(48):
+            if i in (5, 30):
+                batch.add_data_object({"poison": True}, "Test", poison.pop())
+            else:
+                healthy.append(batch.add_data_object({"poison": False}, "Test"))
+
+    assert sorted(added) == sorted(healthy)
+    failed = [result for result in results if "errors" in result["result"]]
+    assert len(failed) == 2
+    assert all(result["properties"]["poison"] for result in failed)
+    assert "500" in failed[0]["result"]["errors"]["error"][0]["message"]
+    assert client.batch.stats.isolated_items == 2
+    # the batch without a poison object is sent only once
+    assert request_sizes.count(16) == 3
+    assert request_sizes.count(1) == 4  # the poison objects and their neighbours
+
+
+def test_bisect_does_not_split_on_client_errors(weaviate_mock):
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json({}, status=422)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=None, dynamic=False, min_bisect_size=1)
+    for _ in range(4):
+        client.batch.add_data_object({"name": "test"}, "Test")
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.batch.flush()
+
+
+def test_bisect_splits_timed_out_batches(weaviate_no_auth_mock):
+    added = []
+
+    # weaviate does not answer in time if the batch contains a poison object
+    def handler(request: Request):
+        objects = request.json["objects"]
+        if any(obj["properties"]["poison"] for obj in objects):
+            time.sleep(1.2)
+            return Response(json.dumps([]))
+        added.extend(obj["id"] for obj in objects)
+        return Response(json.dumps([{**obj, "result": {}} for obj in objects]))
+
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    results = []
+    client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(1, 1))
+    client.batch.configure(batch_size=4, dynamic=False, callback=results.extend, min_bisect_size=1)
+    healthy = [client.batch.add_data_object({"poison": False}, "Test") for _ in range(3)]
+    client.batch.add_data_object({"poison": True}, "Test")
+    client.batch.flush()
+
+    assert sorted(added) == sorted(healthy)
+    failed = [result for result in results if "errors" in result["result"]]
+    assert len(failed) == 1 and failed[0]["properties"]["poison"]
+    assert client.batch.stats.isolated_items == 1
+    assert client.batch.stats.timeout_retries == 0
+    # the objects are not read to check if the timed out batches created them
+    assert not any(
+        request.path.startswith("/v1/objects") for request, _ in weaviate_no_auth_mock.log
+    )
@@ -0,0 +1,39 @@
+import json
+import time
+
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+
+def test_max_buffered_bytes(weaviate_mock):
+    num_objects = []
+
+    def handler(request: Request):
+        time.sleep(0.02)  # slow server
+        num_objects.append(len(request.json["objects"]))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=10,
+        dynamic=False,
+        streaming=True,
+        max_queued_batches=100,
+        max_buffered_bytes=25_000,
+    )
+    peak = 0
+    with client.batch as batch:
+        for _ in range(200):
+            batch.add_data_object({"text": "a" * 1000}, "Test")
+            peak = max(peak, batch.buffered_bytes)
+        assert batch.stats.buffered_bytes > 0
+
+    assert sum(num_objects) == 200
+    # the producer blocks once the limit is exceeded by at most one object
+    assert 20_000 < peak <= 25_000 + 1100
+    assert client.batch.buffered_bytes == 0
+    assert client.batch.stats.buffered_bytes == 0
@@ -0,0 +1,31 @@
+import json
+
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+
+def test_max_batch_bytes(weaviate_mock):
+    body_sizes = []
+    num_objects = []
+
+    def handler(request: Request):
+        body_sizes.append(len(request.get_data()))
+        num_objects.append(len(request.json["objects"]))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=100, dynamic=False, max_batch_bytes=10_000)
+    with client.batch as batch:
+        # flushed by size long before 100 objects are reached
+        for _ in range(20):
+            batch.add_data_object({"text": "a" * 1000}, "Test")
+        # a columnar add of 10 large objects is split before sending
+        batch.add_data_objects("Test", properties={"text": ["b" * 3000] * 10})
+
+    assert sum(num_objects) == 30
+    assert all(size <= 10_000 for size in body_sizes)
+    assert num_objects[:2] == [9, 9]
@@ -0,0 +1,29 @@
+import json
+
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+
+def test_add_data_objects_is_split_into_batches(weaviate_mock):
+    batch_sizes = []
+
+    def handler(request: Request):
+        batch_sizes.append(len(request.json["objects"]))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=4, dynamic=False)
+    with client.batch as batch:
+        batch.add_data_object({"name": "single"}, "Test")
+        uuids = batch.add_data_objects(
+            "test",
+            properties={"name": [f"name{i}" for i in range(10)]},
+            vectors=[[float(i), float(i)] for i in range(10)],
+        )
+
+    assert len(uuids) == 10
+    assert batch_sizes == [4, 4, 3]
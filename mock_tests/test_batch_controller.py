@@ -0,0 +1,58 @@
+import json
+import time
+
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.batch import AIMDBatchSizeController
+
+
+def test_controller_converges_to_target_latency(weaviate_mock):
+    batch_sizes = []
+
+    def handler(request: Request):
+        batch_sizes.append(len(request.json["objects"]))
+        time.sleep(0.002 * batch_sizes[-1])  # latency grows with the batch size
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    controller = AIMDBatchSizeController(
+        target_latency=0.1, additive_increase=10, max_num_workers=1, window=2
+    )
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=10, dynamic=True, batch_size_controller=controller)
+    with client.batch as batch:
+        for i in range(1500):
+            batch.add_data_object({"name": str(i)}, "Test")
+
+    assert sum(batch_sizes) == 1500
+    assert batch_sizes[0] == 10
+    # batches of more than 50 objects take longer than the target latency
+    assert max(batch_sizes) <= 60
+    assert len(controller.history) > 0
+    assert all(sample.batch_size <= 60 for sample in controller.history)
+    assert any(sample.latency is not None and sample.latency > 0.1 for sample in controller.history)
+
+
+def test_adapted_num_workers_keep_configured_value(weaviate_mock):
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+
+    controller = AIMDBatchSizeController(
+        additive_increase=10, max_batch_size=10, max_num_workers=3, window=1
+    )
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=10, dynamic=True, batch_size_controller=controller)
+    for i in range(200):
+        client.batch.add_data_object({"name": str(i)}, "Test")
+    client.batch.flush()
+    assert client.batch._active_num_workers == 3
+    assert client.batch._num_workers == 1
+
+    # configuring the same number of workers again does not restart the BatchExecutor
+    executor = client.batch._executor
+    client.batch.configure(batch_size=10, dynamic=True, batch_size_controller=controller)
+    assert client.batch._executor is executor
+    assert not executor.is_shutdown()
+    client.batch.shutdown()
@@ -0,0 +1,120 @@
+import concurrent.futures
+import json
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.batch.crud_batch import WeaviateErrorRetryConf
+from weaviate.exceptions import BatchItemFailedException, UnexpectedStatusCodeException
+
+
+@pytest.mark.parametrize("backoff", [None, 0.01])
+def test_item_futures(weaviate_mock, backoff):
+    attempts = {}
+
+    # objects with "fail" always fail, objects with "flaky" fail once
+    def objects_handler(request: Request):
+        objects = request.json["objects"]
+        for obj in objects:
+            attempts[obj["id"]] = attempts.get(obj["id"], 0) + 1
+            if obj["properties"]["fail"] or (
+                obj["properties"]["flaky"] and attempts[obj["id"]] == 1
+            ):
+                obj["result"] = {"errors": {"error": [{"message": "invalid object"}]}}
+            else:
+                obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    def references_handler(request: Request):
+        references = request.json
+        for reference in references:
+            reference["result"] = {}
+        return Response(json.dumps(references))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=4,
+        dynamic=False,
+        num_workers=2,
+        callback=None,
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=2, backoff=backoff),
+    )
+    uuids = [str(uuid.uuid4()) for _ in range(10)]
+    futures = []
+    with client.batch as batch:
+        for i in range(10):
+            futures.append(
+                batch.add_data_object_future({"fail": i == 3, "flaky": i == 7}, "Test", uuids[i])
+            )
+        ref_future = batch.add_reference_future(uuids[0], "Test", "ref", uuids[1], "Test")
+
+    for i, future in enumerate(futures):
+        assert future.done()
+        if i == 3:
+            with pytest.raises(BatchItemFailedException, match="invalid object"):
+                future.result()
+            assert future.exception().item["id"] == uuids[3]
+        else:
+            assert future.result()["id"] == uuids[i]
+            assert future.result()["result"] == {}
+            assert future.exception() is None
+    assert ref_future.result(timeout=1)["from"].endswith("/ref")
+    assert len(client.batch._objects_batch._futures) == 0
+
+    callback_calls = []
+    futures[0].add_done_callback(callback_calls.append)
+    assert callback_calls == [futures[0]]
+
+
+def test_item_futures_failed_request(weaviate_mock):
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json({}, status=422)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=None, dynamic=False)
+    future = client.batch.add_data_object_future({"name": "test"}, "Test")
+    assert not future.done()
+    with pytest.raises(concurrent.futures.TimeoutError):
+        future.result(timeout=0.01)
+
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.batch.flush()
+    assert isinstance(future.exception(), UnexpectedStatusCodeException)
+
+
+def test_item_futures_same_uuid_in_two_batches(weaviate_mock):
+    # the first version of the object always fails, the second one is written
+    def objects_handler(request: Request):
+        objects = request.json["objects"]
+        for obj in objects:
+            if obj["properties"]["version"] == 1:
+                obj["result"] = {"errors": {"error": [{"message": "invalid object"}]}}
+            else:
+                obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=1,
+        dynamic=False,
+        callback=None,
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=1, backoff=0.05),
+    )
+    obj_uuid = str(uuid.uuid4())
+    with client.batch as batch:
+        first = batch.add_data_object_future({"version": 1}, "Test", obj_uuid)
+        # the first version waits for its retry while the second one is sent
+        second = batch.add_data_object_future({"version": 2}, "Test", obj_uuid)
+        assert second.result(timeout=1)["properties"] == {"version": 2}
+        assert not first.done()
+
+    with pytest.raises(BatchItemFailedException):
+        first.result(timeout=1)
+    assert first.exception().item["properties"] == {"version": 1}
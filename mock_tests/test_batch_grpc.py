@@ -0,0 +1,169 @@
+import json
+import time
+import uuid
+from concurrent import futures
+
+import grpc
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL, MOCK_IP
+from requests.exceptions import ReadTimeout
+
+from weaviate.proto.v1 import batch_pb2, weaviate_pb2_grpc
+
+MOCK_GRPC_PORT = 23537
+
+
+class BatchServicer(weaviate_pb2_grpc.WeaviateServicer):
+    def __init__(self, implemented: bool = True, delay: float = 0):
+        self.implemented = implemented
+        self.delay = delay
+        self.requests = []
+
+    def BatchObjects(self, request, context):
+        if not self.implemented:
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, "method BatchObjects not implemented")
+        time.sleep(self.delay)
+        self.requests.append(request)
+        errors = [
+            batch_pb2.BatchObjectsReply.BatchError(index=i, error="invalid object")
+            for i, obj in enumerate(request.objects)
+            if obj.properties.non_ref_properties["name"] == "invalid"
+        ]
+        return batch_pb2.BatchObjectsReply(took=0.1, errors=errors)
+
+
+def start_grpc_server(servicer: BatchServicer) -> grpc.Server:
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    weaviate_pb2_grpc.add_WeaviateServicer_to_server(servicer, server)
+    server.add_insecure_port(f"{MOCK_IP}:{MOCK_GRPC_PORT}")
+    server.start()
+    return server
+
+
+@pytest.fixture(scope="function")
+def grpc_servicer():
+    servicer = BatchServicer()
+    server = start_grpc_server(servicer)
+    yield servicer
+    server.stop(None)
+
+
+def test_batch_objects_over_grpc(weaviate_mock, grpc_servicer):
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(grpc_port_experimental=MOCK_GRPC_PORT),
+    )
+    assert client._connection.grpc_stub is not None
+
+    results = []
+    client.batch.configure(batch_size=10, dynamic=False, callback=results.extend)
+    with client.batch as batch:
+        batch.add_data_object({"name": "valid", "tags": ["a", "b"]}, "Test", vector=[1.0, 2.0])
+        batch.add_data_object({"name": "invalid", "counts": [1, 2]}, "Test")
+
+    assert len(grpc_servicer.requests) == 1
+    objects = grpc_servicer.requests[0].objects
+    assert list(objects[0].vector) == [1.0, 2.0]
+    assert objects[0].collection == "Test"
+    assert list(objects[0].properties.text_array_properties[0].values) == ["a", "b"]
+    assert list(objects[1].properties.int_array_properties[0].values) == [1, 2]
+
+    assert len(results) == 2
+    assert results[0]["result"] == {}
+    assert results[1]["result"]["errors"]["error"][0]["message"] == "invalid object"
+
+
+@pytest.mark.parametrize(
+    "properties",
+    [
+        {"nested": {"name": "test"}},
+        # would lose precision as a double
+        {"count": 2**53 + 1},
+        {"numbers": [0.5, -(2**53) - 1]},
+        # does not fit int64
+        {"counts": [1, 2**63]},
+    ],
+)
+def test_batch_objects_grpc_unsupported_properties_use_rest(
+    weaviate_mock, grpc_servicer, properties
+):
+    rest_requests = []
+
+    def handler(request: Request):
+        rest_requests.append(request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=weaviate.Config(grpc_port_experimental=MOCK_GRPC_PORT),
+    )
+    client.batch.configure(batch_size=10, dynamic=False)
+    with client.batch as batch:
+        batch.add_data_object(properties, "Test", uuid.uuid4())
+
+    assert len(grpc_servicer.requests) == 0
+    assert len(rest_requests) == 1
+    assert rest_requests[0]["objects"][0]["properties"] == properties
+
+
+def test_batch_objects_grpc_unimplemented_falls_back_to_rest(recwarn, weaviate_mock):
+    rest_requests = []
+
+    def handler(request: Request):
+        rest_requests.append(request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    servicer = BatchServicer(implemented=False)
+    server = start_grpc_server(servicer)
+    try:
+        client = weaviate.Client(
+            url=MOCK_SERVER_URL,
+            additional_config=weaviate.Config(grpc_port_experimental=MOCK_GRPC_PORT),
+        )
+        client.batch.configure(batch_size=1, dynamic=False, num_workers=2)
+        with client.batch as batch:
+            for _ in range(4):
+                batch.add_data_object({"name": "test"}, "Test")
+    finally:
+        server.stop(None)
+
+    assert len(rest_requests) == 4
+    assert client.batch._grpc_batching is False
+    assert len([w for w in recwarn if str(w.message).startswith("Bat001")]) == 1
+
+
+def test_batch_objects_grpc_deadline_is_a_timeout(recwarn, weaviate_mock):
+    rest_requests = []
+
+    def handler(request: Request):
+        rest_requests.append(request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    servicer = BatchServicer(delay=1.5)
+    server = start_grpc_server(servicer)
+    try:
+        client = weaviate.Client(
+            url=MOCK_SERVER_URL,
+            timeout_config=(1, 1),
+            additional_config=weaviate.Config(grpc_port_experimental=MOCK_GRPC_PORT),
+        )
+        client.batch.configure(batch_size=10, dynamic=False, timeout_retries=0)
+        client.batch.add_data_object({"name": "test"}, "Test")
+        with pytest.raises(ReadTimeout):
+            client.batch.flush()
+    finally:
+        server.stop(None)
+
+    # the batch is not sent over REST again
+    assert rest_requests == []
+    assert client.batch._grpc_batching is True
+    assert not any(str(w.message).startswith("Bat001") for w in recwarn)
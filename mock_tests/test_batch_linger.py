@@ -0,0 +1,36 @@
+import json
+import time
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_max_linger_ms(weaviate_mock, streaming):
+    received = []
+
+    def handler(request: Request):
+        received.append((time.monotonic(), len(request.json["objects"])))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=100, dynamic=False, streaming=streaming, max_linger_ms=50)
+    with client.batch as batch:
+        # full batches are sent right away
+        for i in range(200):
+            batch.add_data_object({"name": "test" + str(i)}, "Test")
+        # a partial batch is sent once it waited max_linger_ms
+        added_at = time.monotonic()
+        for i in range(3):
+            batch.add_data_object({"name": "test" + str(i)}, "Test")
+        time.sleep(0.5)
+        assert [num_objects for _, num_objects in received] == [100, 100, 3]
+        assert 0.05 <= received[-1][0] - added_at < 0.4
+        assert batch.shape == (0, 0)
+
+    assert sum(num_objects for _, num_objects in received) == 203
@@ -0,0 +1,56 @@
+import json
+
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate import WeaviateErrorRetryConf
+
+
+def test_batch_metrics(weaviate_mock):
+    first_attempt = True
+
+    # the first object of the first request fails once
+    def handler(request: Request):
+        nonlocal first_attempt
+        objects = request.json["objects"]
+        for obj in objects:
+            obj["result"] = {}
+        if first_attempt:
+            objects[0]["result"] = {"errors": {"error": [{"message": "transient error"}]}}
+            first_attempt = False
+        return Response(json.dumps(objects))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    metrics = []
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=5,
+        dynamic=False,
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=1),
+        metrics_callback=metrics.append,
+    )
+    with client.batch as batch:
+        for i in range(10):
+            batch.add_data_object({"name": f"name{i}"}, "Test")
+
+    assert len(metrics) == 2
+    assert [m.num_items for m in metrics] == [5, 5]
+    assert [m.error_retries for m in metrics] == [1, 0]
+    for m in metrics:
+        assert m.data_type == "objects"
+        assert m.num_bytes > 0
+        assert m.serialization_time > 0
+        assert m.request_time >= m.elapsed > 0
+        assert m.decode_time > 0
+        assert m.callback_time > 0
+        assert m.timeout_retries == m.connection_error_retries == 0
+
+    stats = client.batch.stats
+    assert stats.num_requests == 2
+    assert stats.num_items == 10
+    assert stats.error_retries == 1
+    assert stats.timeout_retries == stats.connection_error_retries == 0
+    assert stats.queue_depth == 0
+    assert stats.recommended_num_objects == client.batch.recommended_num_objects
@@ -0,0 +1,122 @@
+import json
+import os
+import time
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.batch import import_with_processes
+
+
+def to_objects(line: str):
+    if line == "broken":
+        raise ValueError("cannot parse line")
+    index = int(line)
+    obj_uuid = str(uuid.UUID(int=index))
+    yield {"data_object": {"index": index}, "class_name": "Test", "uuid": obj_uuid}
+    if index % 10 == 0:
+        yield {
+            "from_object_uuid": obj_uuid,
+            "from_object_class_name": "Test",
+            "from_property_name": "ref",
+            "to_object_uuid": obj_uuid,
+            "to_object_class_name": "Test",
+        }
+
+
+def test_import_with_processes(weaviate_mock):
+    object_indices = []
+    num_references = 0
+
+    def objects_handler(request: Request):
+        objects = request.json["objects"]
+        for obj in objects:
+            object_indices.append(obj["properties"]["index"])
+            if obj["properties"]["index"] == 13:
+                obj["result"] = {"errors": {"error": [{"message": "invalid object"}]}}
+            else:
+                obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    def references_handler(request: Request):
+        nonlocal num_references
+        num_references += len(request.json)
+        return Response(json.dumps([{**ref, "result": {}} for ref in request.json]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    progress = []
+    lines = [str(i) for i in range(50)] + ["broken"]
+    result = import_with_processes(
+        lines,
+        to_objects,
+        client_kwargs={"url": MOCK_SERVER_URL},
+        batch_kwargs={"batch_size": 8, "dynamic": False},
+        num_processes=2,
+        chunk_size=5,
+        progress_callback=lambda done, added: progress.append((done, added)),
+    )
+
+    assert sorted(object_indices) == list(range(50))
+    assert num_references == 5
+    assert result.num_items == 55
+    assert [item["properties"]["index"] for item in result.failed_items] == [13]
+    assert len(result.failed_tasks) == 1
+    chunk, error = result.failed_tasks[0]
+    assert chunk == ["broken"] and isinstance(error, ValueError)
+    assert progress[-1] == (51, 55)
+
+
+def test_import_with_processes_spool(weaviate_mock, tmp_path):
+    object_indices = []
+    spool_entries = set()
+
+    def objects_handler(request: Request):
+        object_indices.extend(obj["properties"]["index"] for obj in request.json["objects"])
+        spool_entries.update(os.listdir(tmp_path))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_json([])
+
+    result = import_with_processes(
+        [str(i) for i in range(1, 40)],
+        to_objects,
+        client_kwargs={"url": MOCK_SERVER_URL},
+        batch_kwargs={"batch_size": 4, "dynamic": False, "spool_dir": str(tmp_path)},
+        num_processes=2,
+        chunk_size=3,
+    )
+
+    assert result.failed_tasks == []
+    assert sorted(object_indices) == list(range(1, 40))
+    # every worker has its own spool directory
+    assert len(spool_entries) > 0 and all(name.isdigit() for name in spool_entries)
+    # all segments were acknowledged, the directories of the workers are removed
+    assert os.listdir(tmp_path) == []
+
+
+def test_import_with_processes_rate_limit(weaviate_mock):
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_json([])
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_json([])
+
+    start = time.time()
+    result = import_with_processes(
+        [str(i) for i in range(1, 40)],
+        to_objects,
+        client_kwargs={"url": MOCK_SERVER_URL},
+        batch_kwargs={"batch_size": 5, "dynamic": False},
+        num_processes=3,
+        chunk_size=4,
+        max_items_per_second=100,
+    )
+    assert result.num_items == 42
+    assert result.failed_tasks == []
+    # the limit holds for all processes together
+    assert time.time() - start > 0.3
+
+    with pytest.raises(ValueError):
+        import_with_processes([], to_objects, {"url": MOCK_SERVER_URL}, chunk_size=0)
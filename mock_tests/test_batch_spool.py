@@ -0,0 +1,177 @@
+import json
+import os
+import time
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.batch.crud_batch import WeaviateErrorRetryConf
+
+
+def test_resume_after_crash(weaviate_mock, tmp_path):
+    object_ids = []
+    references = []
+
+    def objects_handler(request: Request):
+        object_ids.extend(obj["id"] for obj in request.json["objects"])
+        return Response(json.dumps([]))
+
+    def references_handler(request: Request):
+        references.extend(request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    uuids = [str(uuid.uuid4()) for _ in range(12)]
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=5, dynamic=False, spool_dir=str(tmp_path))
+    for i in range(12):
+        client.batch.add_data_object({"index": i}, "Test", uuid=uuids[i])
+    client.batch.add_reference(uuids[10], "Test", "ref", uuids[11], "Test", tenant="tenantA")
+    # the process crashes before the last two objects and the reference are sent
+    assert object_ids == uuids[:10]
+    assert len(os.listdir(tmp_path)) == 1
+
+    object_ids.clear()
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    with pytest.warns(UserWarning, match="Bat002"):
+        client.batch.configure(batch_size=5, dynamic=False, spool_dir=str(tmp_path))
+    assert client.batch.resume(str(tmp_path)) == 3
+
+    assert object_ids == uuids[10:]
+    assert references == [
+        {
+            "from": f"weaviate://localhost/Test/{uuids[10]}/ref",
+            "to": f"weaviate://localhost/Test/{uuids[11]}",
+            "tenant": "tenantA",
+        }
+    ]
+    assert os.listdir(tmp_path) == []
+    assert client.batch.resume(str(tmp_path)) == 0
+    with pytest.raises(ValueError):
+        client.batch.resume(str(tmp_path / "other"))
+
+
+def test_resume_after_crash_during_backoff(weaviate_mock, tmp_path):
+    object_ids = []
+    overloaded = True
+
+    # the first object fails with a retryable error while weaviate is overloaded
+    def objects_handler(request: Request):
+        objects = request.json["objects"]
+        object_ids.extend(obj["id"] for obj in objects)
+        for obj in objects:
+            if overloaded and obj["properties"]["index"] == 0:
+                obj["result"] = {"errors": {"error": [{"message": "overloaded"}]}}
+            else:
+                obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+
+    uuids = [str(uuid.uuid4()) for _ in range(2)]
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=2,
+        dynamic=False,
+        spool_dir=str(tmp_path),
+        weaviate_error_retries=WeaviateErrorRetryConf(number_retries=3, backoff=60),
+    )
+    for i in range(2):
+        client.batch.add_data_object({"index": i}, "Test", uuid=uuids[i])
+    # the process crashes while the first object waits for its retry
+    assert object_ids == uuids
+    assert client.batch.stats.delayed_retries == 1
+    assert len(os.listdir(tmp_path)) == 1
+
+    object_ids.clear()
+    overloaded = False
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    with pytest.warns(UserWarning, match="Bat002"):
+        client.batch.configure(batch_size=2, dynamic=False, spool_dir=str(tmp_path))
+    assert client.batch.resume(str(tmp_path)) == 2
+    assert object_ids == uuids
+    assert os.listdir(tmp_path) == []
+
+
+def test_spill_to_disk(weaviate_mock, tmp_path):
+    object_ids = []
+
+    def handler(request: Request):
+        time.sleep(0.05)  # slow server
+        object_ids.extend(obj["id"] for obj in request.json["objects"])
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=10,
+        dynamic=False,
+        streaming=True,
+        max_queued_batches=100,
+        max_buffered_bytes=25_000,
+        spool_dir=str(tmp_path),
+    )
+    uuids = []
+    peak = 0
+    max_segments = 0
+    with client.batch as batch:
+        start = time.time()
+        for _ in range(200):
+            uuids.append(batch.add_data_object({"text": "a" * 1000}, "Test"))
+            peak = max(peak, batch.buffered_bytes)
+            max_segments = max(max_segments, len(os.listdir(tmp_path)))
+        # adding does not wait for the slow server
+        assert time.time() - start < 0.05 * 20 / 2
+
+    assert object_ids == uuids
+    # plus the current batch of 10 objects
+    assert peak <= 25_000 + 11_000
+    assert max_segments > 5
+    assert os.listdir(tmp_path) == []
+
+
+def test_manual_batching_acknowledges_segments(weaviate_mock, tmp_path):
+    object_ids = []
+    references = []
+
+    def objects_handler(request: Request):
+        object_ids.extend(obj["id"] for obj in request.json["objects"])
+        return Response(json.dumps([]))
+
+    def references_handler(request: Request):
+        references.extend(request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    uuids = [str(uuid.uuid4()) for _ in range(3)]
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=None, dynamic=False, spool_dir=str(tmp_path))
+    for i in range(3):
+        client.batch.add_data_object({"index": i}, "Test", uuid=uuids[i])
+    client.batch.create_objects()
+    assert object_ids == uuids
+    assert os.listdir(tmp_path) == []
+
+    # the references of a segment are kept in it until they are created
+    client.batch.add_data_object({"index": 3}, "Test", uuid=uuids[0])
+    client.batch.add_reference(uuids[0], "Test", "ref", uuids[1], "Test")
+    client.batch.create_objects()
+    assert len(os.listdir(tmp_path)) == 1
+    client.batch.add_reference(uuids[0], "Test", "ref", uuids[2], "Test")
+    client.batch.create_references()
+    assert len(references) == 2
+    assert os.listdir(tmp_path) == []
+
+    object_ids.clear()
+    references.clear()
+    assert client.batch.resume(str(tmp_path)) == 0
+    assert object_ids == []
+    assert references == []
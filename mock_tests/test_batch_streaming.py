@@ -0,0 +1,72 @@
+import json
+import time
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate.exceptions import UnexpectedStatusCodeException
+
+
+def test_streaming_add_does_not_wait_for_in_flight_requests(weaviate_mock):
+    def handler(request: Request):
+        time.sleep(0.5)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(
+        batch_size=1, dynamic=False, num_workers=2, streaming=True, max_queued_batches=4
+    )
+    with client.batch as batch:
+        start = time.time()
+        for _ in range(4):
+            batch.add_data_object({"name": "test"}, "Test")
+        assert time.time() - start < 0.4
+    # leaving the context manager waits for all requests
+    assert time.time() - start > 0.9
+    assert client.batch.shape == (0, 0)
+
+
+def test_streaming_references_wait_for_objects(weaviate_mock):
+    requests_log = []
+
+    def objects_handler(request: Request):
+        time.sleep(0.2)
+        requests_log.extend(("object", obj["id"]) for obj in request.json["objects"])
+        return Response(json.dumps([]))
+
+    def references_handler(request: Request):
+        requests_log.extend(("reference", ref["from"].split("/")[-2]) for ref in request.json)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=2, dynamic=False, num_workers=2, streaming=True)
+    with client.batch as batch:
+        for _ in range(5):
+            from_uuid = batch.add_data_object({"name": "test"}, "Test")
+            batch.add_reference(from_uuid, "Test", "ref", str(uuid.uuid4()), "Test")
+
+    assert len(requests_log) == 10
+    for i, (kind, ref_uuid) in enumerate(requests_log):
+        if kind == "reference":
+            assert ("object", ref_uuid) in requests_log[:i]
+
+
+def test_streaming_errors_are_raised_on_flush(weaviate_mock):
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_response(
+        Response("error", status=500)
+    )
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=5, dynamic=False, streaming=True)
+    client.batch.add_data_object({"name": "test"}, "Test")
+    with pytest.raises(UnexpectedStatusCodeException):
+        client.batch.flush()
+    client.batch.shutdown()
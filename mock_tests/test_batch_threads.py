@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from collections import Counter
+from uuid import uuid4
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+
+NUM_THREADS = 8
+NUM_OBJECTS = 250
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"dynamic": False, "num_workers": 2},
+        {"dynamic": True, "num_workers": 2, "max_linger_ms": 5},
+        {"dynamic": False, "num_workers": 2, "streaming": True, "max_buffered_bytes": 20_000},
+        {"dynamic": True, "num_workers": 4, "streaming": True, "futures": True},
+    ],
+)
+def test_shared_batch_stress(weaviate_mock, config):
+    sent_objects = Counter()
+    sent_references = Counter()
+
+    def objects_handler(request: Request):
+        objects = request.json["objects"]
+        sent_objects.update(obj["id"] for obj in objects)
+        for obj in objects:
+            obj["result"] = {}
+        return Response(json.dumps(objects))
+
+    def references_handler(request: Request):
+        references = request.json
+        sent_references.update(ref["from"] for ref in references)
+        for ref in references:
+            ref["result"] = {}
+        return Response(json.dumps(references))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+    weaviate_mock.expect_request("/v1/batch/references").respond_with_handler(references_handler)
+
+    config = dict(config)
+    use_futures = config.pop("futures", False)
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=20, **config)
+    add_data_object = (
+        client.batch.add_data_object_future if use_futures else client.batch.add_data_object
+    )
+
+    barrier = threading.Barrier(NUM_THREADS)
+    added = [[] for _ in range(NUM_THREADS)]
+    errors = []
+
+    def produce(index: int):
+        try:
+            barrier.wait()
+            for i in range(NUM_OBJECTS):
+                uuid = str(uuid4())
+                added[index].append(add_data_object({"i": i}, "Test", uuid))
+                if i % 5 == 0:
+                    client.batch.add_reference(uuid, "Test", "ref", uuid, "Test")
+        except Exception as error:  # pragma: no cover - reported below
+            errors.append(error)
+
+    threads = [threading.Thread(target=produce, args=(i,)) for i in range(NUM_THREADS)]
+    with client.batch:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert errors == []
+    all_added = [
+        result if isinstance(result, str) else result.result(timeout=0)["id"]
+        for results in added
+        for result in results
+    ]
+    assert len(set(all_added)) == NUM_THREADS * NUM_OBJECTS
+    # every object and reference is sent exactly once
+    assert sent_objects == Counter(all_added)
+    assert len(sent_references) == NUM_THREADS * NUM_OBJECTS // 5
+    assert all(count == 1 for count in sent_references.values())
+    assert client.batch.shape == (0, 0)
+    assert client.batch.stats.num_items == NUM_THREADS * NUM_OBJECTS * 6 // 5
+
+
+def test_adding_does_not_wait_for_sent_batches(weaviate_mock):
+    request_arrived = threading.Event()
+
+    def objects_handler(request: Request):
+        request_arrived.set()
+        time.sleep(1)
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(objects_handler)
+
+    client = weaviate.Client(url=MOCK_SERVER_URL)
+    client.batch.configure(batch_size=2, dynamic=False, num_workers=1)
+
+    # the producer that fills the batch waits for the slow request
+    def produce():
+        for i in range(2):
+            client.batch.add_data_object({"i": i}, "Test")
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    assert request_arrived.wait(5)
+
+    start = time.time()
+    client.batch.add_data_object({"i": 2}, "Test")
+    assert time.time() - start < 0.5
+    assert client.batch.shape == (1, 0)
+
+    producer.join()
+    client.batch.flush()
+    client.batch.shutdown()
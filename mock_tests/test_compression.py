@@ -0,0 +1,51 @@
+import gzip
+import json
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate import Config, ConnectionConfig
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_batch_request_is_compressed(weaviate_mock, compression):
+    if compression == "zstd":
+        zstandard = pytest.importorskip("zstandard")
+    received = []
+
+    def handler(request: Request):
+        body = request.get_data()
+        encoding = request.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        elif encoding == "zstd":
+            body = zstandard.ZstdDecompressor().decompress(body)
+        received.append((encoding, json.loads(body)))
+        return Response(json.dumps([]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(handler)
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=Config(
+            connection_config=ConnectionConfig(compression=compression, compression_threshold=500)
+        ),
+    )
+    client.batch.configure(batch_size=10, dynamic=False)
+    with client.batch as batch:
+        for _ in range(10):
+            batch.add_data_object({"text": "lorem ipsum " * 10}, "Test")
+        batch.add_data_object({"text": "small"}, "Test")
+
+    assert [encoding for encoding, _ in received] == [compression, None]
+    assert len(received[0][1]["objects"]) == 10
+    assert received[1][1]["objects"][0]["properties"] == {"text": "small"}
+
+
+def test_invalid_compression():
+    with pytest.raises(ValueError):
+        ConnectionConfig(compression="brotli")
+    with pytest.raises(TypeError):
+        ConnectionConfig(compression="gzip", compression_threshold="1kb")
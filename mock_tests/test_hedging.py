@@ -0,0 +1,90 @@
+import json
+import threading
+import time
+import uuid
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP
+from weaviate import Config, ConnectionConfig, HedgingConfig
+from weaviate.connect.hedging import MIN_LATENCY_SAMPLES
+
+THREADED_MOCK_PORT = 23540
+
+
+@pytest.fixture(scope="function")
+def threaded_weaviate_mock():
+    # the hedge is only answered before the slow request if the server handles both at once
+    server = HTTPServer(host=MOCK_IP, port=THREADED_MOCK_PORT, threaded=True)
+    server.start()
+    server.expect_request("/v1/.well-known/ready").respond_with_json({})
+    server.expect_request("/v1/meta").respond_with_json({"version": "1.16"})
+    yield server
+    server.clear()
+    server.stop()
+
+
+def test_slow_reads_are_hedged(threaded_weaviate_mock):
+    obj_uuid = str(uuid.uuid4())
+    slow = threading.Event()
+    calls = {"graphql": 0, "object": 0, "create": 0}
+
+    def handler(name, body):
+        def handle(request: Request):
+            calls[name] += 1
+            if slow.is_set():
+                # only the first request is slow
+                slow.clear()
+                time.sleep(1)
+            return Response(json.dumps(body))
+
+        return handle
+
+    threaded_weaviate_mock.expect_request("/v1/graphql").respond_with_handler(
+        handler("graphql", {"data": {"Get": {"Test": []}}})
+    )
+    threaded_weaviate_mock.expect_request(f"/v1/objects/Test/{obj_uuid}").respond_with_handler(
+        handler("object", {"id": obj_uuid})
+    )
+    threaded_weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_handler(
+        handler("create", {"id": obj_uuid})
+    )
+
+    client = weaviate.Client(
+        url=f"http://{MOCK_IP}:{THREADED_MOCK_PORT}",
+        additional_config=Config(
+            connection_config=ConnectionConfig(
+                hedging=HedgingConfig(percentile=90, budget=1, min_delay=0.05)
+            )
+        ),
+    )
+    for _ in range(MIN_LATENCY_SAMPLES):
+        client.query.get("Test", ["name"]).do()
+    calls["graphql"] = 0
+
+    slow.set()
+    start = time.perf_counter()
+    assert client.query.get("Test", ["name"]).do() == {"data": {"Get": {"Test": []}}}
+    assert time.perf_counter() - start < 0.5
+    assert calls["graphql"] == 2
+
+    slow.set()
+    start = time.perf_counter()
+    assert client.data_object.get_by_id(obj_uuid, class_name="Test") == {"id": obj_uuid}
+    assert time.perf_counter() - start < 0.5
+    assert calls["object"] == 2
+
+    # writes are never hedged
+    slow.set()
+    client.data_object.create({"name": "test"}, "Test", obj_uuid)
+    assert calls["create"] == 1
+    assert client._connection._hedger.num_hedged == 2
+    client._connection.close()
+
+
+def test_invalid_hedging():
+    with pytest.raises(TypeError):
+        ConnectionConfig(hedging={"percentile": 95})
@@ -0,0 +1,72 @@
+import json
+import time
+import uuid
+
+import pytest
+from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate import Config, ConnectionConfig
+from weaviate.connect.http2 import HTTP2Adapter
+
+pytest.importorskip("h2")
+
+
+def http2_client(**kwargs) -> weaviate.Client:
+    return weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=Config(connection_config=ConnectionConfig(http2=True, **kwargs)),
+    )
+
+
+def test_requests_over_http2_adapter(weaviate_mock):
+    obj_uuid = str(uuid.uuid4())
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_json({"id": obj_uuid})
+    weaviate_mock.expect_request(f"/v1/objects/Test/{obj_uuid}").respond_with_data(status=404)
+    weaviate_mock.expect_request("/v1/graphql").respond_with_json(
+        {"data": {"Get": {"Test": [{"name": "test"}]}}}
+    )
+    received = []
+
+    def batch_handler(request: Request):
+        received.append(request.headers.get("Content-Encoding"))
+        return Response(json.dumps([{**obj, "result": {}} for obj in request.json["objects"]]))
+
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(batch_handler)
+
+    client = http2_client()
+    assert isinstance(client._connection._session.get_adapter(MOCK_SERVER_URL), HTTP2Adapter)
+    assert client.data_object.create({"name": "test"}, "Test", obj_uuid) == obj_uuid
+    assert client.data_object.get_by_id(obj_uuid, class_name="Test") is None
+    assert client.query.get("Test", ["name"]).do() == {
+        "data": {"Get": {"Test": [{"name": "test"}]}}
+    }
+    client.batch.configure(batch_size=10, dynamic=False, num_workers=4)
+    with client.batch as batch:
+        for i in range(100):
+            batch.add_data_object({"i": i}, "Test")
+    assert received == [None] * 10
+
+
+def test_http2_adapter_errors(weaviate_mock):
+    def slow_handler(request: Request):
+        time.sleep(0.5)
+        return Response(json.dumps({}))
+
+    weaviate_mock.expect_request("/v1/graphql").respond_with_handler(slow_handler)
+
+    client = http2_client()
+    client.timeout_config = (1, 0.1)
+    with pytest.raises(ReadTimeout):
+        client.query.raw("{Get {Test {name}}}")
+
+    client._connection.url = "http://127.0.0.1:1"
+    with pytest.raises(RequestsConnectionError):
+        client.data_object.get()
+
+
+def test_invalid_http2():
+    with pytest.raises(TypeError):
+        ConnectionConfig(http2="yes")
@@ -0,0 +1,82 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_SERVER_URL
+from weaviate import Config, ConnectionConfig
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("json_codec", ["json", "orjson"])
+def test_requests_and_responses_use_codec(weaviate_mock, json_codec):
+    if json_codec == "orjson":
+        pytest.importorskip("orjson")
+    received = []
+
+    def handler(request: Request):
+        received.append(json.loads(request.get_data()))
+        return Response(json.dumps({"id": received[-1]["id"]}))
+
+    def batch_handler(request: Request):
+        received.append(json.loads(request.get_data()))
+        return Response(json.dumps([{**obj, "result": {}} for obj in received[-1]["objects"]]))
+
+    weaviate_mock.expect_request("/v1/objects", method="POST").respond_with_handler(handler)
+    weaviate_mock.expect_request("/v1/batch/objects").respond_with_handler(batch_handler)
+    weaviate_mock.expect_request("/v1/graphql").respond_with_json(
+        {"data": {"Get": {"Test": [{"name": "ünïcode"}]}}}
+    )
+
+    client = weaviate.Client(
+        url=MOCK_SERVER_URL,
+        additional_config=Config(connection_config=ConnectionConfig(json_codec=json_codec)),
+    )
+    assert client._connection.json_codec.name == json_codec
+
+    obj_uuid = uuid.uuid4()
+    client.data_object.create(
+        {"embedding": np.array([1.0, 2.5], dtype=np.float32), "count": np.int64(3)},
+        "Test",
+        obj_uuid,
+        vector=np.array([0.5, 0.25]),
+    )
+    assert received[0]["properties"] == {"embedding": [1.0, 2.5], "count": 3}
+    assert received[0]["vector"] == [0.5, 0.25]
+
+    results = []
+    client.batch.configure(batch_size=1, dynamic=False, callback=results.extend)
+    with client.batch as batch:
+        batch.add_data_object({"matrix": np.eye(2)[:, 0]}, "Test")
+    assert received[1]["objects"][0]["properties"] == {"matrix": [1.0, 0.0]}
+    assert len(results) == 1
+
+    assert client.query.get("Test", ["name"]).do() == {
+        "data": {"Get": {"Test": [{"name": "ünïcode"}]}}
+    }
+
+
+def test_async_client_uses_codec(weaviate_mock):
+    pytest.importorskip("httpx")
+    weaviate_mock.expect_request("/v1/graphql").respond_with_json(
+        {"data": {"Get": {"Test": [{"name": "test"}]}}}
+    )
+
+    async def run():
+        async with weaviate.AsyncClient(
+            MOCK_SERVER_URL,
+            additional_config=Config(connection_config=ConnectionConfig(json_codec="json")),
+        ) as client:
+            assert client._connection.json_codec.name == "json"
+            return await client.query.get("Test", ["name"]).do()
+
+    assert asyncio.run(run()) == {"data": {"Get": {"Test": [{"name": "test"}]}}}
+
+
+def test_invalid_json_codec():
+    with pytest.raises(ValueError):
+        ConnectionConfig(json_codec="ujson")
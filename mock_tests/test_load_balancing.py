@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug.wrappers import Request, Response
+
+import weaviate
+from mock_tests.conftest import MOCK_IP, MOCK_SERVER_URL
+from weaviate import Config, ConnectionConfig
+
+SECOND_MOCK_PORT = 23539
+SECOND_MOCK_SERVER_URL = f"http://{MOCK_IP}:{SECOND_MOCK_PORT}"
+
+
+@pytest.fixture(scope="function")
+def second_weaviate_mock():
+    server = HTTPServer(host=MOCK_IP, port=SECOND_MOCK_PORT)
+    server.start()
+    server.expect_request("/v1/.well-known/ready").respond_with_json({})
+    server.expect_request("/v1/meta").respond_with_json({"version": "1.16"})
+    yield server
+    server.clear()
+    server.stop()
+
+
+def test_requests_are_spread_across_nodes(weaviate_mock, second_weaviate_mock):
+    served = {MOCK_SERVER_URL: 0, SECOND_MOCK_SERVER_URL: 0}
+    status = {MOCK_SERVER_URL: 200, SECOND_MOCK_SERVER_URL: 200}
+
+    def handler(url):
+        def handle(request: Request):
+            served[url] += 1
+            return Response(json.dumps({"data": {"Get": {"Test": []}}}), status=status[url])
+
+        return handle
+
+    weaviate_mock.expect_request("/v1/graphql").respond_with_handler(handler(MOCK_SERVER_URL))
+    second_weaviate_mock.expect_request("/v1/graphql").respond_with_handler(
+        handler(SECOND_MOCK_SERVER_URL)
+    )
+
+    client = weaviate.Client(
+        url=[MOCK_SERVER_URL, SECOND_MOCK_SERVER_URL + "/"],
+        additional_config=Config(
+            connection_config=ConnectionConfig(node_failure_threshold=2, node_ejection_time=60)
+        ),
+    )
+    assert client._connection.node_urls == [MOCK_SERVER_URL, SECOND_MOCK_SERVER_URL]
+    for _ in range(50):
+        client.query.raw("{Get {Test {name}}}")
+    assert served[MOCK_SERVER_URL] > 0 and served[SECOND_MOCK_SERVER_URL] > 0
+    assert sum(served.values()) == 50
+
+    # the second node is ejected after two unavailable responses
+    status[SECOND_MOCK_SERVER_URL] = 503
+    failed = 0
+    for _ in range(50):
+        try:
+            client.query.raw("{Get {Test {name}}}")
+        except weaviate.UnexpectedStatusCodeException:
+            failed += 1
+    assert failed == 2
+    assert client._connection._balancer.healthy_urls == [MOCK_SERVER_URL]
+
+
+def test_invalid_node_urls():
+    with pytest.raises(TypeError):
+        weaviate.Client(url=[])
+    with pytest.raises(TypeError):
+        weaviate.Client(url=[MOCK_SERVER_URL, 8080])
+    with pytest.raises(TypeError):
+        ConnectionConfig(node_failure_threshold=1.5)
+    with pytest.raises(TypeError):
+        ConnectionConfig(node_ejection_time="10s")
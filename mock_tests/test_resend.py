@@ -32,8 +32,8 @@ def test_no_retry_on_timeout(weaviate_no_auth_mock):
 def test_retry_on_timeout(weaviate_no_auth_mock):
     """Tests that clients resends objects that haven't been added due to a timeout.
 
-    After the timeout, the client checks if
-    - An object with the given UUID already exists (using HEAD). Here 50% return that they do NOT exist, eg have to be
+    After the timeout, the client fetches all objects (using GET) and checks if
+    - An object with the given UUID already exists. Here 50% return that they do NOT exist, eg have to be
     resent.
     - If an object exists, it is checked if the current version in weaviate is identical to the one that is
     sent in the batch. If not, the object in the batch is an update and has to be resent again
@@ -60,22 +60,14 @@ def test_retry_on_timeout(weaviate_no_auth_mock):
         handler_batch_objects
     )
 
-    # 50% of objects have not been added
-    def handler_exists(request: Request):
-        if added_uuids.index(request.url.split("/")[-1]) % 2 == 0:
-            return Response(json.dumps({}), status=404)
-        else:
-            return Response(json.dumps({}), status=200)
-
-    weaviate_no_auth_mock.expect_request(
-        re.compile("^/v1/objects/Test/"), method="HEAD"
-    ).respond_with_handler(handler_exists)
-
-    # 50% of objects are an update to an existing objects and have to be resent
+    # 50% of objects have not been added and 50% of the existing objects are an update to an
+    # existing object and have to be resent
     flip = False
 
     def handler_get_object(request: Request):
         nonlocal flip
+        if added_uuids.index(request.path.split("/")[-1]) % 2 == 0:
+            return Response(json.dumps({}), status=404)
         val = "test" if flip else "other"
         flip = not flip
         return Response(json.dumps({"properties": {"name": val}}))
@@ -108,9 +100,6 @@ def test_retry_on_timeout_all_succesfull(weaviate_no_auth_mock):
     )
 
     # return that all objects are already added successful
-    weaviate_no_auth_mock.expect_request(
-        re.compile("^/v1/objects/Test/"), method="HEAD"
-    ).respond_with_response(Response(json.dumps({}), status=200))
     weaviate_no_auth_mock.expect_request(
         re.compile("^/v1/objects/Test/"), method="GET"
     ).respond_with_json({"properties": {"name": "test"}})
@@ -120,3 +109,69 @@ def test_retry_on_timeout_all_succesfull(weaviate_no_auth_mock):
         for _ in range(n):
             batch.add_data_object({"name": "test"}, "test", uuid.uuid4())
     weaviate_no_auth_mock.check_assertions()
+
+
+def test_retry_on_timeout_compares_content(weaviate_no_auth_mock):
+    """Test that objects updated after the batch was sent are resent if their content differs."""
+    n = 20
+    resent = []
+    first_request = True
+
+    def handler_batch_objects(request: Request):
+        nonlocal first_request
+        if first_request:
+            time.sleep(1.5)  # cause timeout
+            first_request = False
+        else:
+            resent.extend(request.json["objects"])
+        return Response(json.dumps([]))
+
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_handler(
+        handler_batch_objects
+    )
+
+    # another writer updated the objects after the batch was sent
+    weaviate_no_auth_mock.expect_request(
+        re.compile("^/v1/objects/Test/"), method="GET"
+    ).respond_with_json(
+        {"properties": {"name": "other"}, "lastUpdateTimeUnix": int(time.time() * 1000) + 60_000}
+    )
+
+    client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(1, 1))
+    with client.batch(batch_size=n, timeout_retries=1, dynamic=False) as batch:
+        for _ in range(n):
+            batch.add_data_object({"name": "test"}, "test", uuid.uuid4())
+    assert len(resent) == n
+    assert all(obj["properties"] == {"name": "test"} for obj in resent)
+
+
+def test_retry_on_timeout_compares_vectors_as_float32(weaviate_no_auth_mock):
+    """Test that objects whose vector weaviate stored as float32 are not resent."""
+    n = 5
+    resent = []
+    first_request = True
+
+    def handler_batch_objects(request: Request):
+        nonlocal first_request
+        if first_request:
+            time.sleep(1.5)  # cause timeout
+            first_request = False
+        else:
+            resent.extend(request.json["objects"])
+        return Response(json.dumps([]))
+
+    weaviate_no_auth_mock.expect_request("/v1/batch/objects").respond_with_handler(
+        handler_batch_objects
+    )
+    # the vector as weaviate returns it, rounded to float32
+    weaviate_no_auth_mock.expect_request(
+        re.compile("^/v1/objects/Test/"), method="GET"
+    ).respond_with_json({"properties": {"name": "test"}, "vector": [0.12345679, 0.33333334, 1.0]})
+
+    client = weaviate.Client(url=MOCK_SERVER_URL, timeout_config=(1, 1))
+    with client.batch(batch_size=n, timeout_retries=1, dynamic=False) as batch:
+        for _ in range(n):
+            batch.add_data_object(
+                {"name": "test"}, "test", uuid.uuid4(), vector=[0.123456789, 1 / 3, 1.0]
+            )
+    assert resent == []
@@ -0,0 +1,60 @@
+"""
+Micro-benchmarks for the 'weaviate.batch.requests' classes. Skipped by default, run them with
+`pytest test/batch/test_benchmark_requests.py -o addopts=""`.
+"""
+import tracemalloc
+
+import pytest
+
+from weaviate.batch.requests import ObjectsBatchRequest
+
+NUM_OBJECTS = 10_000
+
+
+def _objects():
+    return [
+        {
+            "title": f"Document {i}",
+            "text": "lorem ipsum " * 50,
+            "chunks": [{"offset": j, "text": "dolor sit amet"} for j in range(10)],
+            "tags": ["a", "b", "c"],
+        }
+        for i in range(NUM_OBJECTS)
+    ]
+
+
+@pytest.mark.parametrize("copy_object", [True, "shallow", False])
+def test_benchmark_objects_batch_add(benchmark, copy_object):
+    objects = _objects()
+
+    def add_all():
+        batch = ObjectsBatchRequest()
+        for obj in objects:
+            batch.add(data_object=obj, class_name="Document", copy_object=copy_object)
+        return batch
+
+    benchmark(add_all)
+
+    tracemalloc.start()
+    add_all()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_memory_mb"] = round(peak / 1024 / 1024, 2)
+
+
+@pytest.mark.parametrize("columnar", [True, False])
+def test_benchmark_objects_batch_vectors(benchmark, columnar):
+    np = pytest.importorskip("numpy")
+    vectors = np.random.rand(NUM_OBJECTS, 384).astype(np.float32)
+    titles = [f"Document {i}" for i in range(NUM_OBJECTS)]
+
+    def add_all():
+        batch = ObjectsBatchRequest()
+        if columnar:
+            batch.add_many("Document", properties={"title": titles}, vectors=vectors)
+        else:
+            for title, vector in zip(titles, vectors):
+                batch.add({"title": title}, "Document", vector=vector)
+        return batch
+
+    benchmark(add_all)
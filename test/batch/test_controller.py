@@ -0,0 +1,69 @@
+import unittest
+
+from test.util import check_error_message
+from weaviate.batch.controller import AIMDBatchSizeController, _percentile
+
+
+class TestAIMDBatchSizeController(unittest.TestCase):
+    def test_init_errors(self):
+        with self.assertRaises(TypeError):
+            AIMDBatchSizeController(target_latency="1")
+        with self.assertRaises(ValueError):
+            AIMDBatchSizeController(target_latency=0)
+        with self.assertRaises(ValueError) as error:
+            AIMDBatchSizeController(percentile=1.5)
+        check_error_message(self, error, "'percentile' must be in (0, 1]. Given value: 1.5.")
+        with self.assertRaises(ValueError):
+            AIMDBatchSizeController(multiplicative_decrease=1)
+        with self.assertRaises(ValueError):
+            AIMDBatchSizeController(min_batch_size=10, max_batch_size=5)
+
+    def test_additive_increase(self):
+        controller = AIMDBatchSizeController(target_latency=1, additive_increase=10, window=2)
+        controller.reset(batch_size=50, num_workers=1)
+
+        controller.observe(50, 0.5)
+        self.assertEqual(controller.batch_size, 50)  # window not full yet
+        controller.observe(50, 0.5)
+        self.assertEqual(controller.batch_size, 60)
+        self.assertEqual(len(controller.history), 1)
+        self.assertEqual(controller.history[0].batch_size, 60)
+        self.assertEqual(controller.history[0].latency, 0.5)
+
+    def test_multiplicative_decrease(self):
+        controller = AIMDBatchSizeController(target_latency=1, window=2)
+        controller.reset(batch_size=100, num_workers=1)
+
+        controller.observe(100, 0.5)
+        controller.observe(100, 3)
+        self.assertEqual(controller.batch_size, 50)
+
+        # a timeout decreases immediately
+        controller.observe(50, None)
+        self.assertEqual(controller.batch_size, 25)
+        self.assertIsNone(controller.history[-1].latency)
+
+    def test_num_workers(self):
+        controller = AIMDBatchSizeController(
+            target_latency=1, min_batch_size=10, max_batch_size=20, max_num_workers=3, window=1
+        )
+        controller.reset(batch_size=100, num_workers=1)
+        self.assertEqual(controller.batch_size, 20)
+
+        # batch size is at its maximum, scale out
+        controller.observe(20, 0.1)
+        controller.observe(20, 0.1)
+        controller.observe(20, 0.1)
+        self.assertEqual((controller.batch_size, controller.num_workers), (20, 3))
+
+        # batch size is at its minimum, scale in
+        controller.observe(20, 2)
+        self.assertEqual((controller.batch_size, controller.num_workers), (10, 3))
+        controller.observe(10, 2)
+        self.assertEqual((controller.batch_size, controller.num_workers), (10, 2))
+
+    def test_percentile(self):
+        values = [float(i) for i in range(1, 21)]
+        self.assertEqual(_percentile(values, 0.95), 19)
+        self.assertEqual(_percentile(values, 1), 20)
+        self.assertEqual(_percentile([3.0], 0.5), 3)
@@ -0,0 +1,79 @@
+import datetime
+import time
+import unittest
+import uuid
+from unittest.mock import Mock
+
+from requests import Response
+
+from weaviate.batch.crud_batch import Batch, _aggregate_batch_stats
+
+SLOW_UUID = "5d9d38d2-2e4e-4f6b-9f0e-7e3c9d4a1b2c"
+
+
+class TestAggregateBatchStats(unittest.TestCase):
+    def test_no_batch_stats(self):
+        self.assertIsNone(_aggregate_batch_stats([]))
+        self.assertIsNone(_aggregate_batch_stats([{"gitHash": "ABC"}]))
+        self.assertIsNone(
+            _aggregate_batch_stats(
+                [{"batchStats": {"queueLength": 0, "ratePerSecond": 10}}, {"gitHash": "ABC"}]
+            )
+        )
+
+    def test_all_nodes(self):
+        nodes = [
+            {"batchStats": {"queueLength": 0, "ratePerSecond": 100}},
+            {"batchStats": {"queueLength": 600, "ratePerSecond": 200}},
+            {"batchStats": {"queueLength": 50, "ratePerSecond": 50}},
+        ]
+        # the rate is summed up, the ratio is the one of the most congested node
+        self.assertEqual(_aggregate_batch_stats(nodes), (350, 3))
+
+    def test_empty_queues(self):
+        nodes = [
+            {"batchStats": {"queueLength": 0, "ratePerSecond": 0}},
+            {"batchStats": {"queueLength": 0, "ratePerSecond": 20}},
+        ]
+        self.assertEqual(_aggregate_batch_stats(nodes), (20, 0))
+
+    def test_queue_without_rate(self):
+        # a node without a measured rate does not pause the import
+        nodes = [{"batchStats": {"queueLength": 30, "ratePerSecond": 0}}]
+        self.assertEqual(_aggregate_batch_stats(nodes), (0, 0))
+        nodes.append({"batchStats": {"queueLength": 40, "ratePerSecond": 20}})
+        self.assertEqual(_aggregate_batch_stats(nodes), (20, 2))
+
+
+class TestReferenceDispatch(unittest.TestCase):
+    def test_references_do_not_wait_for_unrelated_objects(self):
+        events = []
+
+        def create_data(data_type, batch_request, delay_retries=False, segment_id=None):
+            if data_type == "objects":
+                uuids = batch_request.get_uuids()
+                if SLOW_UUID in uuids:
+                    time.sleep(0.5)
+                events.append(("objects", uuids))
+            else:
+                events.append(("references", batch_request.get_uuids()))
+            response = Response()
+            response.elapsed = datetime.timedelta(seconds=0.1)
+            return response
+
+        connection = Mock(timeout_config=(2, 20), server_version="1.21.0")
+        connection.get.return_value = Mock(status_code=200, json=lambda: {"nodes": [{}]})
+        batch = Batch(connection)
+        batch._create_data = create_data
+        batch.configure(batch_size=3, dynamic=False, num_workers=2, callback=None)
+        with batch:
+            for i in range(3):
+                batch.add_data_object({}, "Test", uuid=SLOW_UUID if i == 0 else uuid.uuid4())
+            from_uuid = batch.add_data_object({}, "Test")
+            to_uuid = batch.add_data_object({}, "Test")
+            batch.add_reference(from_uuid, "Test", "ref", to_uuid, "Test")
+
+        # the references are only waiting for the objects batch containing their objects
+        self.assertEqual([kind for kind, _ in events], ["objects", "references", "objects"])
+        self.assertEqual(events[1][1], {from_uuid, to_uuid})
+        self.assertIn(SLOW_UUID, events[2][1])
@@ -0,0 +1,40 @@
+import concurrent.futures
+import threading
+import unittest
+
+from weaviate.batch.futures import BatchItemFuture
+
+
+class TestBatchItemFuture(unittest.TestCase):
+    def test_wait_for_result(self):
+        future, other = BatchItemFuture(), BatchItemFuture()
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(future.result(timeout=5)))
+        waiter.start()
+
+        # resolving another future does not resolve the waited one
+        other._set_result({"id": "other"})
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.01)
+        self.assertIsNone(other._event)
+
+        future._set_result({"id": "1"})
+        waiter.join()
+        self.assertEqual(results, [{"id": "1"}])
+        self.assertTrue(future.done())
+        # resolving twice keeps the first result
+        future._set_exception(ValueError())
+        self.assertEqual(future.result(timeout=0), {"id": "1"})
+        self.assertIsNone(future.exception())
+
+    def test_exception_and_callbacks(self):
+        future = BatchItemFuture()
+        called = []
+        future.add_done_callback(called.append)
+        future._set_exception(ValueError("failed"))
+        self.assertEqual(called, [future])
+        self.assertIsInstance(future.exception(timeout=0), ValueError)
+        with self.assertRaises(ValueError):
+            future.result()
+        future.add_done_callback(called.append)
+        self.assertEqual(called, [future, future])
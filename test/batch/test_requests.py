@@ -1,9 +1,13 @@
 """
 Test the 'weaviate.batch.requests' functions/classes.
 """
+import json
 import unittest
+import uuid
 from unittest.mock import patch
 
+import pytest
+
 from test.util import check_error_message
 from weaviate.batch.requests import ReferenceBatchRequest, ObjectsBatchRequest
 
@@ -104,6 +108,40 @@ class TestBatchReferences(unittest.TestCase):
         self.assertEqual(len(batch), 0)
         self.assertTrue(batch.is_empty())
 
+    @patch("weaviate.batch.requests.get_valid_uuid", side_effect=lambda x: x)
+    def test_get_uuids(self, mock_get_valid_uuid):
+        batch = ReferenceBatchRequest()
+        self.assertEqual(batch.get_uuids(), set())
+        batch.add("Alpha", "UUID_1", "a", "UUID_2", "Beta")
+        batch.add("Alpha", "UUID_1", "a", "UUID_3")
+        self.assertEqual(batch.get_uuids(), {"UUID_1", "UUID_2", "UUID_3"})
+
+    def test_num_bytes(self):
+        batch = ReferenceBatchRequest()
+        self.assertEqual(batch.num_bytes, 0)
+        uuids = [str(uuid.uuid4()) for _ in range(3)]
+        batch.add("Alpha", uuids[0], "a", uuids[1], "Beta")
+        batch.add("Alpha", uuids[0], "a", uuids[2], tenant="tenantA")
+
+        body_size = len(json.dumps(batch.get_request_body()))
+        self.assertGreaterEqual(batch.num_bytes, body_size)
+        self.assertLess(batch.num_bytes, body_size * 1.2)
+
+        num_bytes = batch.num_bytes
+        item = batch.pop()
+        self.assertEqual(batch.num_bytes, num_bytes - len(json.dumps(item)) - 2)
+        batch.add_failed_objects_from_response(
+            [{**item, "result": {"errors": {"error": [{"message": "failed"}]}}}], None, None
+        )
+        self.assertEqual(len(batch), 2)
+        first, second = batch.bisect()
+        self.assertEqual(
+            first.get_request_body() + second.get_request_body(), batch.get_request_body()
+        )
+        self.assertEqual(first.num_bytes + second.num_bytes, batch.num_bytes)
+        batch.empty()
+        self.assertEqual(batch.num_bytes, 0)
+
 
 class TestBatchObjects(unittest.TestCase):
     """
@@ -303,3 +341,170 @@ class TestBatchObjects(unittest.TestCase):
         batch.empty()
         self.assertEqual(len(batch), 0)
         self.assertTrue(batch.is_empty())
+
+    def test_add_copy_object(self):
+        """
+        Test the `copy_object` argument of the ObjectsBatchRequest's `add` method.
+        """
+
+        batch = ObjectsBatchRequest()
+        obj = {"name": "Socrates", "tags": ["philosopher"]}
+
+        batch.add(data_object=obj, class_name="Philosopher", copy_object=True)
+        batch.add(data_object=obj, class_name="Philosopher", copy_object="shallow")
+        batch.add(data_object=obj, class_name="Philosopher", copy_object=False)
+        deep, shallow, owned = (item["properties"] for item in batch.get_request_body()["objects"])
+
+        self.assertIsNot(deep, obj)
+        self.assertIsNot(deep["tags"], obj["tags"])
+        self.assertIsNot(shallow, obj)
+        self.assertIs(shallow["tags"], obj["tags"])
+        self.assertIs(owned, obj)
+
+        obj["name"] = "Plato"
+        self.assertEqual(deep["name"], "Socrates")
+        self.assertEqual(shallow["name"], "Socrates")
+        self.assertEqual(owned["name"], "Plato")
+
+    def test_create_item_and_add_item(self):
+        """
+        Test the ObjectsBatchRequest's `create_item` and `add_item` methods.
+        """
+
+        obj_uuid = str(uuid.uuid4())
+        item = ObjectsBatchRequest.create_item({"name": "Socrates"}, "Philosopher", obj_uuid)
+        self.assertEqual(
+            item, {"class": "Philosopher", "properties": {"name": "Socrates"}, "id": obj_uuid}
+        )
+
+        batch = ObjectsBatchRequest(track_size=True)
+        batch.add_item(item)
+        num_bytes = batch.num_bytes
+        self.assertGreater(num_bytes, 0)
+        batch.add_item(item, num_bytes=10)
+        self.assertEqual(batch.get_request_body()["objects"], [item, item])
+        self.assertEqual(batch.num_bytes, num_bytes + 10)
+
+        with self.assertRaises(TypeError):
+            ObjectsBatchRequest.create_item([], "Philosopher")
+
+    def test_add_many(self):
+        """
+        Test the ObjectsBatchRequest's `add_many` method.
+        """
+
+        batch = ObjectsBatchRequest()
+        uuids = batch.add_many(
+            class_name="Philosopher",
+            properties={"name": ["Socrates", "Plato"], "age": [71, 80]},
+            vectors=[[1.0, 2.0], [3.0, 4.0]],
+            uuids=["d087b7c6-a115-5c89-8cb2-f25bdeb9bf93", "d087b7c6-a115-5c89-8cb2-f25bdeb9bf94"],
+            tenants="Athens",
+        )
+        self.assertEqual(
+            uuids, ["d087b7c6-a115-5c89-8cb2-f25bdeb9bf93", "d087b7c6-a115-5c89-8cb2-f25bdeb9bf94"]
+        )
+        self.assertEqual(
+            batch.get_request_body()["objects"],
+            [
+                {
+                    "class": "Philosopher",
+                    "properties": {"name": "Socrates", "age": 71},
+                    "id": "d087b7c6-a115-5c89-8cb2-f25bdeb9bf93",
+                    "vector": [1.0, 2.0],
+                    "tenant": "Athens",
+                },
+                {
+                    "class": "Philosopher",
+                    "properties": {"name": "Plato", "age": 80},
+                    "id": "d087b7c6-a115-5c89-8cb2-f25bdeb9bf94",
+                    "vector": [3.0, 4.0],
+                    "tenant": "Athens",
+                },
+            ],
+        )
+
+        # only vectors, generated uuids and one tenant per object
+        uuids = batch.add_many(
+            class_name="Philosopher", vectors=[[5.0], [6.0]], tenants=["Athens", "Rome"]
+        )
+        self.assertEqual(len(uuids), 2)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch.get_request_body()["objects"][2]["properties"], {})
+        self.assertEqual(batch.get_request_body()["objects"][3]["tenant"], "Rome")
+
+        with self.assertRaises(ValueError):
+            batch.add_many(
+                class_name="Philosopher", properties={"name": ["A"]}, vectors=[[1.0], [2.0]]
+            )
+        with self.assertRaises(TypeError):
+            batch.add_many(class_name=1, properties={"name": ["A"]})
+
+    def test_add_many_numpy(self):
+        """
+        Test the ObjectsBatchRequest's `add_many` method with numpy columns.
+        """
+
+        np = pytest.importorskip("numpy")
+
+        batch = ObjectsBatchRequest()
+        batch.add_many(
+            class_name="Point",
+            properties={"x": np.array([1, 2]), "label": np.array(["a", "b"])},
+            vectors=np.array([[0.5, 1.5], [2.5, 3.5]], dtype=np.float32),
+        )
+        objects = batch.get_request_body()["objects"]
+        self.assertEqual(objects[0]["properties"], {"x": 1, "label": "a"})
+        self.assertEqual(objects[1]["vector"], [2.5, 3.5])
+        self.assertIsInstance(objects[1]["vector"][0], float)
+        self.assertIsInstance(objects[1]["properties"]["x"], int)
+
+    def test_num_bytes_and_split(self):
+        """
+        Test the ObjectsBatchRequest's size tracking and `split` method.
+        """
+
+        batch = ObjectsBatchRequest(track_size=True)
+        self.assertEqual(batch.num_bytes, 0)
+        for i in range(10):
+            batch.add({"text": "a" * 100 * (i + 1)}, "Doc", vector=[0.123456789] * 10)
+        batch.add_many("Doc", properties={"text": ["b" * 50, "c" * 50]})
+
+        body_size = len(json.dumps(batch.get_request_body()))
+        # the vectors are overestimated
+        self.assertGreaterEqual(batch.num_bytes, body_size)
+        self.assertLess(batch.num_bytes, body_size * 1.2)
+        untracked = ObjectsBatchRequest()
+        untracked._items = list(batch.get_request_body()["objects"])
+        self.assertEqual(untracked.num_bytes, batch.num_bytes)
+
+        batches = batch.split(2000)
+        self.assertEqual(sum(len(split) for split in batches), 12)
+        self.assertEqual(
+            [item for split in batches for item in split.get_request_body()["objects"]],
+            batch.get_request_body()["objects"],
+        )
+        for split in batches:
+            self.assertTrue(split.num_bytes <= 2000 or len(split) == 1)
+        self.assertEqual(batch.split(batch.num_bytes), [batch])
+        first, second = batch.bisect()
+        self.assertEqual((len(first), len(second)), (6, 6))
+        self.assertEqual(
+            first.get_request_body()["objects"] + second.get_request_body()["objects"],
+            batch.get_request_body()["objects"],
+        )
+        self.assertEqual(first.num_bytes + second.num_bytes, batch.num_bytes)
+        self.assertEqual(first._item_sizes + second._item_sizes, batch._item_sizes)
+
+        num_bytes = batch.num_bytes
+        item = batch.pop()
+        self.assertEqual(batch.num_bytes, num_bytes - len(json.dumps(item)) - 2)
+        batch.empty()
+        self.assertEqual(batch.num_bytes, 0)
+
+        tracked = ObjectsBatchRequest(track_size=True)
+        for _ in range(10):
+            tracked.add({"text": "a" * 100}, "Doc")
+        for split in tracked.split(500):
+            # sizes are carried over to the split batches
+            self.assertEqual(split.num_bytes, len(json.dumps(split.get_request_body()["objects"])))
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+
+from weaviate.batch.requests import ObjectsBatchRequest, ReferenceBatchRequest
+from weaviate.batch.spool import BatchSpool
+
+
+class TestBatchSpool(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_append_seal_and_read(self):
+        spool = BatchSpool(self.directory)
+        self.assertIsNone(spool.seal())
+
+        spool.append("objects", [{"class": "Test", "id": "1"}, {"class": "Test", "id": "2"}])
+        spool.append("references", [{"from": "a", "to": "b"}])
+        spool.append("objects", [])
+        segment_id = spool.seal()
+        self.assertEqual(segment_id, 0)
+        self.assertEqual(
+            list(spool.read(segment_id)),
+            [
+                ("objects", {"class": "Test", "id": "1"}),
+                ("objects", {"class": "Test", "id": "2"}),
+                ("references", {"from": "a", "to": "b"}),
+            ],
+        )
+        self.assertEqual(spool.segments(), [0])
+
+        # the active segment is not listed
+        spool.append("objects", [{"class": "Test", "id": "3"}])
+        self.assertEqual(spool.segments(), [0])
+        self.assertEqual(spool.seal(), 1)
+
+    def test_hold_and_ack(self):
+        spool = BatchSpool(self.directory)
+        spool.append("objects", [{"class": "Test", "id": "1"}])
+        segment_id = spool.seal()
+        objects_batch, reference_batch = ObjectsBatchRequest(), ReferenceBatchRequest()
+        spool.hold(segment_id, [objects_batch, reference_batch])
+        self.assertEqual(spool.segments(), [])
+
+        spool.ack(objects_batch)
+        spool.ack(objects_batch)  # acknowledging twice does nothing
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        spool.ack(reference_batch)
+        self.assertEqual(os.listdir(self.directory), [])
+
+        spool.append("objects", [{"class": "Test", "id": "2"}])
+        spool.hold(spool.seal(), [])
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_retain_and_release(self):
+        spool = BatchSpool(self.directory)
+        spool.append("objects", [{"class": "Test", "id": "1"}, {"class": "Test", "id": "2"}])
+        segment_id = spool.seal()
+        objects_batch = ObjectsBatchRequest()
+        self.assertIsNone(spool.segment(objects_batch))
+        spool.hold(segment_id, [objects_batch])
+        self.assertEqual(spool.segment(objects_batch), segment_id)
+
+        # both items are retried later
+        spool.retain(segment_id)
+        spool.retain(segment_id)
+        spool.ack(objects_batch)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        self.assertEqual(spool.segments(), [])
+        spool.release(segment_id)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        spool.release(segment_id)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_chain(self):
+        spool = BatchSpool(self.directory)
+        spool.append("objects", [{"class": "Test", "id": "1"}])
+        spool.append("references", [{"from": "a", "to": "b"}])
+        first = spool.seal()
+        objects_batch = ObjectsBatchRequest()
+        spool.hold(first, [objects_batch])
+        # the reference is kept back
+        spool.retain(first)
+        spool.ack(objects_batch)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        spool.append("references", [{"from": "c", "to": "d"}])
+        second = spool.seal()
+        reference_batch = ReferenceBatchRequest()
+        spool.chain(second, first)
+        spool.hold(second, [reference_batch])
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        spool.ack(reference_batch)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_hold_retained_segment_again(self):
+        spool = BatchSpool(self.directory)
+        spool.append("objects", [{"class": "Test", "id": "1"}])
+        segment_id = spool.seal()
+        spool.hold(segment_id, [ObjectsBatchRequest()])
+        spool.retain(segment_id)
+        spool.hold(segment_id, [])
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+        reference_batch = ReferenceBatchRequest()
+        spool.hold(segment_id, [reference_batch])
+        spool.release(segment_id)
+        spool.ack(reference_batch)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+
+    def test_leftover_segments(self):
+        spool = BatchSpool(self.directory)
+        spool.append("objects", [{"class": "Test", "id": "1"}])
+        spool.seal()
+        spool.append("objects", [{"class": "Test", "id": "2"}, {"class": "Test", "id": "3"}])
+        # the process crashes while writing the last line
+        with open(os.path.join(self.directory, "000000000001.jsonl"), "a") as file:
+            file.write('["objects", {"cla')
+
+        resumed = BatchSpool(self.directory)
+        self.assertEqual(resumed.segments(), [0, 1])
+        self.assertEqual([item["id"] for _, item in resumed.read(1)], ["2", "3"])
+        resumed.append("objects", [{"class": "Test", "id": "4"}])
+        self.assertEqual(resumed.seal(), 2)
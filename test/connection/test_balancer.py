@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch
+
+from weaviate.connect.balancer import NodeBalancer
+
+URLS = ["http://node-0:8080", "http://node-1:8080", "http://node-2:8080"]
+
+
+class TestNodeBalancer(unittest.TestCase):
+    def test_power_of_two_choices(self):
+        balancer = NodeBalancer(URLS, failure_threshold=3, ejection_time=10)
+        busy = [balancer.acquire() for _ in range(30)]
+        # a node is only picked if it has no more requests in flight than another node
+        in_flight = sorted(node.in_flight for node in balancer._nodes)
+        self.assertEqual(sum(in_flight), 30)
+        self.assertLessEqual(in_flight[-1] - in_flight[0], 10)
+
+        for node in busy:
+            balancer.release(node, failed=False)
+        for _ in range(5):
+            balancer.release(balancer.acquire(), failed=False)
+        self.assertEqual([node.in_flight for node in balancer._nodes], [0, 0, 0])
+
+        # the least loaded of two nodes is picked
+        balancer = NodeBalancer(URLS[:2], failure_threshold=3, ejection_time=10)
+        first = balancer.acquire()
+        self.assertIsNot(balancer.acquire(), first)
+
+    @patch("weaviate.connect.balancer.time")
+    def test_ejection(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        balancer = NodeBalancer(URLS[:2], failure_threshold=2, ejection_time=10)
+        failing = balancer._nodes[0]
+
+        # a success resets the consecutive failures
+        for failed in [True, False, True]:
+            failing.in_flight += 1
+            balancer.release(failing, failed=failed)
+        self.assertEqual(balancer.healthy_urls, URLS[:2])
+
+        failing.in_flight += 1
+        balancer.release(failing, failed=True)
+        self.assertEqual(balancer.healthy_urls, [URLS[1]])
+        for _ in range(10):
+            node = balancer.acquire()
+            self.assertEqual(node.url, URLS[1])
+            balancer.release(node, failed=False)
+
+        # after the ejection the node gets requests again and is ejected by its next failure
+        mock_time.monotonic.return_value = 110.0
+        self.assertEqual(balancer.healthy_urls, URLS[:2])
+        failing.in_flight += 1
+        balancer.release(failing, failed=True)
+        self.assertEqual(balancer.healthy_urls, [URLS[1]])
+
+    @patch("weaviate.connect.balancer.time")
+    def test_all_nodes_ejected(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        balancer = NodeBalancer(URLS[:2], failure_threshold=1, ejection_time=10)
+        for node in balancer._nodes:
+            node.in_flight += 1
+            balancer.release(node, failed=True)
+            mock_time.monotonic.return_value += 1
+        self.assertEqual(balancer.healthy_urls, [])
+        # the node whose ejection ends first is used
+        self.assertEqual(balancer.acquire().url, URLS[0])
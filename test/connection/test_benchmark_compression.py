@@ -0,0 +1,41 @@
+"""
+Micro-benchmarks for the request body compression. Skipped by default, run them with
+`pytest test/connection/test_benchmark_compression.py -o addopts=""`.
+"""
+import json
+
+import pytest
+
+from weaviate.connect.connection import _compress
+
+NUM_OBJECTS = 1_000
+
+
+def _batch_body() -> bytes:
+    objects = [
+        {
+            "class": "Document",
+            "id": f"00000000-0000-0000-0000-{i:012d}",
+            "properties": {
+                "title": f"Document {i}",
+                "text": " ".join(f"word{(i * j) % 997}" for j in range(200)),
+            },
+        }
+        for i in range(NUM_OBJECTS)
+    ]
+    return json.dumps({"fields": ["ALL"], "objects": objects}).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "compression,level", [("gzip", 1), ("gzip", 6), ("gzip", 9), ("zstd", 1), ("zstd", 3)]
+)
+def test_benchmark_compress_batch(benchmark, compression, level):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    body = _batch_body()
+
+    compressed = benchmark(_compress, body, compression, level)
+
+    benchmark.extra_info["uncompressed_bytes"] = len(body)
+    benchmark.extra_info["compressed_bytes"] = len(compressed)
+    benchmark.extra_info["ratio"] = round(len(body) / len(compressed), 2)
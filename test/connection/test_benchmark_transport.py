@@ -0,0 +1,159 @@
+"""
+Benchmarks for the HTTP/1.1 and HTTP/2 transport adapters against a local TLS server. Skipped by
+default, run them with `pytest test/connection/test_benchmark_transport.py -o addopts=""`.
+"""
+import asyncio
+import datetime
+import json
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from weaviate.connect.http2 import HTTP2Adapter
+
+pytest.importorskip("h2")
+hypercorn_asyncio = pytest.importorskip("hypercorn.asyncio")
+hypercorn_config = pytest.importorskip("hypercorn.config")
+x509 = pytest.importorskip("cryptography.x509")
+
+NUM_REQUESTS = 256
+SERVER_DELAY = 0.005
+
+
+async def _app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    while (await receive()).get("more_body", False):
+        pass
+    await asyncio.sleep(SERVER_DELAY)
+    body = json.dumps({"http_version": scope["http_version"], "path": scope["path"]}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _self_signed_cert(directory) -> tuple:
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    import ipaddress
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+            critical=False,
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    certfile, keyfile = directory / "cert.pem", directory / "key.pem"
+    certfile.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    keyfile.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return str(certfile), str(keyfile)
+
+
+@pytest.fixture(scope="module")
+def tls_server(tmp_path_factory):
+    certfile, keyfile = _self_signed_cert(tmp_path_factory.mktemp("tls"))
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    config = hypercorn_config.Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile, config.keyfile = certfile, keyfile
+    config.loglevel = "ERROR"
+    config.keep_alive_max_requests = 1_000_000
+    loop = asyncio.new_event_loop()
+    shutdown = asyncio.Event()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(
+            hypercorn_asyncio.serve(_app, config, shutdown_trigger=shutdown.wait)
+        )
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+
+    yield f"https://127.0.0.1:{port}", certfile
+
+    loop.call_soon_threadsafe(shutdown.set)
+    thread.join(timeout=5)
+
+
+def _session(adapter) -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+@pytest.mark.parametrize(
+    "adapter,http_version", [(HTTPAdapter, "1.1"), (HTTP2Adapter, "2")], ids=["http1", "http2"]
+)
+def test_negotiated_protocol(tls_server, adapter, http_version):
+    url, certfile = tls_server
+    session = _session(adapter())
+    response = session.post(url + "/v1/graphql", json={"query": "{}"}, verify=certfile)
+    assert response.status_code == 200
+    assert response.json() == {"http_version": http_version, "path": "/v1/graphql"}
+    session.close()
+
+
+@pytest.mark.parametrize("concurrency", [1, 16, 128])
+@pytest.mark.parametrize("adapter", [HTTPAdapter, HTTP2Adapter], ids=["http1", "http2"])
+def test_benchmark_concurrent_queries(benchmark, tls_server, adapter, concurrency):
+    url, certfile = tls_server
+    # the pool sizes match the defaults of ConnectionConfig
+    if adapter is HTTPAdapter:
+        session = _session(HTTPAdapter(pool_connections=20, pool_maxsize=20))
+    else:
+        session = _session(HTTP2Adapter(max_connections=20, max_keepalive_connections=20))
+
+    def query(_):
+        response = session.post(url + "/v1/graphql", json={"query": "{}"}, verify=certfile)
+        assert response.status_code == 200
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        def run():
+            list(executor.map(query, range(NUM_REQUESTS)))
+
+        run()  # warm up the connections
+        benchmark.pedantic(run, rounds=5)
+
+    benchmark.extra_info["requests"] = NUM_REQUESTS
+    benchmark.extra_info["requests_per_second"] = round(NUM_REQUESTS / benchmark.stats["mean"])
+    session.close()
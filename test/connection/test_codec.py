@@ -0,0 +1,72 @@
+import json
+import math
+import unittest
+
+from weaviate.config import ConnectionConfig
+from weaviate.connect.codec import _JSONCodec, _ORJSONCodec, get_json_codec, has_orjson
+
+try:
+    import numpy as np
+
+    has_numpy = True
+
+except ImportError:
+    has_numpy = False
+
+
+class TestJSONCodec(unittest.TestCase):
+    def codecs(self):
+        if has_orjson:
+            return [_JSONCodec(), _ORJSONCodec()]
+        return [_JSONCodec()]
+
+    def test_get_json_codec(self):
+        self.assertIsInstance(get_json_codec("json"), _JSONCodec)
+        self.assertNotIsInstance(get_json_codec("json"), _ORJSONCodec)
+        if has_orjson:
+            self.assertIsInstance(get_json_codec("orjson"), _ORJSONCodec)
+        else:
+            with self.assertRaises(ImportError):
+                get_json_codec("orjson")
+
+    def test_default_codec_rejects_nan(self):
+        codec = get_json_codec(ConnectionConfig().json_codec)
+        self.assertNotIsInstance(codec, _ORJSONCodec)
+        with self.assertRaises(ValueError):
+            codec.dumps({"nan": math.nan})
+
+    def test_round_trip(self):
+        obj = {"text": "ünïcode", "number": 1.5, "list": [1, None, True]}
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                body = codec.dumps({**obj, 2: "non str key"})
+                self.assertIsInstance(body, bytes)
+                self.assertEqual(json.loads(body), {**obj, "2": "non str key"})
+                self.assertEqual(codec.loads(body), json.loads(body))
+                self.assertEqual(codec.loads(body.decode("utf-8")), json.loads(body))
+                with self.assertRaises(json.JSONDecodeError):
+                    codec.loads(b"<html>")
+
+    @unittest.skipIf(not has_numpy, "numpy is not installed")
+    def test_numpy(self):
+        obj = {
+            "vector": np.array([0.5, 1.5], dtype=np.float32),
+            "strided": np.arange(6.0).reshape(2, 3)[:, 1],
+            "scalar": np.int64(3),
+        }
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                self.assertEqual(
+                    json.loads(codec.dumps(obj)),
+                    {"vector": [0.5, 1.5], "strided": [1.0, 4.0], "scalar": 3},
+                )
+
+    def test_errors(self):
+        for codec in self.codecs():
+            with self.subTest(codec=codec.name):
+                with self.assertRaises(TypeError):
+                    codec.dumps({"object": object()})
+        with self.assertRaises(ValueError):
+            _JSONCodec().dumps({"nan": math.nan})
+        if has_orjson:
+            self.assertEqual(_ORJSONCodec().dumps({"nan": math.nan}), b'{"nan":null}')
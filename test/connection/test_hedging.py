@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+
+from weaviate.config import HedgingConfig
+from weaviate.connect.hedging import MIN_LATENCY_SAMPLES, Hedger
+
+
+def _slow_first(results, delay=1.0):
+    """
+    A request that is slow on its first call and fast afterwards.
+    """
+    calls = []
+    lock = threading.Lock()
+
+    def request():
+        with lock:
+            call = len(calls)
+            calls.append(call)
+        if call == 0:
+            time.sleep(delay)
+        if isinstance(results[call], Exception):
+            raise results[call]
+        return results[call]
+
+    return request, calls
+
+
+class TestHedger(unittest.TestCase):
+    def warm_up(self, hedger: Hedger) -> None:
+        for _ in range(MIN_LATENCY_SAMPLES):
+            hedger.run(lambda: time.sleep(0.001))
+
+    def test_no_hedge_without_latencies(self):
+        hedger = Hedger(HedgingConfig(budget=1, min_delay=0), max_workers=4)
+        request, calls = _slow_first(["first", "second"], delay=0.1)
+        self.assertEqual(hedger.run(request), "first")
+        self.assertEqual(calls, [0])
+        self.assertEqual(hedger.num_hedged, 0)
+
+    def test_first_response_wins(self):
+        hedger = Hedger(HedgingConfig(budget=1, min_delay=0.01), max_workers=4)
+        self.warm_up(hedger)
+
+        request, calls = _slow_first(["slow", "hedge"])
+        start = time.perf_counter()
+        self.assertEqual(hedger.run(request), "hedge")
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(calls, [0, 1])
+        self.assertEqual(hedger.num_hedged, 1)
+
+        # fast requests are not hedged
+        request, calls = _slow_first(["fast"], delay=0)
+        self.assertEqual(hedger.run(request), "fast")
+        self.assertEqual(calls, [0])
+        hedger.close()
+
+    def test_failed_response_waits_for_other(self):
+        hedger = Hedger(HedgingConfig(budget=1, min_delay=0.01), max_workers=4)
+        self.warm_up(hedger)
+
+        request, _ = _slow_first(["slow", ValueError("hedge failed")], delay=0.2)
+        self.assertEqual(hedger.run(request), "slow")
+
+        request, _ = _slow_first([ValueError("slow failed"), ValueError("hedge failed")], 0.2)
+        with self.assertRaises(ValueError):
+            hedger.run(request)
+        hedger.close()
+
+    def test_budget(self):
+        hedger = Hedger(HedgingConfig(budget=0, min_delay=0.01), max_workers=4)
+        self.warm_up(hedger)
+        request, calls = _slow_first(["slow", "hedge"], delay=0.1)
+        self.assertEqual(hedger.run(request), "slow")
+        self.assertEqual(calls, [0])
+
+        # every request adds 0.1 tokens, a hedge takes one
+        hedger = Hedger(HedgingConfig(budget=0.1, min_delay=0.01), max_workers=4)
+        self.warm_up(hedger)
+        hedger._tokens = 0
+        for _ in range(3):
+            request, _ = _slow_first(["slow", "hedge"], delay=0.05)
+            hedger.run(request)
+        self.assertEqual(hedger.num_hedged, 0)
+        for _ in range(8):
+            hedger.run(lambda: None)
+        request, _ = _slow_first(["slow", "hedge"], delay=0.5)
+        self.assertEqual(hedger.run(request), "hedge")
+        self.assertEqual(hedger.num_hedged, 1)
+        hedger.close()
+
+    def test_busy_workers_do_not_queue_requests(self):
+        hedger = Hedger(HedgingConfig(budget=1, min_delay=0.01), max_workers=1)
+        self.warm_up(hedger)
+
+        running = threading.Event()
+        release = threading.Event()
+
+        def blocking():
+            running.set()
+            release.wait()
+            return "blocking"
+
+        results = []
+        thread = threading.Thread(target=lambda: results.append(hedger.run(blocking)))
+        thread.start()
+        running.wait()
+
+        # the only worker is busy: the request runs on the calling thread and is not hedged
+        request_threads = []
+
+        def request():
+            request_threads.append(threading.current_thread())
+            time.sleep(0.1)
+            return "inline"
+
+        self.assertEqual(hedger.run(request), "inline")
+        self.assertEqual(request_threads, [threading.current_thread()])
+        self.assertEqual(hedger.num_hedged, 0)
+
+        release.set()
+        thread.join()
+        self.assertEqual(results, ["blocking"])
+        hedger.close()
+
+    def test_invalid_config(self):
+        with self.assertRaises(ValueError):
+            HedgingConfig(percentile=0)
+        with self.assertRaises(ValueError):
+            HedgingConfig(budget=-1)
+        with self.assertRaises(TypeError):
+            HedgingConfig(window=1.5)
@@ -34,6 +34,7 @@ __version__ : str
 
 __all__ = [
     "Client",
+    "AsyncClient",
     "AuthClientCredentials",
     "AuthClientPassword",
     "AuthBearerToken",
@@ -48,6 +49,7 @@ __all__ = [
     "EmbeddedOptions",
     "Config",
     "ConnectionConfig",
+    "HedgingConfig",
     "AdditionalProperties",
     "LinkTo",
     "Shard",
@@ -67,6 +69,7 @@ except PackageNotFoundError:
 from .auth import AuthClientCredentials, AuthClientPassword, AuthBearerToken, AuthApiKey
 from .batch.crud_batch import WeaviateErrorRetryConf, Shard
 from .client import Client
+from .aio import AsyncClient
 from .data.replication import ConsistencyLevel
 from .schema.crud_schema import Tenant, TenantActivityStatus
 from .embedded import EmbeddedOptions
@@ -77,7 +80,7 @@ from .exceptions import (
     SchemaValidationException,
     WeaviateStartUpError,
 )
-from .config import Config, ConnectionConfig
+from .config import Config, ConnectionConfig, HedgingConfig
 from .gql.get import AdditionalProperties, LinkTo
 
 if not sys.warnoptions:
@@ -0,0 +1,19 @@
+"""
+Asyncio client for applications that run on an event loop, requires `httpx`.
+"""
+
+__all__ = [
+    "AsyncBatch",
+    "AsyncClient",
+    "AsyncConnection",
+    "AsyncDataObject",
+    "AsyncQuery",
+    "AsyncSchema",
+]
+
+from .batch import AsyncBatch
+from .client import AsyncClient
+from .connection import AsyncConnection
+from .data import AsyncDataObject
+from .query import AsyncQuery
+from .schema import AsyncSchema
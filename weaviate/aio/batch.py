@@ -0,0 +1,256 @@
+"""
+AsyncBatch class definition.
+"""
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Union
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.batch.requests import (
+    BatchRequest,
+    BatchResponse,
+    ObjectsBatchRequest,
+    ReferenceBatchRequest,
+)
+from weaviate.data.replication import ConsistencyLevel
+from weaviate.types import UUID
+from weaviate.util import (
+    _capitalize_first_letter,
+    _check_positive_num,
+    _decode_json_response_list,
+    check_batch_result,
+)
+from .connection import AsyncConnection
+
+
+class AsyncBatch:
+    """
+    AsyncBatch class used to add multiple objects or object references at once into weaviate from
+    an asyncio event loop. Full batches are sent as background tasks, at most
+    `concurrent_requests` at a time. Adding to a batch waits while that many requests are in
+    flight, so a fast producer cannot buffer an unbounded number of batches.
+
+    Examples
+    --------
+    >>> async with client.batch.configure(batch_size=100, concurrent_requests=4) as batch:
+    ...     for i in range(1000):
+    ...         await batch.add_data_object({"index": i}, "Test")
+
+    Leaving the `async with` block sends the remaining objects and references and waits for all
+    requests, like `flush`.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncBatch class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.aio.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+        self._objects_batch = ObjectsBatchRequest()
+        self._reference_batch = ReferenceBatchRequest()
+        self._batch_size = 100
+        self._concurrent_requests = 2
+        self._consistency_level: Optional[ConsistencyLevel] = None
+        self._callback: Optional[Callable[[BatchResponse], None]] = check_batch_result
+        # created on first use, so it belongs to the running event loop
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._tasks: Set["asyncio.Future[None]"] = set()
+        self._errors: List[BaseException] = []
+
+    def configure(
+        self,
+        batch_size: int = 100,
+        concurrent_requests: int = 2,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        callback: Optional[Callable[[BatchResponse], None]] = check_batch_result,
+    ) -> "AsyncBatch":
+        """
+        Configure the batch.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The number of objects or references per request, by default 100.
+        concurrent_requests : int, optional
+            The maximal number of batch requests in flight at a time, by default 2.
+        consistency_level : Optional[ConsistencyLevel], optional
+            The consistency level of the batch requests, by default None.
+        callback : Optional[Callable[[BatchResponse], None]], optional
+            Called with the decoded response of every batch request, by default
+            `weaviate.util.check_batch_result`.
+
+        Returns
+        -------
+        AsyncBatch
+            Updated self.
+
+        Raises
+        ------
+        TypeError
+            If one of the arguments is of a wrong type.
+        ValueError
+            If `batch_size` or `concurrent_requests` is not positive.
+        """
+
+        _check_positive_num(batch_size, "batch_size", int)
+        _check_positive_num(concurrent_requests, "concurrent_requests", int)
+        self._batch_size = batch_size
+        if concurrent_requests != self._concurrent_requests:
+            # requests in flight release the semaphore they acquired
+            self._semaphore = None
+        self._concurrent_requests = concurrent_requests
+        self._consistency_level = (
+            ConsistencyLevel(consistency_level) if consistency_level is not None else None
+        )
+        self._callback = callback
+        return self
+
+    async def add_data_object(
+        self,
+        data_object: dict,
+        class_name: str,
+        uuid: Optional[UUID] = None,
+        vector: Optional[Sequence] = None,
+        tenant: Optional[str] = None,
+    ) -> str:
+        """
+        Add one object to this batch, see `weaviate.batch.Batch.add_data_object`. If the batch is
+        full, it is sent, waiting while `concurrent_requests` requests are in flight.
+
+        Returns
+        -------
+        str
+            The UUID of the added object. If one was not provided a UUIDv4 will be generated.
+        """
+
+        item = ObjectsBatchRequest.create_item(
+            class_name=_capitalize_first_letter(class_name),
+            data_object=data_object,
+            uuid=uuid,
+            vector=vector,
+            tenant=tenant,
+        )
+        self._objects_batch.add_item(item)
+        if len(self._objects_batch) >= self._batch_size:
+            await self._send_objects()
+        return str(item["id"])
+
+    async def add_reference(
+        self,
+        from_object_uuid: UUID,
+        from_object_class_name: str,
+        from_property_name: str,
+        to_object_uuid: UUID,
+        to_object_class_name: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Add one reference to this batch, see `weaviate.batch.Batch.add_reference`. If the batch
+        is full, the added objects are sent and created first, then the references are sent,
+        waiting while `concurrent_requests` requests are in flight.
+        """
+
+        item = ReferenceBatchRequest.create_item(
+            from_object_class_name=_capitalize_first_letter(from_object_class_name),
+            from_object_uuid=from_object_uuid,
+            from_property_name=from_property_name,
+            to_object_uuid=to_object_uuid,
+            to_object_class_name=_capitalize_first_letter(to_object_class_name)
+            if to_object_class_name is not None
+            else None,
+            tenant=tenant,
+        )
+        self._reference_batch.add_item(item)
+        if len(self._reference_batch) >= self._batch_size:
+            # references may point to the objects, which have to be created first
+            await self._send_objects()
+            await self._wait()
+            await self._send_references()
+
+    async def flush(self) -> None:
+        """
+        Send the remaining objects, then the remaining references, and wait for all requests.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        await self._send_objects()
+        # references may point to the objects, which have to be created first
+        await self._wait()
+        await self._send_references()
+        await self._wait()
+        if len(self._errors) > 0:
+            error, self._errors = self._errors[0], []
+            raise error
+
+    @property
+    def shape(self) -> tuple:
+        """
+        The number of objects and references that are not sent yet.
+        """
+
+        return len(self._objects_batch), len(self._reference_batch)
+
+    async def __aenter__(self) -> "AsyncBatch":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.flush()
+
+    async def _send_objects(self) -> None:
+        batch_request, self._objects_batch = self._objects_batch, ObjectsBatchRequest()
+        await self._send("objects", batch_request)
+
+    async def _send_references(self) -> None:
+        batch_request, self._reference_batch = self._reference_batch, ReferenceBatchRequest()
+        await self._send("references", batch_request)
+
+    async def _send(self, data_type: str, batch_request: BatchRequest) -> None:
+        if batch_request.is_empty():
+            return
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrent_requests)
+        semaphore = self._semaphore
+        await semaphore.acquire()
+        task = asyncio.ensure_future(self._create_data(data_type, batch_request, semaphore))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _wait(self) -> None:
+        if len(self._tasks) > 0:
+            await asyncio.gather(*self._tasks)
+
+    async def _create_data(
+        self, data_type: str, batch_request: BatchRequest, semaphore: asyncio.Semaphore
+    ) -> None:
+        params: Dict[str, str] = {}
+        if self._consistency_level is not None:
+            params["consistency_level"] = self._consistency_level.value
+        try:
+            body = self._connection.json_codec.dumps(batch_request.get_request_body())
+            try:
+                response = await self._connection.post(
+                    path="/batch/" + data_type, weaviate_object=body, params=params
+                )
+            except RequestsConnectionError as conn_err:
+                raise RequestsConnectionError("Batch was not added to weaviate.") from conn_err
+            result: Union[BatchResponse, None] = _decode_json_response_list(
+                response, f"Create {data_type} in batch"
+            )
+            if self._callback is not None:
+                self._callback(result or [])
+        except Exception as error:
+            # raised by `flush`, the task itself must not fail unobserved
+            self._errors.append(error)
+        finally:
+            semaphore.release()
@@ -0,0 +1,162 @@
+"""
+AsyncClient class definition.
+"""
+from typing import Any, Optional, Union
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.auth import AuthCredentials
+from weaviate.client import TIMEOUT_TYPE
+from weaviate.config import Config
+from weaviate.util import _get_valid_timeout_config
+from .batch import AsyncBatch
+from .connection import AsyncConnection
+from .data import AsyncDataObject
+from .query import AsyncQuery
+from .schema import AsyncSchema
+
+
+class AsyncClient:
+    """
+    A Weaviate client for asyncio applications. All requests share one connection pool and, if
+    a gRPC port is configured, one `grpc.aio` channel, so many concurrent queries can run on one
+    event loop without a thread per request. Requires `httpx`.
+
+    Attributes
+    ----------
+    batch : weaviate.aio.AsyncBatch
+        An AsyncBatch object instance connected to the same Weaviate instance as the Client.
+    data_object : weaviate.aio.AsyncDataObject
+        An AsyncDataObject object instance connected to the same Weaviate instance as the Client.
+    schema : weaviate.aio.AsyncSchema
+        An AsyncSchema object instance connected to the same Weaviate instance as the Client.
+    query : weaviate.aio.AsyncQuery
+        An AsyncQuery object instance connected to the same Weaviate instance as the Client.
+
+    Examples
+    --------
+    >>> async with weaviate.AsyncClient("http://localhost:8080") as client:
+    ...     result = await client.query.get("Article", ["title"]).with_limit(2).do()
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth_client_secret: Optional[AuthCredentials] = None,
+        timeout_config: TIMEOUT_TYPE = (10, 60),
+        proxies: Union[dict, str, None] = None,
+        trust_env: bool = False,
+        additional_headers: Optional[dict] = None,
+        additional_config: Optional[Config] = None,
+    ) -> None:
+        """
+        Initialize an AsyncClient class instance. The client is usable after `connect` or inside
+        an `async with` block.
+
+        Parameters
+        ----------
+        url : str
+            The URL to the weaviate instance.
+        auth_client_secret : weaviate.AuthApiKey, weaviate.AuthBearerToken or None, optional
+            Authenticate to weaviate with an API key or an existing access token. Access tokens are
+            not refreshed and the OIDC flows of `weaviate.Client` are not supported.
+        timeout_config : tuple(Real, Real) or Real, optional
+            Set the timeout configuration for all requests to the Weaviate server, see
+            `weaviate.Client`, by default (10, 60).
+        proxies : dict, str or None, optional
+            Proxies to be used for requests, see `weaviate.Client`, by default None.
+        trust_env : bool, optional
+            Whether to read proxies from the ENV variables, by default False.
+        additional_headers : dict or None
+            Additional headers to include in the requests, by default None.
+        additional_config: weaviate.Config, optional
+            The gRPC port and the `ConnectionConfig`, the pool size bounds the number of
+            concurrent HTTP requests.
+
+        Raises
+        ------
+        ImportError
+            If `httpx` is not installed.
+        TypeError
+            If arguments are of a wrong data type.
+        ValueError
+            If `auth_client_secret` needs an OIDC flow.
+        """
+        config = Config() if additional_config is None else additional_config
+        if not isinstance(url, str):
+            raise TypeError(f"URL is expected to be string but is {type(url)}")
+
+        self._connection = AsyncConnection(
+            url=url.strip("/"),
+            auth_client_secret=auth_client_secret,
+            timeout_config=_get_valid_timeout_config(timeout_config),
+            proxies=proxies,
+            trust_env=trust_env,
+            additional_headers=additional_headers,
+            connection_config=config.connection_config,
+            grpc_port=config.grpc_port_experimental,
+        )
+        self.schema = AsyncSchema(self._connection)
+        self.batch = AsyncBatch(self._connection)
+        self.data_object = AsyncDataObject(self._connection)
+        self.query = AsyncQuery(self._connection)
+
+    async def connect(self) -> None:
+        """
+        Connect to weaviate, i.e. get its version and open the gRPC channel.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+        await self._connection.connect()
+
+    async def close(self) -> None:
+        """
+        Close the connection pool and the gRPC channel.
+        """
+        await self._connection.close()
+
+    async def __aenter__(self) -> "AsyncClient":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        await self.close()
+
+    async def is_ready(self) -> bool:
+        """
+        Ping Weaviate's ready state
+
+        Returns
+        -------
+        bool
+            True if Weaviate is ready to accept requests,
+            False otherwise.
+        """
+
+        try:
+            response = await self._connection.get(path="/.well-known/ready")
+            return response.status_code == 200
+        except RequestsConnectionError:
+            return False
+
+    async def get_meta(self) -> dict:
+        """
+        Get the meta endpoint description of weaviate.
+
+        Returns
+        -------
+        dict
+            The dict describing the weaviate configuration.
+
+        Raises
+        ------
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        return await self._connection.get_meta()
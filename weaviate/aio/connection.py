@@ -0,0 +1,468 @@
+"""
+AsyncConnection class definition.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Optional, Union
+from urllib.parse import urlparse
+
+from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout
+
+from weaviate.auth import AuthApiKey, AuthBearerToken, AuthCredentials
+from weaviate.config import ConnectionConfig
+from weaviate.connect.connection import (
+    JSONPayload,
+    TIMEOUT_TYPE_RETURN,
+    _compress,
+    _get_proxies,
+    has_zstd,
+)
+from weaviate.connect.codec import _JSONCodec, get_json_codec
+from weaviate.connect.http2 import has_h2
+from weaviate.util import _decode_json_response_dict
+from weaviate.warnings import _Warnings
+
+try:
+    import httpx
+
+    has_httpx = True
+
+except ImportError:
+    has_httpx = False
+
+try:
+    import grpc  # type: ignore
+    import grpc.aio  # type: ignore
+    from weaviate.proto.v1 import weaviate_pb2_grpc
+
+    has_grpc = True
+
+except ImportError:
+    has_grpc = False
+
+
+class AsyncConnection:
+    """
+    Connection class used to communicate to a weaviate instance from an asyncio event loop. All
+    requests of one `AsyncConnection` share one connection pool, so concurrent requests do not
+    need a thread each.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        auth_client_secret: Optional[AuthCredentials],
+        timeout_config: TIMEOUT_TYPE_RETURN,
+        proxies: Union[dict, str, None],
+        trust_env: bool,
+        additional_headers: Optional[Dict[str, Any]],
+        connection_config: ConnectionConfig,
+        grpc_port: Optional[int] = None,
+    ):
+        """
+        Initialize an AsyncConnection class instance. No request is made before `connect`.
+
+        Parameters
+        ----------
+        url : str
+            URL to a running weaviate instance.
+        auth_client_secret : weaviate.AuthApiKey, weaviate.AuthBearerToken or None
+            Credentials to authenticate with a weaviate instance. Access tokens of an
+            `AuthBearerToken` are not refreshed.
+        timeout_config : tuple(float, float)
+            The timeout configuration for all requests to the Weaviate server:
+            (connect timeout, read timeout).
+        proxies : dict, str or None
+            Proxies to be used for requests, in the same format as for `weaviate.Client`.
+        trust_env : bool
+            Whether to read proxies from the ENV variables: (HTTP_PROXY or http_proxy, HTTPS_PROXY
+            or https_proxy).
+            NOTE: 'proxies' has priority over 'trust_env', i.e. if 'proxies' is NOT None,
+            'trust_env' is ignored.
+        additional_headers : Dict[str, Any] or None
+            Additional headers to include in the requests.
+        connection_config : weaviate.ConnectionConfig
+            The size of the connection pool, HTTP/2, the JSON codec and the compression of request
+            bodies.
+        grpc_port : int or None, optional
+            The port of the gRPC API of weaviate, by default None, i.e. only REST and GraphQL are
+            used.
+
+        Raises
+        ------
+        ImportError
+            If `httpx` is not installed, or `h2` if HTTP/2 is enabled, or `orjson` if it is
+            the configured JSON codec.
+        TypeError
+            If arguments are of a wrong data type.
+        ValueError
+            If `auth_client_secret` needs an OIDC flow.
+        """
+
+        if not has_httpx:
+            raise ImportError(
+                "The async client requires 'httpx', install it with 'pip install httpx'."
+            )
+        if auth_client_secret is not None and not isinstance(
+            auth_client_secret, (AuthApiKey, AuthBearerToken)
+        ):
+            raise ValueError(
+                "The async client supports only weaviate.AuthApiKey and weaviate.AuthBearerToken "
+                f"credentials. Given type: {type(auth_client_secret)}."
+            )
+
+        self._api_version_path = "/v1"
+        self.url = url
+        self._timeout_config = timeout_config
+        self._grpc_port = grpc_port
+        self._grpc_channel: Optional["grpc.aio.Channel"] = None
+        self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
+        self._server_version = ""
+
+        self._compression = connection_config.compression
+        self._compression_threshold = connection_config.compression_threshold
+        self._compression_level = connection_config.compression_level
+        if self._compression == "zstd" and not has_zstd:
+            raise ImportError(
+                "zstd compression requires 'zstandard', install it with 'pip install zstandard'."
+            )
+
+        self._json_codec = get_json_codec(connection_config.json_codec)
+
+        if connection_config.http2 and not has_h2:
+            raise ImportError(
+                "HTTP/2 requires 'httpx' and 'h2', install them with 'pip install httpx[http2]'."
+            )
+
+        self._headers = {"content-type": "application/json"}
+        if additional_headers is not None:
+            if not isinstance(additional_headers, dict):
+                raise TypeError(
+                    f"'additional_headers' must be of type dict or None. Given type: {type(additional_headers)}."
+                )
+            for key, value in additional_headers.items():
+                self._headers[key.lower()] = value
+
+        if "authorization" in self._headers and auth_client_secret is not None:
+            _Warnings.auth_header_and_auth_secret()
+            self._headers.pop("authorization")
+        if isinstance(auth_client_secret, AuthApiKey):
+            self._headers["authorization"] = "Bearer " + auth_client_secret.api_key
+        elif isinstance(auth_client_secret, AuthBearerToken):
+            self._headers["authorization"] = "Bearer " + auth_client_secret.access_token
+
+        proxies_dict = _get_proxies(proxies, trust_env)
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            http2=connection_config.http2,
+            timeout=httpx.Timeout(timeout_config[1], connect=timeout_config[0]),
+            limits=httpx.Limits(
+                max_connections=connection_config.session_pool_maxsize,
+                max_keepalive_connections=connection_config.session_pool_connections,
+            ),
+            mounts={
+                f"{scheme}://": httpx.AsyncHTTPTransport(proxy=proxy)
+                for scheme, proxy in proxies_dict.items()
+            },
+            trust_env=False,
+            event_hooks={"response": [self._decode_response]},
+        )
+
+    async def connect(self) -> None:
+        """
+        Get the version of the weaviate instance and open the gRPC channel if a `grpc_port` is
+        set and reachable.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if has_grpc and self._grpc_port is not None and self._grpc_channel is None:
+            host = urlparse(self.url).hostname
+            try:
+                # we're only pinging the port, 1s is plenty
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(host, self._grpc_port), 1.0
+                )
+                writer.close()
+                self._grpc_channel = grpc.aio.insecure_channel(f"{host}:{self._grpc_port}")
+                self._grpc_stub = weaviate_pb2_grpc.WeaviateStub(self._grpc_channel)
+            except (OSError, asyncio.TimeoutError):  # self._grpc_stub stays None
+                pass
+
+        self._server_version = (await self.get_meta())["version"]
+        if self._server_version < "1.14":
+            _Warnings.weaviate_server_older_than_1_14(self._server_version)
+
+    async def close(self) -> None:
+        """Close the connection pool and the gRPC channel."""
+        await self._client.aclose()
+        if self._grpc_channel is not None:
+            await self._grpc_channel.close()
+            self._grpc_channel = None
+            self._grpc_stub = None
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        content: Optional[bytes] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        Send a request and map the errors of `httpx` to the `requests` exceptions that the sync
+        client raises, so both clients can be handled the same way.
+        """
+
+        try:
+            return await self._client.request(
+                method,
+                self.url + self._api_version_path + path,
+                content=content,
+                params=params,
+                headers=headers,
+            )
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(str(error)) from error
+        except httpx.TransportError as error:
+            raise RequestsConnectionError(str(error)) from error
+
+    async def _decode_response(self, response: httpx.Response) -> None:
+        self._json_codec.decode_response(response)
+
+    async def _send_json(
+        self,
+        method: str,
+        path: str,
+        weaviate_object: Union[JSONPayload, bytes, None],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        if weaviate_object is None:
+            return await self._request(method, path, params=params)
+
+        headers: Optional[Dict[str, str]] = None
+        if isinstance(weaviate_object, bytes):
+            body = weaviate_object
+        else:
+            body = self._json_codec.dumps(weaviate_object)
+        if self._compression is not None and len(body) >= self._compression_threshold:
+            body = _compress(body, self._compression, self._compression_level)
+            headers = {"content-encoding": self._compression}
+        return await self._request(method, path, content=body, params=params, headers=headers)
+
+    async def delete(
+        self,
+        path: str,
+        weaviate_object: Optional[JSONPayload] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Make a DELETE request to the Weaviate server instance.
+
+        Parameters
+        ----------
+        path : str
+            Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
+            e.g. '/meta' or '/objects', without version.
+        weaviate_object : dict, optional
+            Object is used as payload for DELETE request. By default None.
+        params : dict, optional
+            Additional request parameters, by default None
+
+        Returns
+        -------
+        httpx.Response
+            The response, if request was successful.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the DELETE request could not be made.
+        """
+        return await self._send_json("DELETE", path, weaviate_object, params)
+
+    async def patch(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Make a PATCH request to the Weaviate server instance.
+
+        Parameters
+        ----------
+        path : str
+            Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
+            e.g. '/meta' or '/objects', without version.
+        weaviate_object : dict
+            Object is used as payload for PATCH request.
+        params : dict, optional
+            Additional request parameters, by default None
+
+        Returns
+        -------
+        httpx.Response
+            The response, if request was successful.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the PATCH request could not be made.
+        """
+        return await self._send_json("PATCH", path, weaviate_object, params)
+
+    async def post(
+        self,
+        path: str,
+        weaviate_object: Union[JSONPayload, bytes],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Make a POST request to the Weaviate server instance. If compression is configured in the
+        `ConnectionConfig`, payloads of at least `compression_threshold` bytes are compressed.
+
+        Parameters
+        ----------
+        path : str
+            Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
+            e.g. '/meta' or '/objects', without version.
+        weaviate_object : dict, list or bytes
+            Object is used as payload for POST request. Bytes are sent as already serialized JSON.
+        params : dict, optional
+            Additional request parameters, by default None
+
+        Returns
+        -------
+        httpx.Response
+            The response, if request was successful.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the POST request could not be made.
+        """
+        return await self._send_json("POST", path, weaviate_object, params)
+
+    async def put(
+        self,
+        path: str,
+        weaviate_object: JSONPayload,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """
+        Make a PUT request to the Weaviate server instance.
+
+        Parameters
+        ----------
+        path : str
+            Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
+            e.g. '/meta' or '/objects', without version.
+        weaviate_object : dict
+            Object is used as payload for PUT request.
+        params : dict, optional
+            Additional request parameters, by default None
+
+        Returns
+        -------
+        httpx.Response
+            The response, if request was successful.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the PUT request could not be made.
+        """
+        return await self._send_json("PUT", path, weaviate_object, params)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        Make a GET request.
+
+        Parameters
+        ----------
+        path : str
+            Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
+            e.g. '/meta' or '/objects', without version.
+        params : dict, optional
+            Additional request parameters, by default None
+
+        Returns
+        -------
+        httpx.Response
+            The response if request was successful.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the GET request could not be made.
+        """
+        return await self._request("GET", path, params=params)
+
+    async def head(self, path: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """
+        Make a HEAD request to the server.
+
+        Parameters
+        ----------
+        path : str
+            Sub-path to the resources. Must be a valid sub-path.
+            e.g. '/meta' or '/objects', without version.
+        params : dict, optional
+            Additional request parameters, by default None
+
+        Returns
+        -------
+        httpx.Response
+            The response to the request.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the HEAD request could not be made.
+        """
+        return await self._request("HEAD", path, params=params)
+
+    def get_current_bearer_token(self) -> str:
+        return self._headers.get("authorization", "")
+
+    @property
+    def timeout_config(self) -> TIMEOUT_TYPE_RETURN:
+        """
+        The timeout configuration for all requests to the Weaviate server:
+        (connect timeout, read timeout).
+        """
+        return self._timeout_config
+
+    @property
+    def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
+        return self._grpc_stub
+
+    @property
+    def json_codec(self) -> _JSONCodec:
+        """
+        The JSON codec used to encode the request bodies and decode the responses.
+        """
+        return self._json_codec
+
+    @property
+    def server_version(self) -> str:
+        """
+        Version of the weaviate instance, set by `connect`.
+        """
+        return self._server_version
+
+    async def get_meta(self) -> Dict[str, str]:
+        """
+        Returns the meta endpoint.
+        """
+        response = await self.get(path="/meta")
+        res = _decode_json_response_dict(response, "Meta endpoint")
+        assert res is not None
+        return res
@@ -0,0 +1,250 @@
+"""
+AsyncDataObject class definition.
+"""
+import uuid as uuid_lib
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.data.crud_data import (
+    _create_request,
+    _create_result,
+    _exists_result,
+    _get_request,
+    _get_result,
+    _object_request,
+    _update_path,
+    _update_request,
+)
+from weaviate.data.replication import ConsistencyLevel
+from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.types import UUID
+from .connection import AsyncConnection
+
+
+class AsyncDataObject:
+    """
+    AsyncDataObject class used to manipulate objects to/from Weaviate from an asyncio event loop.
+    The methods take the same arguments and raise the same exceptions as the methods of
+    `weaviate.data.DataObject`.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncDataObject class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.aio.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+
+    async def create(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID, None] = None,
+        vector: Optional[Sequence] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> str:
+        """
+        Takes a dict describing the object and adds it to Weaviate, see
+        `weaviate.data.DataObject.create`.
+
+        Returns
+        -------
+        str
+            Returns the UUID of the created object if successful.
+        """
+
+        weaviate_obj, params = _create_request(
+            data_object, class_name, uuid, vector, consistency_level, tenant
+        )
+        try:
+            response = await self._connection.post(
+                path="/objects", weaviate_object=weaviate_obj, params=params
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not added to Weaviate.") from conn_err
+        return _create_result(response, uuid)
+
+    async def update(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID],
+        vector: Optional[Sequence] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Update the given object with the already existing object in Weaviate, see
+        `weaviate.data.DataObject.update`.
+        """
+
+        weaviate_obj, params = _update_request(
+            data_object, class_name, uuid, vector, consistency_level, tenant
+        )
+        path = _update_path(self._connection.server_version, weaviate_obj)
+        try:
+            response = await self._connection.patch(
+                path=path, weaviate_object=weaviate_obj, params=params
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not updated.") from conn_err
+        if response.status_code == 204:
+            # Successful merge
+            return
+        raise UnexpectedStatusCodeException("Update of the object not successful", response)
+
+    async def replace(
+        self,
+        data_object: Union[dict, str],
+        class_name: str,
+        uuid: Union[str, uuid_lib.UUID],
+        vector: Optional[Sequence] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Replace an already existing object with the given data object, see
+        `weaviate.data.DataObject.replace`.
+        """
+
+        weaviate_obj, params = _update_request(
+            data_object, class_name, uuid, vector, consistency_level, tenant
+        )
+        path = _update_path(self._connection.server_version, weaviate_obj)
+        try:
+            response = await self._connection.put(
+                path=path, weaviate_object=weaviate_obj, params=params
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object was not replaced.") from conn_err
+        if response.status_code == 200:
+            # Successful update
+            return
+        raise UnexpectedStatusCodeException("Replace object", response)
+
+    async def get_by_id(
+        self,
+        uuid: Union[str, uuid_lib.UUID],
+        additional_properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+        class_name: Optional[str] = None,
+        node_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get an object as dict, see `weaviate.data.DataObject.get_by_id`.
+
+        Returns
+        -------
+        dict or None
+            dict describing the object or None if no object with this UUID exists.
+        """
+
+        return await self.get(
+            uuid=uuid,
+            additional_properties=additional_properties,
+            with_vector=with_vector,
+            class_name=class_name,
+            node_name=node_name,
+            consistency_level=consistency_level,
+            tenant=tenant,
+        )
+
+    async def get(
+        self,
+        uuid: Union[str, uuid_lib.UUID, None] = None,
+        additional_properties: Optional[List[str]] = None,
+        with_vector: bool = False,
+        class_name: Optional[str] = None,
+        node_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        limit: Optional[int] = None,
+        after: Optional[UUID] = None,
+        offset: Optional[int] = None,
+        sort: Optional[Dict[str, Union[str, bool, List[bool], List[str]]]] = None,
+        tenant: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Gets objects from Weaviate, see `weaviate.data.DataObject.get`.
+
+        Returns
+        -------
+        dict or None
+            A dict of the object or the objects, None if there is no object with this UUID.
+        """
+
+        path, params = _get_request(
+            server_version=self._connection.server_version,
+            uuid=uuid,
+            additional_properties=additional_properties,
+            with_vector=with_vector,
+            class_name=class_name,
+            node_name=node_name,
+            consistency_level=consistency_level,
+            limit=limit,
+            after=after,
+            offset=offset,
+            sort=sort,
+            tenant=tenant,
+        )
+        try:
+            response = await self._connection.get(path=path, params=params)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Could not get object/s.") from conn_err
+        return _get_result(response)
+
+    async def delete(
+        self,
+        uuid: Union[str, uuid_lib.UUID],
+        class_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> None:
+        """
+        Delete an existing object from Weaviate, see `weaviate.data.DataObject.delete`.
+        """
+
+        path, params = _object_request(
+            self._connection.server_version, uuid, class_name, consistency_level, tenant
+        )
+        try:
+            response = await self._connection.delete(path=path, params=params)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Object could not be deleted.") from conn_err
+        if response.status_code == 204:
+            # Successfully deleted
+            return
+        raise UnexpectedStatusCodeException("Delete object", response)
+
+    async def exists(
+        self,
+        uuid: Union[str, uuid_lib.UUID],
+        class_name: Optional[str] = None,
+        consistency_level: Optional[ConsistencyLevel] = None,
+        tenant: Optional[str] = None,
+    ) -> bool:
+        """
+        Check if the object exist in Weaviate, see `weaviate.data.DataObject.exists`.
+
+        Returns
+        -------
+        bool
+            True if object exists, False otherwise.
+        """
+
+        path, params = _object_request(
+            self._connection.server_version, uuid, class_name, consistency_level, tenant
+        )
+        try:
+            response = await self._connection.head(path=path, params=params)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Could not check if object exist.") from conn_err
+        return _exists_result(response)
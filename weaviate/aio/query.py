@@ -0,0 +1,194 @@
+"""
+AsyncQuery class definition.
+"""
+from typing import Any, Dict, Optional, cast
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.connect import Connection
+from weaviate.gql.aggregate import AggregateBuilder
+from weaviate.gql.get import GetBuilder, PROPERTIES
+from weaviate.util import _decode_json_response_dict
+from .connection import AsyncConnection
+
+try:
+    import grpc  # type: ignore
+except ImportError:
+    pass
+
+
+class AsyncQuery:
+    """
+    AsyncQuery class used to make `get` and/or `aggregate` GraphQL queries from an asyncio event
+    loop.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncQuery class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.aio.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+
+    def get(
+        self,
+        class_name: str,
+        properties: Optional[PROPERTIES] = None,
+    ) -> "AsyncGetBuilder":
+        """
+        Instantiate an AsyncGetBuilder for GraphQL `get` requests.
+
+        Parameters
+        ----------
+        class_name : str
+            Class name of the objects to interact with.
+        properties : list of str and ReferenceProperty, str or None
+            Properties of the objects to get, by default None
+
+        Returns
+        -------
+        AsyncGetBuilder
+            A GetBuilder whose `do` has to be awaited.
+        """
+        return AsyncGetBuilder(class_name, properties, self._connection)
+
+    def aggregate(self, class_name: str) -> "AsyncAggregateBuilder":
+        """
+        Instantiate an AsyncAggregateBuilder for GraphQL `aggregate` requests.
+
+        Parameters
+        ----------
+        class_name : str
+            Class name of the objects to be aggregated.
+
+        Returns
+        -------
+        AsyncAggregateBuilder
+            An AggregateBuilder whose `do` has to be awaited.
+        """
+        return AsyncAggregateBuilder(class_name, self._connection)
+
+    async def raw(self, gql_query: str) -> Dict[str, Any]:
+        """
+        Allows to send simple graph QL string queries, see `weaviate.gql.Query.raw`.
+        Be cautious of injection risks when generating query strings.
+
+        Parameters
+        ----------
+        gql_query : str
+            GraphQL query as a string.
+
+        Returns
+        -------
+        dict
+            Data response of the query.
+
+        Raises
+        ------
+        TypeError
+            If 'gql_query' is not of type str.
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+
+        if not isinstance(gql_query, str):
+            raise TypeError("Query is expected to be a string")
+
+        try:
+            response = await self._connection.post(
+                path="/graphql", weaviate_object={"query": gql_query}
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Query not executed.") from conn_err
+
+        res = _decode_json_response_dict(response, "GQL query failed")
+        assert res is not None
+        return res
+
+
+class AsyncGetBuilder(GetBuilder):
+    """
+    GetBuilder that runs the query on an `AsyncConnection`. It is built the same way as a
+    `GetBuilder`, only `do` has to be awaited.
+    """
+
+    def __init__(
+        self, class_name: str, properties: Optional[PROPERTIES], connection: AsyncConnection
+    ):
+        # building the query only reads the server version, the gRPC stub and the bearer token
+        super().__init__(class_name, properties, cast(Connection, connection))
+        self._async_connection = connection
+
+    async def do(self) -> dict:  # type: ignore[override]
+        """
+        Builds and runs the query.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+        if self._is_grpc_query():
+            try:
+                res = await self._async_connection.grpc_stub.Search(  # type: ignore
+                    self._grpc_request(), metadata=self._grpc_metadata()
+                )
+                return self._grpc_results(res)
+            except grpc.RpcError as e:
+                return {"errors": [e.details()]}
+        return await _run_graphql(self._async_connection, self.build())
+
+
+class AsyncAggregateBuilder(AggregateBuilder):
+    """
+    AggregateBuilder that runs the query on an `AsyncConnection`. It is built the same way as an
+    `AggregateBuilder`, only `do` has to be awaited.
+    """
+
+    def __init__(self, class_name: str, connection: AsyncConnection):
+        # building the query only reads the server version
+        super().__init__(class_name, cast(Connection, connection))
+        self._async_connection = connection
+
+    async def do(self) -> dict:  # type: ignore[override]
+        """
+        Builds and runs the query.
+
+        Returns
+        -------
+        dict
+            The response of the query.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status.
+        """
+        return await _run_graphql(self._async_connection, self.build())
+
+
+async def _run_graphql(connection: AsyncConnection, query: str) -> dict:
+    try:
+        response = await connection.post(path="/graphql", weaviate_object={"query": query})
+    except RequestsConnectionError as conn_err:
+        raise RequestsConnectionError("Query was not successful.") from conn_err
+
+    res = _decode_json_response_dict(response, "Query was not successful")
+    assert res is not None
+    return res
@@ -0,0 +1,137 @@
+"""
+AsyncSchema class definition.
+"""
+from typing import Optional, Union
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from weaviate.exceptions import UnexpectedStatusCodeException
+from weaviate.schema.crud_schema import _get_class_with_primitives, _get_complex_properties
+from weaviate.util import (
+    _capitalize_first_letter,
+    _decode_json_response_dict,
+    _get_dict_from_object,
+)
+from .connection import AsyncConnection
+
+
+class AsyncSchema:
+    """
+    AsyncSchema class used to interact with and manipulate the schema or classes from an asyncio
+    event loop. The methods take the same arguments and raise the same exceptions as the methods
+    of `weaviate.schema.Schema`.
+    """
+
+    def __init__(self, connection: AsyncConnection):
+        """
+        Initialize an AsyncSchema class instance.
+
+        Parameters
+        ----------
+        connection : weaviate.aio.AsyncConnection
+            Connection object to an active and running Weaviate instance.
+        """
+
+        self._connection = connection
+
+    async def create_class(self, schema_class: Union[dict, str]) -> None:
+        """
+        Create a single class as part of the schema in Weaviate, see
+        `weaviate.schema.Schema.create_class`.
+        """
+
+        loaded_schema_class = _get_dict_from_object(schema_class)
+        try:
+            response = await self._connection.post(
+                path="/schema", weaviate_object=_get_class_with_primitives(loaded_schema_class)
+            )
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Class may not have been created properly.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Create class", response)
+
+        path = "/schema/" + _capitalize_first_letter(loaded_schema_class["class"]) + "/properties"
+        for schema_property in _get_complex_properties(loaded_schema_class):
+            try:
+                response = await self._connection.post(path=path, weaviate_object=schema_property)
+            except RequestsConnectionError as conn_err:
+                raise RequestsConnectionError(
+                    "Property may not have been created properly."
+                ) from conn_err
+            if response.status_code != 200:
+                raise UnexpectedStatusCodeException("Add properties to classes", response)
+
+    async def delete_class(self, class_name: str) -> None:
+        """
+        Delete a schema class from Weaviate. This deletes all associated data, see
+        `weaviate.schema.Schema.delete_class`.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(f"Class name was {type(class_name)} instead of str")
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}"
+        try:
+            response = await self._connection.delete(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Deletion of class.") from conn_err
+        if response.status_code != 200:
+            raise UnexpectedStatusCodeException("Delete class from schema", response)
+
+    async def exists(self, class_name: str) -> bool:
+        """
+        Check if class exists in Weaviate, see `weaviate.schema.Schema.exists`.
+
+        Returns
+        -------
+        bool
+            True if the class exists,
+            False otherwise.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError(
+                f"'class_name' argument must be of type `str`! Given type: {type(class_name)}."
+            )
+
+        path = f"/schema/{_capitalize_first_letter(class_name)}"
+        try:
+            response = await self._connection.get(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError(
+                "Checking class existence could not be done."
+            ) from conn_err
+        if response.status_code == 200:
+            return True
+        elif response.status_code == 404:
+            return False
+
+        raise UnexpectedStatusCodeException("Check if class exists", response)
+
+    async def get(self, class_name: Optional[str] = None) -> dict:
+        """
+        Get the schema from Weaviate, or of a single class, see `weaviate.schema.Schema.get`.
+
+        Returns
+        -------
+        dict
+            A dict containing the schema. The schema may be empty.
+        """
+
+        path = "/schema"
+        if class_name is not None:
+            if not isinstance(class_name, str):
+                raise TypeError(
+                    "'class_name' argument must be of type `str`! "
+                    f"Given type: {type(class_name)}"
+                )
+            path = f"/schema/{_capitalize_first_letter(class_name)}"
+
+        try:
+            response = await self._connection.get(path=path)
+        except RequestsConnectionError as conn_err:
+            raise RequestsConnectionError("Schema could not be retrieved.") from conn_err
+
+        res = _decode_json_response_dict(response, "Get schema")
+        assert res is not None
+        return res
@@ -2,6 +2,20 @@
 Module for uploading objects and references to Weaviate in batches.
 """
 
+from .controller import AIMDBatchSizeController, BatchSizeController, ControllerSample
 from .crud_batch import Batch
+from .futures import BatchItemFuture
+from .metrics import BatchRequestMetrics, BatchStats
+from .processes import ProcessImportResult, import_with_processes
 
-__all__ = ["Batch"]
+__all__ = [
+    "Batch",
+    "BatchItemFuture",
+    "BatchSizeController",
+    "AIMDBatchSizeController",
+    "ControllerSample",
+    "BatchRequestMetrics",
+    "BatchStats",
+    "ProcessImportResult",
+    "import_with_processes",
+]
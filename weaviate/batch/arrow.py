@@ -0,0 +1,91 @@
+"""
+Conversion of Apache Arrow record batches to the columnar format of `Batch.add_data_objects`.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+ArrowColumns = Tuple[Dict[str, list], Optional[Any], Optional[list], Optional[list]]
+
+
+def _record_batch_to_columns(
+    record_batch: Any,
+    vector_column: Optional[str],
+    id_column: Optional[str],
+    tenant_column: Optional[str],
+    properties: Optional[Sequence[str]],
+) -> ArrowColumns:
+    """
+    Convert one Arrow record batch to property columns, vectors, UUIDs and tenants.
+
+    Parameters
+    ----------
+    record_batch : pyarrow.RecordBatch
+        The record batch to convert.
+    vector_column : Optional[str]
+        The name of the column that contains the vectors. Must be a (fixed size) list column.
+    id_column : Optional[str]
+        The name of the column that contains the UUIDs as strings.
+    tenant_column : Optional[str]
+        The name of the column that contains the tenants.
+    properties : Optional[Sequence[str]]
+        The names of the property columns. If None all other columns are used.
+
+    Returns
+    -------
+    ArrowColumns
+        The property columns as lists, the vectors as 2D `numpy.ndarray` (or list of lists), the
+        UUIDs and the tenants.
+
+    Raises
+    ------
+    ValueError
+        If one of the given columns does not exist.
+    """
+
+    names: List[str] = record_batch.schema.names
+    special_columns = {vector_column, id_column, tenant_column} - {None}
+    for name in list(special_columns) + list(properties or []):
+        if name not in names:
+            raise ValueError(f"Column '{name}' does not exist. Available columns: {names}")
+
+    if properties is None:
+        properties = [name for name in names if name not in special_columns]
+
+    columns = {name: record_batch.column(name).to_pylist() for name in properties}
+    vectors = (
+        _vectors_to_numpy(record_batch.column(vector_column)) if vector_column is not None else None
+    )
+    uuids = record_batch.column(id_column).to_pylist() if id_column is not None else None
+    tenants = record_batch.column(tenant_column).to_pylist() if tenant_column is not None else None
+    return columns, vectors, uuids, tenants
+
+
+def _vectors_to_numpy(column: Any) -> Any:
+    """
+    Convert a list column of vectors to a 2D `numpy.ndarray` without creating a Python float for
+    every element. Falls back to a list of lists for variable size lists of different lengths.
+
+    Parameters
+    ----------
+    column : pyarrow.Array
+        A `FixedSizeListArray` or `ListArray` with one vector per row.
+
+    Returns
+    -------
+    numpy.ndarray or list
+        The vectors, one per row.
+    """
+
+    if column.null_count > 0:
+        raise ValueError("The vector column must not contain null values.")
+
+    list_size = getattr(column.type, "list_size", None)
+    if list_size is None:
+        # variable size lists, only reshape if all vectors have the same length
+        offsets = column.offsets.to_numpy()
+        lengths = set((offsets[1:] - offsets[:-1]).tolist())
+        if len(lengths) != 1:
+            return column.to_pylist()
+        list_size = lengths.pop()
+
+    values = column.flatten().to_numpy(zero_copy_only=False)
+    return values.reshape(len(column), list_size)
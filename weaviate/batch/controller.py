@@ -0,0 +1,252 @@
+"""
+Controllers that decide the size of object batches and the number of workers from the observed
+batch request latencies.
+"""
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from numbers import Real
+from typing import Deque, List, Optional
+
+from ..util import _check_positive_num
+
+
+@dataclass(frozen=True)
+class ControllerSample:
+    """
+    One decision of a `BatchSizeController`.
+
+    Parameters
+    ----------
+    timestamp : float
+        The time of the decision in seconds since epoch.
+    batch_size : int
+        The batch size after the decision.
+    num_workers : int
+        The number of workers after the decision.
+    latency : Optional[float]
+        The latency (in seconds) the decision was based on, None if it was caused by a timeout.
+    """
+
+    timestamp: float
+    batch_size: int
+    num_workers: int
+    latency: Optional[float]
+
+
+class BatchSizeController(ABC):
+    """
+    BatchSizeController abstract class used as an interface for policies that adapt the batch
+    size and the number of workers of dynamic batching. Implementations must be thread-safe, as
+    `observe` is called from all worker threads.
+    """
+
+    @abstractmethod
+    def reset(self, batch_size: int, num_workers: int) -> None:
+        """
+        Reset the controller to the configured starting values.
+
+        Parameters
+        ----------
+        batch_size : int
+            The initial batch size.
+        num_workers : int
+            The initial number of workers.
+        """
+
+    @abstractmethod
+    def observe(self, num_objects: int, latency: Optional[float]) -> None:
+        """
+        Record the outcome of one objects batch request.
+
+        Parameters
+        ----------
+        num_objects : int
+            The number of objects in the batch request.
+        latency : Optional[float]
+            How long the batch request took in seconds, None if it timed out.
+        """
+
+    @property
+    @abstractmethod
+    def batch_size(self) -> int:
+        """The recommended number of objects per batch."""
+
+    @property
+    @abstractmethod
+    def num_workers(self) -> int:
+        """The recommended number of concurrent batch requests."""
+
+
+class AIMDBatchSizeController(BatchSizeController):
+    """
+    Additive-increase/multiplicative-decrease policy that targets a percentile of the batch
+    request latency. After every `window` batch requests the percentile of their latencies is
+    compared to `target_latency`: if it is lower the batch size grows by `additive_increase`,
+    otherwise it is multiplied by `multiplicative_decrease`. A timeout decreases the batch size
+    immediately. Once the batch size reached `max_batch_size` another worker is added, and once
+    it reached `min_batch_size` and the latency is still too high a worker is removed.
+
+    Parameters
+    ----------
+    target_latency : float, optional
+        The targeted latency of a batch request in seconds, by default 2.
+    percentile : float, optional
+        The latency percentile compared to `target_latency`, between 0 and 1, by default 0.95.
+    additive_increase : int, optional
+        By how many objects the batch size grows, by default 50.
+    multiplicative_decrease : float, optional
+        The factor the batch size is multiplied with when it shrinks, between 0 and 1,
+        by default 0.5.
+    min_batch_size : int, optional
+        The smallest batch size, by default 1.
+    max_batch_size : int, optional
+        The largest batch size, by default 1000.
+    max_num_workers : int, optional
+        The largest number of workers, by default 4.
+    window : int, optional
+        The number of batch requests a decision is based on, by default 10.
+    max_samples : int, optional
+        How many decisions are kept in `history`, by default 1000.
+    """
+
+    def __init__(
+        self,
+        target_latency: float = 2,
+        percentile: float = 0.95,
+        additive_increase: int = 50,
+        multiplicative_decrease: float = 0.5,
+        min_batch_size: int = 1,
+        max_batch_size: int = 1000,
+        max_num_workers: int = 4,
+        window: int = 10,
+        max_samples: int = 1000,
+    ):
+        _check_positive_num(target_latency, "target_latency", Real)
+        _check_positive_num(additive_increase, "additive_increase", int)
+        _check_positive_num(min_batch_size, "min_batch_size", int)
+        _check_positive_num(max_batch_size, "max_batch_size", int)
+        _check_positive_num(max_num_workers, "max_num_workers", int)
+        _check_positive_num(window, "window", int)
+        _check_positive_num(max_samples, "max_samples", int)
+        if not 0 < percentile <= 1:
+            raise ValueError(f"'percentile' must be in (0, 1]. Given value: {percentile}.")
+        if not 0 < multiplicative_decrease < 1:
+            raise ValueError(
+                "'multiplicative_decrease' must be in (0, 1). "
+                f"Given value: {multiplicative_decrease}."
+            )
+        if min_batch_size > max_batch_size:
+            raise ValueError("'min_batch_size' must not be larger than 'max_batch_size'.")
+
+        self._target_latency = target_latency
+        self._percentile = percentile
+        self._additive_increase = additive_increase
+        self._multiplicative_decrease = multiplicative_decrease
+        self._min_batch_size = min_batch_size
+        self._max_batch_size = max_batch_size
+        self._max_num_workers = max_num_workers
+        self._window = window
+
+        self._lock = threading.Lock()
+        self._latencies: List[float] = []
+        self._history: Deque[ControllerSample] = deque(maxlen=max_samples)
+        self._batch_size = min_batch_size
+        self._num_workers = 1
+
+    def reset(self, batch_size: int, num_workers: int) -> None:
+        with self._lock:
+            self._batch_size = min(max(batch_size, self._min_batch_size), self._max_batch_size)
+            self._num_workers = min(num_workers, self._max_num_workers)
+            self._latencies = []
+            self._history.clear()
+
+    def observe(self, num_objects: int, latency: Optional[float]) -> None:
+        with self._lock:
+            if latency is None:
+                self._decrease()
+                self._record(None)
+                return
+
+            self._latencies.append(latency)
+            if len(self._latencies) < self._window:
+                return
+
+            observed = _percentile(self._latencies, self._percentile)
+            self._latencies = []
+            if observed > self._target_latency:
+                self._decrease()
+            elif self._batch_size < self._max_batch_size:
+                self._batch_size = min(
+                    self._batch_size + self._additive_increase, self._max_batch_size
+                )
+            elif self._num_workers < self._max_num_workers:
+                self._num_workers += 1
+            self._record(observed)
+
+    def _decrease(self) -> None:
+        """Shrink the batch size, or the number of workers if the batch size is the smallest."""
+
+        if self._batch_size == self._min_batch_size and self._num_workers > 1:
+            self._num_workers -= 1
+        self._batch_size = max(
+            int(self._batch_size * self._multiplicative_decrease), self._min_batch_size
+        )
+        self._latencies = []
+
+    def _record(self, latency: Optional[float]) -> None:
+        self._history.append(
+            ControllerSample(
+                timestamp=time.time(),
+                batch_size=self._batch_size,
+                num_workers=self._num_workers,
+                latency=latency,
+            )
+        )
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    @property
+    def num_workers(self) -> int:
+        return self._num_workers
+
+    @property
+    def history(self) -> List[ControllerSample]:
+        """
+        The decisions of the controller, oldest first. Shows how batch size and number of workers
+        converge.
+
+        Returns
+        -------
+        List[ControllerSample]
+            The recorded decisions.
+        """
+
+        with self._lock:
+            return list(self._history)
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """
+    Nearest-rank percentile of a non-empty list of values.
+
+    Parameters
+    ----------
+    values : List[float]
+        The values.
+    percentile : float
+        The percentile between 0 and 1.
+
+    Returns
+    -------
+    float
+        The percentile of the values.
+    """
+
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percentile * len(ordered)) - 1, 0)]
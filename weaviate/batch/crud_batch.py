@@ -2,11 +2,16 @@
 Batch class definitions.
 """
 import datetime
+import heapq
+import itertools
+import os
+import queue
 import sys
 import threading
 import time
 import warnings
-from collections import deque
+from array import array
+from collections import Counter, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed, Future
 from dataclasses import dataclass, field
 from numbers import Real
@@ -16,6 +21,7 @@ from typing import (
     Deque,
     Dict,
     List,
+    Mapping,
     Optional,
     Sequence,
     Set,
@@ -34,14 +40,26 @@ from weaviate.connect import Connection
 from weaviate.data.replication import ConsistencyLevel
 from weaviate.gql.filter import _find_value_type, VALUE_ARRAY_TYPES, WHERE_OPERATORS
 from weaviate.types import UUID
-from .requests import BatchRequest, ObjectsBatchRequest, ReferenceBatchRequest, BatchResponse
+from .arrow import _record_batch_to_columns
+from .controller import BatchSizeController
+from .futures import BatchItemFuture
+from .metrics import BatchRequestMetrics, BatchStats
+from .spool import BatchSpool
+from .requests import (
+    BatchRequest,
+    ObjectsBatchRequest,
+    ReferenceBatchRequest,
+    BatchResponse,
+    CopyObjects,
+    _approximate_size,
+)
 from ..cluster import Cluster
 from ..error_msgs import (
     BATCH_REF_DEPRECATION_NEW_V14_CLS_NS_W,
     BATCH_REF_DEPRECATION_OLD_V14_CLS_NS_W,
     BATCH_EXECUTOR_SHUTDOWN_W,
 )
-from ..exceptions import UnexpectedStatusCodeException
+from ..exceptions import BatchItemFailedException, UnexpectedStatusCodeException
 from ..util import (
     _capitalize_first_letter,
     check_batch_result,
@@ -51,9 +69,53 @@ from ..util import (
 )
 from ..warnings import _Warnings
 
+_MAX_PARALLEL_RECOVERY_REQUESTS = 10
+# ints beyond these bounds lose precision as doubles or do not fit int64, they are sent over REST
+_MAX_EXACT_DOUBLE_INT = 2**53
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+
+try:
+    import grpc  # type: ignore
+    from weaviate.proto.v1 import base_pb2, batch_pb2
+except ImportError:
+    pass
+
 BatchRequestType = Union[ObjectsBatchRequest, ReferenceBatchRequest]
 
 
+def _aggregate_batch_stats(nodes: List[Dict[str, Any]]) -> Optional[Tuple[float, float]]:
+    """
+    Aggregate the batch statistics of all nodes of the cluster.
+
+    Parameters
+    ----------
+    nodes : List[Dict[str, Any]]
+        The nodes as returned by `Cluster.get_nodes_status`.
+
+    Returns
+    -------
+    Optional[Tuple[float, float]]
+        The summed up rate (objects per second) of all nodes and the highest ratio of queue length
+        to rate of all nodes, i.e. how many seconds the most congested node needs to process its
+        queue. Nodes that did not measure a rate yet, e.g. at the start of an import or after they
+        were added to the cluster, are left out of the ratio. None if the nodes do not report
+        batch statistics.
+    """
+
+    if len(nodes) == 0 or any("batchStats" not in node for node in nodes):
+        return None
+
+    rate = 0.0
+    ratio = 0.0
+    for node in nodes:
+        node_rate = node["batchStats"].get("ratePerSecond", 0)
+        node_queue_length = node["batchStats"].get("queueLength", 0)
+        rate += node_rate
+        if node_queue_length > 0 and node_rate > 0:
+            ratio = max(ratio, node_queue_length / node_rate)
+    return rate, ratio
+
+
 @dataclass
 class Shard:
     class_name: str
@@ -85,17 +147,30 @@ class WeaviateErrorRetryConf:
 
         Example: errors_to_include =["string1", "string2"] will match the error with message "Long error message that
         contains string1".
+    backoff: Optional[Real]
+        If set, failed objects are not retried right away on the same worker thread. Instead they are put into a delayed
+        retry queue and merged into later batches once their backoff is over. The backoff of an object starts at
+        `backoff` seconds and doubles with every attempt, up to `max_backoff`. `number_retries` is then the number of
+        retries per object, and every object passed to the batch callback has an "attempts" entry with the number of
+        times it was sent. Only used with auto-created batches and `flush`. By default None.
+    max_backoff: Real
+        The maximal backoff of an object in seconds, by default 60.
     """
 
     number_retries: int = 3
     errors_to_exclude: Optional[List[str]] = None
     errors_to_include: Optional[List[str]] = None
+    backoff: Optional[Real] = None
+    max_backoff: Real = cast(Real, 60)
 
     def __post_init__(self) -> None:
         if self.errors_to_exclude is not None and self.errors_to_include is not None:
             raise ValueError(self.__module__ + " can either include or exclude errors")
 
         _check_positive_num(self.number_retries, "number_retries", int)
+        if self.backoff is not None:
+            _check_positive_num(self.backoff, "backoff", Real)
+        _check_positive_num(self.max_backoff, "max_backoff", Real)
 
         def check_lists(error_list: Optional[List[str]]) -> None:
             if error_list is None:
@@ -170,6 +245,12 @@ class Batch:
         manager it calls the `flush` method for you. Can be combined with `configure`/`__call__`
         method, in order to set it to the desired Case.
 
+    Thread safety: One Batch can be shared by many producer threads, e.g. parallel parsers,
+        which then share its connection pool, its workers and its dynamic batch size. The objects
+        and references are copied and validated in the calling thread, only appending them to
+        the current batches is serialized. Configure the batch before the producer threads start
+        and call `flush` (or leave the context manager) after they all finished.
+
     Examples
     --------
     Here are examples for each CASE described above. Here `client` is an instance of the
@@ -283,6 +364,7 @@ class Batch:
         self._objects_throughput_frame: Deque[float] = deque(maxlen=5)
         self._references_throughput_frame: Deque[float] = deque(maxlen=5)
         self._future_pool: List[Future[Tuple[Union[Response, None], int]]] = []
+        self._wave_objects: Dict[str, Future[Tuple[Union[Response, None], int]]] = {}
         self._reference_batch_queue: List[ReferenceBatchRequest] = []
         self._callback_lock = threading.Lock()
 
@@ -300,10 +382,66 @@ class Batch:
         self.__imported_shards: Set[Shard] = set()
 
         self._num_workers = 1
+        # the number of workers of the BatchExecutor, adapted by the batch size controller
+        self._active_num_workers = 1
         self._consistency_level: Optional[ConsistencyLevel] = None
+        self._copy_objects: CopyObjects = True
+        self._batch_size_controller: Optional[BatchSizeController] = None
+        self._metrics_callback: Optional[Callable[[BatchRequestMetrics], None]] = None
+        self._max_batch_bytes: Optional[int] = None
+        self._max_buffered_bytes: Optional[int] = None
+        self._min_bisect_size: Optional[int] = None
+        self._max_linger_ms: Optional[int] = None
+        # guards the current batches, which the linger thread sends as well; it is only held to
+        # add items and to take the batches, never while they are sent
+        self._batch_lock = threading.RLock()
+        # serializes the sending of the taken batches, acquired before `_batch_lock`
+        self._send_lock = threading.RLock()
+        self._oldest_item_time: Optional[float] = None
+        self._linger_event: Optional[threading.Event] = None
+        self._linger_thread: Optional[threading.Thread] = None
+        # bytes of batch requests that were handed over to the workers, freed when they are done
+        self._buffer_condition = threading.Condition()
+        self._in_flight_bytes = 0
+        self._queued_reference_bytes = 0
+        self._reserved_bytes: Dict[int, int] = {}
+        self._spool: Optional[BatchSpool] = None
+        # sealed spool segments that are only kept on disk until there is buffer space to send them
+        self._spilled_segments: Deque[int] = deque()
+        # sealed segment whose objects or references are still in the current batches
+        self._carried_segment: Optional[int] = None
+        # futures of the items of spilled segments, in the order of the objects and the references
+        self._spilled_futures: Dict[int, Dict[str, Deque[Optional[BatchItemFuture]]]] = {}
+        # items that failed with a retryable error: heap of (due time, sequence number, type, item,
+        # future, spool segment)
+        self._retry_queue: List[
+            Tuple[float, int, str, Dict[str, Any], Optional[BatchItemFuture], Optional[int]]
+        ] = []
+        self._retry_attempts: Dict[Tuple[Optional[str], ...], int] = {}
+        # UUID -> number of objects with this UUID that wait for a retry or whose retry is in flight
+        self._retrying_objects: Dict[str, int] = {}
+        self._retry_lock = threading.Lock()
+        self._retry_ids = itertools.count()
+        self._counters: Counter = Counter()
+        self._counters_lock = threading.Lock()
+        # set to False if weaviate does not implement the gRPC batch endpoint, REST is used instead
+        self._grpc_batching = True
+        self._grpc_lock = threading.Lock()
         # thread pool executor
         self._executor: Optional[BatchExecutor] = None
 
+        # streaming mode: long-lived sender threads that consume batch requests from a queue
+        self._streaming = False
+        self._max_queued_batches: Optional[int] = None
+        self._send_queue: "queue.Queue[Optional[Tuple[str, int, BatchRequest]]]" = queue.Queue()
+        self._send_slots: Optional[threading.BoundedSemaphore] = None
+        self._sender_threads: List[threading.Thread] = []
+        self._sender_lock = threading.Lock()
+        self._sender_error: Optional[Exception] = None
+        self._batch_ids = itertools.count()
+        self._objects_in_flight: Dict[str, int] = {}
+        self._waiting_references: List[Tuple[Set[int], ReferenceBatchRequest]] = []
+
     def __call__(self, **kwargs: Any) -> "Batch":
         """
         WARNING: This method will be deprecated in the next major release. Use `configure` instead.
@@ -336,6 +474,66 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        streaming : bool, optional
+            Whether to send batches from `num_workers` long-lived background threads that consume a
+            bounded queue. `add_data_object` and `add_reference` only block when the queue is full
+            instead of waiting for every in-flight request. Errors raised by the background threads
+            are re-raised on the next auto-create or `flush`. By default False.
+        max_queued_batches : Optional[int], optional
+            The maximal number of batch requests that are queued or in-flight in streaming mode.
+            If None it is set to `2 * num_workers`, by default None.
+        copy_objects : bool or "shallow", optional
+            How `add_data_object` stores the given objects. True stores a deep copy, so the
+            object can be modified after adding it. "shallow" copies only the top-level dict, use
+            it if only top-level keys are modified after adding. False stores the object itself
+            without copying, i.e. the batch takes ownership and the object must not be modified
+            afterwards. By default True.
+        batch_size_controller : Optional[BatchSizeController], optional
+            A policy that adapts the number of objects per batch and `num_workers` to the observed
+            batch request latencies, e.g. `weaviate.batch.AIMDBatchSizeController`. Replaces the
+            built-in dynamic batch sizing and is used ONLY with dynamic batching. `batch_size` and
+            `num_workers` are the starting values. In streaming mode only the batch size is
+            adapted. By default None.
+        metrics_callback : Optional[Callable[[BatchRequestMetrics], None]], optional
+            A function that is called with the `weaviate.batch.BatchRequestMetrics` (timings,
+            size and retries) of every successful batch request. It is called from the worker
+            threads. See also `Batch.stats` for the overall counters. By default None.
+        max_batch_bytes : Optional[int], optional
+            The maximal approximate size of the request body of one objects batch in bytes. If
+            set, the batch is also created when the added objects reach this size and larger
+            batches are split before they are sent. Use it to stay below the body size limit of
+            the server (or proxy) and to avoid timeouts with large objects. Estimating the size
+            serializes every object once more when it is added. By default None.
+        max_buffered_bytes : Optional[int], optional
+            The maximal approximate size in bytes of all objects and references held by the
+            batch, i.e. the current batches plus the queued and in-flight batch requests. If it
+            is exceeded, `add_data_object`, `add_data_objects` and `add_reference` block until
+            batch requests are done. Use it to bound the memory usage of an import when weaviate
+            is slower than the producer. The sizes are those of the JSON request bodies, the
+            memory used by the Python objects is a multiple of it. See `buffered_bytes` for the
+            current usage. By default None.
+        spool_dir : Optional[str], optional
+            A directory for a write-ahead log of all added objects and references. They are
+            written to disk before they are sent and deleted once weaviate acknowledged them, so
+            an import can be continued with `resume` after a crash without sending everything
+            again. If `max_buffered_bytes` is set as well, batch requests that exceed it are
+            spilled to disk instead of blocking `add_data_object`, and sent from disk later.
+            By default None.
+        min_bisect_size : Optional[int], optional
+            If set, a batch request that fails with a server error (status code 5xx) or times
+            out is split in half and both halves are sent separately, instead of retrying it
+            after `timeout_retries`, recursively down to `min_bisect_size` items. This isolates the objects or references
+            that make weaviate fail, e.g. huge texts for a vectorizer, without reducing the
+            batch size of all healthy data. The isolated items are passed to the `callback` with
+            the error as their result, see also `Batch.stats`. Only used with auto-created
+            batches and `flush`. By default None.
+        max_linger_ms : Optional[int], optional
+            The maximal time in milliseconds an object or reference waits in a partially filled
+            batch. If set, a background thread sends the current batches once their oldest item
+            waited this long, which bounds the latency from adding an item to sending it when
+            items arrive slowly. Full batches are still sent right away. Only used with
+            auto-created batches. Errors of the background thread are re-raised on the next
+            auto-create or `flush`. By default None.
 
         Returns
         -------
@@ -363,6 +561,16 @@ class Batch:
         dynamic: bool = True,
         num_workers: int = 1,
         consistency_level: Optional[ConsistencyLevel] = None,
+        streaming: bool = False,
+        max_queued_batches: Optional[int] = None,
+        copy_objects: CopyObjects = True,
+        batch_size_controller: Optional[BatchSizeController] = None,
+        metrics_callback: Optional[Callable[[BatchRequestMetrics], None]] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_buffered_bytes: Optional[int] = None,
+        spool_dir: Optional[str] = None,
+        min_bisect_size: Optional[int] = None,
+        max_linger_ms: Optional[int] = None,
     ) -> "Batch":
         """
         Warnings
@@ -400,6 +608,66 @@ class Batch:
             The maximal number of concurrent threads to run batch import. Only used for non-MANUAL
             batching. i.e. is used only with AUTO or DYNAMIC batching.
             By default, the multi-threading is disabled. Use with care to not overload your weaviate instance.
+        streaming : bool, optional
+            Whether to send batches from `num_workers` long-lived background threads that consume a
+            bounded queue. `add_data_object` and `add_reference` only block when the queue is full
+            instead of waiting for every in-flight request. Errors raised by the background threads
+            are re-raised on the next auto-create or `flush`. By default False.
+        max_queued_batches : Optional[int], optional
+            The maximal number of batch requests that are queued or in-flight in streaming mode.
+            If None it is set to `2 * num_workers`, by default None.
+        copy_objects : bool or "shallow", optional
+            How `add_data_object` stores the given objects. True stores a deep copy, so the
+            object can be modified after adding it. "shallow" copies only the top-level dict, use
+            it if only top-level keys are modified after adding. False stores the object itself
+            without copying, i.e. the batch takes ownership and the object must not be modified
+            afterwards. By default True.
+        batch_size_controller : Optional[BatchSizeController], optional
+            A policy that adapts the number of objects per batch and `num_workers` to the observed
+            batch request latencies, e.g. `weaviate.batch.AIMDBatchSizeController`. Replaces the
+            built-in dynamic batch sizing and is used ONLY with dynamic batching. `batch_size` and
+            `num_workers` are the starting values. In streaming mode only the batch size is
+            adapted. By default None.
+        metrics_callback : Optional[Callable[[BatchRequestMetrics], None]], optional
+            A function that is called with the `weaviate.batch.BatchRequestMetrics` (timings,
+            size and retries) of every successful batch request. It is called from the worker
+            threads. See also `Batch.stats` for the overall counters. By default None.
+        max_batch_bytes : Optional[int], optional
+            The maximal approximate size of the request body of one objects batch in bytes. If
+            set, the batch is also created when the added objects reach this size and larger
+            batches are split before they are sent. Use it to stay below the body size limit of
+            the server (or proxy) and to avoid timeouts with large objects. Estimating the size
+            serializes every object once more when it is added. By default None.
+        max_buffered_bytes : Optional[int], optional
+            The maximal approximate size in bytes of all objects and references held by the
+            batch, i.e. the current batches plus the queued and in-flight batch requests. If it
+            is exceeded, `add_data_object`, `add_data_objects` and `add_reference` block until
+            batch requests are done. Use it to bound the memory usage of an import when weaviate
+            is slower than the producer. The sizes are those of the JSON request bodies, the
+            memory used by the Python objects is a multiple of it. See `buffered_bytes` for the
+            current usage. By default None.
+        spool_dir : Optional[str], optional
+            A directory for a write-ahead log of all added objects and references. They are
+            written to disk before they are sent and deleted once weaviate acknowledged them, so
+            an import can be continued with `resume` after a crash without sending everything
+            again. If `max_buffered_bytes` is set as well, batch requests that exceed it are
+            spilled to disk instead of blocking `add_data_object`, and sent from disk later.
+            By default None.
+        min_bisect_size : Optional[int], optional
+            If set, a batch request that fails with a server error (status code 5xx) or times
+            out is split in half and both halves are sent separately, instead of retrying it
+            after `timeout_retries`, recursively down to `min_bisect_size` items. This isolates the objects or references
+            that make weaviate fail, e.g. huge texts for a vectorizer, without reducing the
+            batch size of all healthy data. The isolated items are passed to the `callback` with
+            the error as their result, see also `Batch.stats`. Only used with auto-created
+            batches and `flush`. By default None.
+        max_linger_ms : Optional[int], optional
+            The maximal time in milliseconds an object or reference waits in a partially filled
+            batch. If set, a background thread sends the current batches once their oldest item
+            waited this long, which bounds the latency from adding an item to sending it when
+            items arrive slowly. Full batches are still sent right away. Only used with
+            auto-created batches. Errors of the background thread are re-raised on the next
+            auto-create or `flush`. By default None.
 
         Returns
         -------
@@ -414,6 +682,19 @@ class Batch:
             If the value of one of the arguments is wrong.
         """
         self.consistency_level = consistency_level
+        if not isinstance(copy_objects, bool) and copy_objects != "shallow":
+            raise ValueError(
+                f"'copy_objects' must be True, False or 'shallow'. Given value: {copy_objects}."
+            )
+        self._copy_objects = copy_objects
+        if batch_size_controller is not None and not isinstance(
+            batch_size_controller, BatchSizeController
+        ):
+            raise TypeError(
+                f"'batch_size_controller' must be of type {BatchSizeController}. "
+                f"Given type: {type(batch_size_controller)}."
+            )
+        self._batch_size_controller = batch_size_controller
         if creation_time is not None:
             _check_positive_num(creation_time, "creation_time", Real)
             self._creation_time = creation_time
@@ -424,12 +705,46 @@ class Batch:
         _check_non_negative(connection_error_retries, "connection_error_retries", int)
 
         self._callback = callback
+        self._metrics_callback = metrics_callback
+        if max_batch_bytes is not None:
+            _check_positive_num(max_batch_bytes, "max_batch_bytes", int)
+            self._objects_batch.track_size()
+        self._max_batch_bytes = max_batch_bytes
+        if max_buffered_bytes is not None:
+            _check_positive_num(max_buffered_bytes, "max_buffered_bytes", int)
+            self._objects_batch.track_size()
+        self._max_buffered_bytes = max_buffered_bytes
+        if min_bisect_size is not None:
+            _check_positive_num(min_bisect_size, "min_bisect_size", int)
+        self._min_bisect_size = min_bisect_size
+        if max_linger_ms is not None:
+            _check_positive_num(max_linger_ms, "max_linger_ms", int)
+        if max_linger_ms != self._max_linger_ms:
+            self._stop_linger_thread()
+        self._max_linger_ms = max_linger_ms
+        # send the spilled segments before the spool is replaced
+        if (
+            self._spool is not None
+            and len(self._spilled_segments) > 0
+            and (spool_dir is None or self._spool.directory != os.path.abspath(spool_dir))
+        ):
+            self.flush()
+        if spool_dir is None:
+            self._spool = None
+            self._carried_segment = None
+        elif self._spool is None or self._spool.directory != os.path.abspath(spool_dir):
+            self._spool = BatchSpool(spool_dir)
+            self._carried_segment = None
+            leftover_segments = self._spool.segments()
+            if len(leftover_segments) > 0:
+                _Warnings.batch_spool_not_empty(spool_dir, len(leftover_segments))
 
         self._timeout_retries = timeout_retries
         self._connection_error_retries = connection_error_retries
         self._weaviate_error_retry = weaviate_error_retries
         # set Batch to manual import
         if batch_size is None and not dynamic:
+            self._stop_linger_thread()
             self._batch_size = None
             self._batching_type = None
             return self
@@ -437,11 +752,21 @@ class Batch:
         _check_positive_num(batch_size, "batch_size", int)
         _check_positive_num(num_workers, "num_workers", int)
         _check_bool(dynamic, "dynamic")
-
-        if self._num_workers != num_workers:
+        _check_bool(streaming, "streaming")
+        if max_queued_batches is not None:
+            _check_positive_num(max_queued_batches, "max_queued_batches", int)
+
+        if (
+            self._num_workers != num_workers
+            or self._streaming != streaming
+            or self._max_queued_batches != max_queued_batches
+        ):
             self.flush()
             self.shutdown()
             self._num_workers = num_workers
+            self._active_num_workers = num_workers
+            self._streaming = streaming
+            self._max_queued_batches = max_queued_batches
             self.start()
 
         self._batch_size = batch_size
@@ -452,12 +777,80 @@ class Batch:
             self._batching_type = "dynamic"
             self._recommended_num_objects = 50 if batch_size is None else batch_size
             self._recommended_num_references = 50 if batch_size is None else batch_size
-            if self._shutdown_background_event is None:
+            if self._batch_size_controller is not None:
+                self._batch_size_controller.reset(self._recommended_num_objects, num_workers)
+                self._recommended_num_objects = self._batch_size_controller.batch_size
+                if self._shutdown_background_event is not None:
+                    self._shutdown_background_event.set()
+            elif self._shutdown_background_event is None:
                 self._update_recommended_batch_size()
 
+        if self._max_linger_ms is not None and self._linger_thread is None:
+            self._start_linger_thread()
         self._auto_create()
         return self
 
+    def _start_linger_timer(self) -> None:
+        """Remember when the first item was added to the current batches, see `max_linger_ms`."""
+
+        if self._oldest_item_time is None:
+            self._oldest_item_time = time.monotonic()
+
+    def _start_linger_thread(self) -> None:
+        """
+        Create a background thread that sends the current batches once their oldest item waited
+        `max_linger_ms`, or once the backoff of a delayed retry is over.
+        """
+
+        assert self._max_linger_ms is not None
+        max_linger = self._max_linger_ms / 1000
+        linger_event = threading.Event()
+
+        def linger() -> None:
+            while not linger_event.is_set():
+                timeout = max_linger
+                if self._oldest_item_time is not None:
+                    timeout = self._oldest_item_time + max_linger - time.monotonic()
+                retry_delay = self._next_retry_delay()
+                if retry_delay is not None:
+                    timeout = min(timeout, retry_delay)
+                if timeout > 0:
+                    linger_event.wait(timeout)
+                    continue
+
+                with self._send_lock:
+                    with self._batch_lock:
+                        if linger_event.is_set():
+                            return
+                        if (
+                            len(self._objects_batch) + len(self._reference_batch) == 0
+                            and retry_delay != 0
+                        ):
+                            # the items were removed from the current batches
+                            self._oldest_item_time = None
+                            continue
+                    try:
+                        self._send_batch_requests(force_wait=False)
+                    except Exception as error:  # re-raised in the producer thread
+                        with self._sender_lock:
+                            if self._sender_error is None:
+                                self._sender_error = error
+                        linger_event.wait(max_linger)
+
+        self._linger_event = linger_event
+        self._linger_thread = threading.Thread(target=linger, daemon=True, name="batchLinger")
+        self._linger_thread.start()
+
+    def _stop_linger_thread(self) -> None:
+        """Stop the background thread of `max_linger_ms`, if it is running."""
+
+        if self._linger_event is None or self._linger_thread is None:
+            return
+        self._linger_event.set()
+        self._linger_thread.join()
+        self._linger_event = None
+        self._linger_thread = None
+
     def _update_recommended_batch_size(self) -> None:
         """Create a background thread that periodically checks how congested the batch queue is."""
         self._shutdown_background_event = threading.Event()
@@ -469,32 +862,35 @@ class Batch:
                 and not self._shutdown_background_event.is_set()
             ):
                 try:
-                    status = cluster.get_nodes_status()
-                    if "stats" not in status[0] or "ratePerSecond" not in status[0]["stats"]:
+                    batch_stats = _aggregate_batch_stats(cluster.get_nodes_status())
+                    if batch_stats is None:
                         self._new_dynamic_batching = False
                         return
-                    rate = status[0]["batchStats"]["ratePerSecond"]
-                    rate_per_worker = rate / self._num_workers
-                    batch_length = status[0]["batchStats"]["queueLength"]
+                    rate, ratio = batch_stats
+                    rate_per_worker = rate / self._active_num_workers
 
-                    if batch_length == 0:  # scale up if queue is empty
+                    if ratio == 0:  # scale up if all queues are empty
                         self._recommended_num_objects = self._recommended_num_objects + min(
                             self._recommended_num_objects * 2, 25
                         )
-                    else:
-                        ratio = batch_length / rate
-                        if (
-                            2.1 > ratio > 1.9
-                        ):  # ideal, send exactly as many objects as weaviate can process
-                            self._recommended_num_objects = rate_per_worker
-                        elif ratio <= 1.9:  # we can send more
-                            self._recommended_num_objects = min(
-                                self._recommended_num_objects * 1.5, rate_per_worker * 2 / ratio
-                            )
-                        elif ratio < 10:  # too high, scale down
-                            self._recommended_num_objects = rate_per_worker * 2 / ratio
-                        else:  # way too high, stop sending new batches
-                            self._recommended_num_objects = 0
+                    elif (
+                        2.1 > ratio > 1.9
+                    ):  # ideal, send exactly as many objects as weaviate can process
+                        self._recommended_num_objects = max(int(rate_per_worker), 1)
+                    elif ratio <= 1.9:  # we can send more
+                        self._recommended_num_objects = max(
+                            int(
+                                min(
+                                    self._recommended_num_objects * 1.5,
+                                    rate_per_worker * 2 / ratio,
+                                )
+                            ),
+                            1,
+                        )
+                    elif ratio < 10:  # too high, scale down
+                        self._recommended_num_objects = max(int(rate_per_worker * 2 / ratio), 1)
+                    else:  # way too high, stop sending new batches
+                        self._recommended_num_objects = 0
 
                     refresh_time: float = 2
                 except (RequestsHTTPError, ReadTimeout):
@@ -555,20 +951,317 @@ class Batch:
         ValueError
             If 'uuid' is not of a proper form.
         """
-        uuid = self._objects_batch.add(
+
+        item, _ = self._add_object(data_object, class_name, uuid, vector, tenant, False)
+        return str(item["id"])
+
+    def add_data_object_future(
+        self,
+        data_object: dict,
+        class_name: str,
+        uuid: Optional[UUID] = None,
+        vector: Optional[Sequence] = None,
+        tenant: Optional[str] = None,
+    ) -> BatchItemFuture:
+        """
+        Add one object to this batch like `add_data_object` and return a future of it. The future
+        is resolved once weaviate acknowledged the object, after all retries, or with a
+        `BatchItemFailedException` if weaviate reported an error for it. The UUID of the object is
+        in the `id` of the result.
+
+        Returns
+        -------
+        BatchItemFuture
+            The future of the added object.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If 'uuid' is not of a proper form.
+        """
+
+        _, future = self._add_object(data_object, class_name, uuid, vector, tenant, True)
+        assert future is not None
+        return future
+
+    def _add_object(
+        self,
+        data_object: dict,
+        class_name: str,
+        uuid: Optional[UUID],
+        vector: Optional[Sequence],
+        tenant: Optional[str],
+        with_future: bool,
+    ) -> Tuple[Dict[str, Any], Optional[BatchItemFuture]]:
+        # the expensive part is done before taking the lock, so producer threads only contend on
+        # appending the finished object
+        item = ObjectsBatchRequest.create_item(
             class_name=_capitalize_first_letter(class_name),
             data_object=data_object,
             uuid=uuid,
             vector=vector,
             tenant=tenant,
+            copy_object=self._copy_objects,
+        )
+        num_bytes = (
+            _approximate_size(item)
+            if self._max_batch_bytes is not None or self._max_buffered_bytes is not None
+            else None
         )
+        self._wait_for_buffer_space()
+        with self._batch_lock:
+            self._objects_batch.add_item(item, num_bytes)
+            self._spool_added("objects", len(self._objects_batch) - 1)
+            future = self._add_item_future(self._objects_batch) if with_future else None
+            self._start_linger_timer()
 
-        self.__imported_shards.add(Shard(class_name, tenant))
+            self.__imported_shards.add(Shard(class_name, tenant))
 
         if self._batching_type:
             self._auto_create()
+        return item, future
+
+    def add_data_objects(
+        self,
+        class_name: str,
+        properties: Optional[Mapping[str, Sequence]] = None,
+        vectors: Optional[Sequence] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenants: Union[str, Sequence[str], None] = None,
+    ) -> List[str]:
+        """
+        Add multiple objects of one class to this batch from columns, e.g. numpy arrays. This is
+        much faster than calling `add_data_object` for every object when adding many objects. The
+        objects are split into request-sized slices and auto-created like `add_data_object` does.
+        NOTE: If the UUID of one of the objects already exists then the existing object will be
+        replaced by the new object.
+
+        Parameters
+        ----------
+        class_name : str
+            The name of the class all objects belong to.
+        properties : Optional[Mapping[str, Sequence]], optional
+            Mapping of property names to one value per object. Supported column types are `list`,
+            `numpy.ndarray`, `torch.Tensor` and `tf.Tensor`, by default None.
+        vectors : Optional[Sequence], optional
+            One vector per object, e.g. a 2D `numpy.ndarray` with one row per object,
+            by default None.
+        uuids : Optional[Sequence[UUID]], optional
+            One UUID per object. If None UUIDv4s will be generated, by default None.
+        tenants : Union[str, Sequence[str], None], optional
+            The tenant of all objects or one tenant per object, by default None.
+
+        Examples
+        --------
+        >>> client.batch.add_data_objects(
+        ...     "Article",
+        ...     properties={"title": titles, "wordCount": word_counts},
+        ...     vectors=embeddings,  # numpy.ndarray of shape (len(titles), dim)
+        ... )
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the added objects.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If the columns have different lengths or one of the 'uuids' is not of a proper form.
+        """
+
+        class_name = _capitalize_first_letter(class_name)
+        num_objects = _num_rows(properties, vectors, uuids, tenants)
+
+        added_uuids: List[str] = []
+        start = 0
+        while start < num_objects:
+            self._wait_for_buffer_space()
+            with self._batch_lock:
+                end = num_objects
+                if self._batching_type is not None:
+                    end = min(start + self._free_objects_capacity(), num_objects)
+
+                num_added = len(self._objects_batch)
+                added_uuids.extend(
+                    self._objects_batch.add_many(
+                        class_name=class_name,
+                        properties={name: column[start:end] for name, column in properties.items()}
+                        if properties is not None
+                        else None,
+                        vectors=vectors[start:end] if vectors is not None else None,
+                        uuids=uuids[start:end] if uuids is not None else None,
+                        tenants=tenants[start:end]
+                        if tenants is not None and not isinstance(tenants, str)
+                        else tenants,
+                    )
+                )
+                self._spool_added("objects", num_added)
+                self._start_linger_timer()
+            if self._batching_type:
+                self._auto_create()
+            start = end
+
+        if tenants is None or isinstance(tenants, str):
+            self.__imported_shards.add(Shard(class_name, tenants))
+        else:
+            self.__imported_shards.update(Shard(class_name, tenant) for tenant in set(tenants))
+
+        return added_uuids
+
+    def import_arrow(
+        self,
+        data: Any,
+        class_name: str,
+        vector_column: Optional[str] = None,
+        id_column: Optional[str] = None,
+        tenant_column: Optional[str] = None,
+        properties: Optional[Sequence[str]] = None,
+    ) -> int:
+        """
+        Add all rows of Apache Arrow data to this batch, one object per row. The data is processed
+        one record batch at a time and fed into the batch with `add_data_objects`. With automatic
+        batching the memory usage is bounded by the size of the record batches (and the batch
+        queue, see `configure`), with manual batching all objects are kept until they are created.
+        Vector columns are converted to arrays as a whole instead of element by element.
+        Requires `pyarrow`.
+
+        Parameters
+        ----------
+        data : pyarrow.Table, pyarrow.RecordBatch, pyarrow.RecordBatchReader or Iterable
+            The data to import. An iterable must yield `pyarrow.RecordBatch` objects.
+        class_name : str
+            The name of the class all objects belong to.
+        vector_column : Optional[str], optional
+            The name of the column that contains the vectors, a (fixed size) list column of
+            floats. If None, no vectors are added, by default None.
+        id_column : Optional[str], optional
+            The name of the column that contains the UUIDs as strings. If None, UUIDv4s will be
+            generated, by default None.
+        tenant_column : Optional[str], optional
+            The name of the column that contains the tenants, by default None.
+        properties : Optional[Sequence[str]], optional
+            The names of the columns to import as properties. If None, all columns except the
+            vector, id and tenant columns are imported, by default None.
+
+        Returns
+        -------
+        int
+            The number of imported objects.
+
+        Raises
+        ------
+        ValueError
+            If one of the given columns does not exist.
+        """
+
+        if hasattr(data, "to_batches"):  # pyarrow.Table
+            record_batches = data.to_batches()
+        elif hasattr(data, "num_rows"):  # a single pyarrow.RecordBatch
+            record_batches = [data]
+        else:
+            record_batches = data
+
+        num_objects = 0
+        for record_batch in record_batches:
+            columns, vectors, uuids, tenants = _record_batch_to_columns(
+                record_batch, vector_column, id_column, tenant_column, properties
+            )
+            num_objects += len(
+                self.add_data_objects(
+                    class_name,
+                    properties=columns,
+                    vectors=vectors,
+                    uuids=uuids,
+                    tenants=tenants,
+                )
+            )
+        return num_objects
+
+    def import_parquet(
+        self,
+        path: str,
+        class_name: str,
+        vector_column: Optional[str] = None,
+        id_column: Optional[str] = None,
+        tenant_column: Optional[str] = None,
+        properties: Optional[Sequence[str]] = None,
+        rows_per_read: int = 10_000,
+    ) -> int:
+        """
+        Add all rows of a Parquet file to this batch, one object per row. The file is read in
+        chunks of `rows_per_read` rows, see `import_arrow` for details. Requires `pyarrow`.
+
+        Parameters
+        ----------
+        path : str
+            The path of the Parquet file.
+        class_name : str
+            The name of the class all objects belong to.
+        vector_column : Optional[str], optional
+            The name of the column that contains the vectors, by default None.
+        id_column : Optional[str], optional
+            The name of the column that contains the UUIDs as strings, by default None.
+        tenant_column : Optional[str], optional
+            The name of the column that contains the tenants, by default None.
+        properties : Optional[Sequence[str]], optional
+            The names of the columns to import as properties. If None, all columns except the
+            vector, id and tenant columns are imported, by default None.
+        rows_per_read : int, optional
+            How many rows are read from the file at once, by default 10000.
+
+        Returns
+        -------
+        int
+            The number of imported objects.
+
+        Raises
+        ------
+        ImportError
+            If `pyarrow` is not installed.
+        """
+
+        _check_positive_num(rows_per_read, "rows_per_read", int)
+        try:
+            import pyarrow.parquet  # type: ignore
+        except ImportError as error:
+            raise ImportError(
+                "Importing Parquet files requires 'pyarrow', install it with 'pip install pyarrow'."
+            ) from error
+
+        columns = None
+        if properties is not None:
+            columns = list(properties) + [
+                column for column in (vector_column, id_column, tenant_column) if column is not None
+            ]
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        return self.import_arrow(
+            parquet_file.iter_batches(batch_size=rows_per_read, columns=columns),
+            class_name,
+            vector_column=vector_column,
+            id_column=id_column,
+            tenant_column=tenant_column,
+            properties=properties,
+        )
+
+    def _free_objects_capacity(self) -> int:
+        """
+        Number of objects that can be added before the objects batch is auto-created.
 
-        return uuid
+        Returns
+        -------
+        int
+            The number of objects, at least 1.
+        """
+
+        if self._batching_type == "fixed":
+            assert self._batch_size is not None
+            return max(self._batch_size - sum(self.shape), 1)
+        return max(int(self._recommended_num_objects) - self.num_objects(), 1)
 
     def add_reference(
         self,
@@ -612,6 +1305,65 @@ class Batch:
             If 'uuid' is not valid or cannot be extracted.
         """
 
+        self._add_reference(
+            from_object_uuid,
+            from_object_class_name,
+            from_property_name,
+            to_object_uuid,
+            to_object_class_name,
+            tenant,
+            False,
+        )
+
+    def add_reference_future(
+        self,
+        from_object_uuid: UUID,
+        from_object_class_name: str,
+        from_property_name: str,
+        to_object_uuid: UUID,
+        to_object_class_name: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> BatchItemFuture:
+        """
+        Add one reference to this batch like `add_reference` and return a future of it. The future
+        is resolved once weaviate acknowledged the reference, after all retries, or with a
+        `BatchItemFailedException` if weaviate reported an error for it.
+
+        Returns
+        -------
+        BatchItemFuture
+            The future of the added reference.
+
+        Raises
+        ------
+        TypeError
+            If arguments are not of type str.
+        ValueError
+            If 'uuid' is not valid or cannot be extracted.
+        """
+
+        future = self._add_reference(
+            from_object_uuid,
+            from_object_class_name,
+            from_property_name,
+            to_object_uuid,
+            to_object_class_name,
+            tenant,
+            True,
+        )
+        assert future is not None
+        return future
+
+    def _add_reference(
+        self,
+        from_object_uuid: UUID,
+        from_object_class_name: str,
+        from_property_name: str,
+        to_object_uuid: UUID,
+        to_object_class_name: Optional[str],
+        tenant: Optional[str],
+        with_future: bool,
+    ) -> Optional[BatchItemFuture]:
         is_server_version_14 = self._connection.server_version >= "1.14"
 
         if to_object_class_name is None and is_server_version_14:
@@ -636,7 +1388,7 @@ class Batch:
                     )
                 to_object_class_name = _capitalize_first_letter(to_object_class_name)
 
-        self._reference_batch.add(
+        item = ReferenceBatchRequest.create_item(
             from_object_class_name=_capitalize_first_letter(from_object_class_name),
             from_object_uuid=from_object_uuid,
             from_property_name=from_property_name,
@@ -644,14 +1396,24 @@ class Batch:
             to_object_class_name=to_object_class_name,
             tenant=tenant,
         )
+        self._wait_for_buffer_space()
+        with self._batch_lock:
+            self._reference_batch.add_item(item)
+            self._spool_added("references", len(self._reference_batch) - 1)
+            future = self._add_item_future(self._reference_batch) if with_future else None
+            self._start_linger_timer()
 
         if self._batching_type:
             self._auto_create()
+        return future
 
     def _create_data(
         self,
         data_type: str,
         batch_request: BatchRequest,
+        delay_retries: bool = False,
+        retry_timeouts: bool = True,
+        segment_id: Optional[int] = None,
     ) -> Response:
         """
         Create data in batches, either Objects or References. This does NOT guarantee
@@ -667,6 +1429,16 @@ class Batch:
             Contains all the data objects that should be added in one batch.
             Note: Should be a sub-class of BatchRequest since BatchRequest
             is just an abstract class, e.g. ObjectsBatchRequest, ReferenceBatchRequest
+        delay_retries : bool, optional
+            Whether items with errors are put into the delayed retry queue if the
+            `WeaviateErrorRetryConf` has a `backoff`, instead of being retried right away,
+            by default False.
+        retry_timeouts : bool, optional
+            Whether the items that were not created by a timed out batch request are sent again,
+            up to `timeout_retries` times, by default True.
+        segment_id : Optional[int], optional
+            The spool segment of the items. It is retained for every delayed retry, see
+            `_delay_retries`. By default None.
 
         Returns
         -------
@@ -686,29 +1458,27 @@ class Batch:
         if self._consistency_level is not None:
             params["consistency_level"] = self._consistency_level.value
 
+        metrics = BatchRequestMetrics(data_type=data_type, num_items=len(batch_request))
         try:
             timeout_count = connection_count = batch_error_count = 0
             while True:
                 try:
-                    response = self._connection.post(
-                        path="/batch/" + data_type,
-                        weaviate_object=batch_request.get_request_body(),
-                        params=params,
-                    )
+                    response = self._post_batch(data_type, batch_request, params, metrics)
                 except ReadTimeout as error:
                     _batch_create_error_handler(
                         retry=timeout_count,
-                        max_retries=self._timeout_retries,
+                        max_retries=self._timeout_retries if retry_timeouts else 0,
                         error=error,
                     )
                     timeout_count += 1
+                    self._count("timeout_retries")
                     batch_request = self._batch_retry_after_timeout(data_type, batch_request)
                     # All elements have been added successfully. The timeout occurred while receiving the answer.
                     if len(batch_request) == 0:
                         response = Response()
                         response.status_code = 200
                         response.elapsed = datetime.timedelta(
-                            self._connection.timeout_config[1] + 5
+                            seconds=self._connection.timeout_config[1] + 5
                         )
                         break
 
@@ -719,24 +1489,42 @@ class Batch:
                         error=error,
                     )
                     connection_count += 1
+                    self._count("connection_error_retries")
                 else:
+                    start = time.perf_counter()
                     response_json = _decode_json_response_list(response, "batch response")
+                    metrics.decode_time += time.perf_counter() - start
                     assert response_json is not None
+                    futures = self._match_item_futures(data_type, batch_request, response_json)
                     if (
+                        delay_retries
+                        and self._weaviate_error_retry is not None
+                        and self._weaviate_error_retry.backoff is not None
+                    ):
+                        response_json, num_delayed = self._delay_retries(
+                            data_type, response_json, futures, segment_id
+                        )
+                        if num_delayed > 0:
+                            batch_error_count += 1
+                            self._count("error_retries")
+                    elif (
                         self._weaviate_error_retry is not None
                         and batch_error_count < self._weaviate_error_retry.number_retries
                     ):
                         batch_to_retry, response_json_successful = self._retry_on_error(
-                            response_json, data_type
+                            response_json, data_type, futures
                         )
                         if len(batch_to_retry) > 0:
-                            self._run_callback(response_json_successful)
+                            self._resolve_item_futures(response_json_successful, futures)
+                            self._run_callback(response_json_successful, metrics)
 
                             batch_error_count += 1
+                            self._count("error_retries")
                             batch_request = batch_to_retry
                             continue  # run the request again, but only with objects that had errors
 
-                    self._run_callback(response_json)
+                    self._resolve_item_futures(response_json, futures)
+                    self._run_callback(response_json, metrics)
                     break
         except RequestsConnectionError as conn_err:
             raise RequestsConnectionError("Batch was not added to weaviate.") from conn_err
@@ -749,115 +1537,486 @@ class Batch:
             )
             raise ReadTimeout(message) from None
         if response.status_code == 200:
+            metrics.timeout_retries = timeout_count
+            metrics.connection_error_retries = connection_count
+            metrics.error_retries = batch_error_count
+            self._report_metrics(metrics)
             return response
         raise UnexpectedStatusCodeException(f"Create {data_type} in batch", response)
 
-    def _run_callback(self, response: BatchResponse) -> None:
-        if self._callback is None:
-            return
-        # We don't know if user-supplied functions are threadsafe
-        with self._callback_lock:
-            self._callback(response)
-
-    def _batch_retry_after_timeout(
-        self, data_type: str, batch_request: BatchRequest
-    ) -> BatchRequest:
+    def _create_data_bisecting(
+        self, data_type: str, batch_request: BatchRequest, segment_id: Optional[int] = None
+    ) -> Response:
         """
-        Readds items (objects or references) that were not added due to a timeout.
+        Create data in batches like `_create_data`, but split a batch request that fails with a
+        server error or a timeout in half and send the halves separately, until the failing items
+        are isolated in batch requests of at most `min_bisect_size` items. These are passed to the
+        callback with the error as result. Timed out batch requests are split right away, without
+        checking which of their items were created, so every item is in exactly one half.
 
         Parameters
         ----------
         data_type : str
-            The Batch Request type, can be either 'objects' or 'references'.
-        batch_request : BatchRequest
-            The Batch Request that TimeOuted.
+            The data type of the BatchRequest.
+        batch_request : weaviate.batch.BatchRequest
+            Contains all the data objects that should be added in one batch.
+        segment_id : Optional[int], optional
+            The spool segment of the items, see `_create_data`. By default None.
 
         Returns
         -------
-        BatchRequest
-            New Batch Request with objects that were not added or not updated.
+        requests.Response
+            The response of the batch request, or a response without a body that took as long as
+            all halves together if the batch request was split.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the network connection to weaviate fails.
+        weaviate.UnexpectedStatusCodeException
+            If weaviate reports a none OK status that is not a server error.
         """
 
-        if data_type == "objects":
-            assert isinstance(batch_request, ObjectsBatchRequest)
-            return self._readd_objects_after_timeout(batch_request)
-        else:
-            assert isinstance(batch_request, ReferenceBatchRequest)
-            return self._readd_references_after_timeout(batch_request)
+        assert self._min_bisect_size is not None
+        start = time.perf_counter()
+        try:
+            return self._create_data(
+                data_type,
+                batch_request,
+                delay_retries=True,
+                retry_timeouts=False,
+                segment_id=segment_id,
+            )
+        except (ReadTimeout, UnexpectedStatusCodeException) as error:
+            if isinstance(error, UnexpectedStatusCodeException) and error.status_code < 500:
+                raise
+            if len(batch_request) > self._min_bisect_size:
+                for half in batch_request.bisect():
+                    if len(half) > 0:
+                        self._create_data_bisecting(data_type, half, segment_id)
+            else:
+                self._count("isolated_items", len(batch_request))
+                body = batch_request.get_request_body()
+                items = body["objects"] if isinstance(body, dict) else body
+                results = [
+                    {**item, "result": {"errors": {"error": [{"message": str(error)}]}}}
+                    for item in items
+                ]
+                self._resolve_item_futures(
+                    results, self._match_item_futures(data_type, batch_request, results)
+                )
+                self._run_callback(results)
 
-    def _readd_objects_after_timeout(
-        self, batch_request: ObjectsBatchRequest
-    ) -> ObjectsBatchRequest:
+        response = Response()
+        response.status_code = 200
+        response.elapsed = datetime.timedelta(seconds=time.perf_counter() - start)
+        return response
+
+    def _count(self, counter: str, value: int = 1) -> None:
         """
-        Read all objects that were not created or updated because of a TimeOut error.
+        Increase one of the counters reported by `stats`.
 
         Parameters
         ----------
-        batch_request : ObjectsBatchRequest
-            The ObjectsBatchRequest from which to check if items where created or updated.
-
-        Returns
-        -------
-        ObjectsBatchRequest
-            New ObjectsBatchRequest with only the objects that were not created or updated.
+        counter : str
+            The name of the counter.
+        value : int
+            By how much to increase the counter, by default 1.
         """
 
-        new_batch = ObjectsBatchRequest()
-        for obj in batch_request.get_request_body()["objects"]:
-            class_name = obj["class"]
-            uuid = obj["id"]
-            response_head = self._connection.head(
-                path="/objects/" + class_name + "/" + uuid,
-            )
+        with self._counters_lock:
+            self._counters[counter] += value
 
-            if response_head.status_code == 404:
-                new_batch.add(
-                    class_name=_capitalize_first_letter(class_name),
-                    data_object=obj["properties"],
-                    uuid=uuid,
-                    vector=obj.get("vector", None),
-                )
-                continue
+    def _report_metrics(self, metrics: BatchRequestMetrics) -> None:
+        """
+        Count a successful batch request and pass its metrics to the metrics callback.
 
-            # object might already exist and needs to be overwritten in case of an update
-            response = self._connection.get(
-                path="/objects/" + class_name + "/" + uuid,
-            )
+        Parameters
+        ----------
+        metrics : BatchRequestMetrics
+            The metrics of the batch request.
+        """
 
-            obj_weav = _decode_json_response_dict(response, "Re-add objects")
-            assert obj_weav is not None
-            if obj_weav["properties"] != obj["properties"] or obj.get(
-                "vector", None
-            ) != obj_weav.get("vector", None):
-                new_batch.add(
-                    class_name=_capitalize_first_letter(class_name),
-                    data_object=obj["properties"],
-                    uuid=uuid,
-                    vector=obj.get("vector", None),
-                )
-        return new_batch
+        with self._counters_lock:
+            self._counters["requests"] += 1
+            self._counters["items"] += metrics.num_items
+        if self._metrics_callback is None:
+            return
+        with self._callback_lock:
+            self._metrics_callback(metrics)
 
-    def _readd_references_after_timeout(
-        self, batch_request: ReferenceBatchRequest
-    ) -> ReferenceBatchRequest:
+    def _post_batch(
+        self,
+        data_type: str,
+        batch_request: BatchRequest,
+        params: Dict[str, str],
+        metrics: BatchRequestMetrics,
+    ) -> Response:
         """
-        Read all objects that were not created or updated because of a TimeOut error.
+        Send one batch request to weaviate. Objects are sent over gRPC if it is configured and all
+        objects can be represented as gRPC messages, everything else is sent over REST.
 
         Parameters
         ----------
-        batch_request : ReferenceBatchRequest
-            The ReferenceBatchRequest from which to check if items where created or updated.
+        data_type : str
+            The data type of the BatchRequest, can be either 'objects' or 'references'.
+        batch_request : weaviate.batch.BatchRequest
+            Contains all the items that should be added in one batch.
+        params : Dict[str, str]
+            Additional request parameters.
+        metrics : BatchRequestMetrics
+            The metrics of the batch request, the serialization and request times and the size of
+            the request are added to it.
 
         Returns
         -------
-        ReferenceBatchRequest
-            New ReferenceBatchRequest with only the references that were not created or updated.
+        requests.Response
+            The response of the request.
         """
 
-        new_batch = ReferenceBatchRequest()
-        for ref in batch_request.get_request_body():
-            new_batch.add(
-                from_object_class_name=ref["from_object_class_name"],
+        if (
+            data_type == "objects"
+            and self._grpc_batching
+            and self._connection.grpc_stub is not None
+        ):
+            assert isinstance(batch_request, ObjectsBatchRequest)
+            response = self._create_objects_grpc(batch_request, metrics)
+            if response is not None:
+                return response
+
+        start = time.perf_counter()
+        body = self._connection.json_codec.dumps(batch_request.get_request_body())
+        sent = time.perf_counter()
+        metrics.serialization_time += sent - start
+        metrics.num_bytes = len(body)
+        try:
+            response = self._connection.post(
+                path="/batch/" + data_type,
+                weaviate_object=body,
+                params=params,
+            )
+        finally:
+            metrics.request_time += time.perf_counter() - sent
+        metrics.elapsed += response.elapsed.total_seconds()
+        return response
+
+    def _create_objects_grpc(
+        self, batch_request: ObjectsBatchRequest, metrics: BatchRequestMetrics
+    ) -> Optional[Response]:
+        """
+        Send objects over the gRPC BatchObjects endpoint. Vectors are sent as packed floats, which
+        avoids encoding and decoding them as JSON.
+
+        Parameters
+        ----------
+        batch_request : ObjectsBatchRequest
+            Contains all the objects that should be added in one batch.
+        metrics : BatchRequestMetrics
+            The metrics of the batch request, the serialization and request times and the size of
+            the request are added to it.
+
+        Returns
+        -------
+        Optional[requests.Response]
+            A response with the same per-object results as the REST endpoint, or None if the batch
+            could not be sent over gRPC and the REST endpoint should be used instead.
+
+        Raises
+        ------
+        requests.ReadTimeout
+            If the request exceeded its deadline, so it is retried like a timed out REST request.
+        requests.ConnectionError
+            If weaviate is unavailable.
+        grpc.RpcError
+            If the request failed with another error than UNIMPLEMENTED.
+        """
+
+        start = time.perf_counter()
+        objects = batch_request.get_request_body()["objects"]
+        grpc_objects = []
+        for obj in objects:
+            grpc_object = _object_to_grpc(obj)
+            if grpc_object is None:  # e.g. references or nested objects, not supported yet
+                return None
+            grpc_objects.append(grpc_object)
+
+        metadata: Union[Tuple, Tuple[Tuple[str, str]]] = ()
+        access_token = self._connection.get_current_bearer_token()
+        if len(access_token) > 0:
+            metadata = (("authorization", access_token),)
+
+        request = batch_pb2.BatchObjectsRequest(
+            objects=grpc_objects,
+            consistency_level=base_pb2.ConsistencyLevel.Value(
+                "CONSISTENCY_LEVEL_" + self._consistency_level.value
+            )
+            if self._consistency_level is not None
+            else None,
+        )
+        sent = time.perf_counter()
+        metrics.serialization_time += sent - start
+        metrics.num_bytes = request.ByteSize()
+        try:
+            reply, _ = self._connection.grpc_stub.BatchObjects.with_call(  # type: ignore
+                request,
+                metadata=metadata,
+                timeout=self._connection.timeout_config[1],
+            )
+        except grpc.RpcError as error:
+            metrics.request_time += time.perf_counter() - sent
+            if error.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+                raise ReadTimeout(error.details()) from error
+            if error.code() == grpc.StatusCode.UNAVAILABLE:
+                raise RequestsConnectionError(error.details()) from error
+            if error.code() != grpc.StatusCode.UNIMPLEMENTED:
+                raise
+            # concurrent batch requests may all fail, warn only once
+            with self._grpc_lock:
+                if self._grpc_batching:
+                    self._grpc_batching = False
+                    _Warnings.batch_grpc_fallback_to_rest(error)
+            return None
+        elapsed = time.perf_counter() - sent
+        metrics.request_time += elapsed
+        metrics.elapsed += elapsed
+
+        errors = {error.index: error.error for error in reply.errors}
+        results: BatchResponse = []
+        for i, obj in enumerate(objects):
+            result = dict(obj)
+            if i in errors:
+                result["result"] = {"errors": {"error": [{"message": errors[i]}]}}
+            else:
+                result["result"] = {}
+            results.append(result)
+
+        return _GrpcBatchResponse(results, datetime.timedelta(seconds=elapsed))
+
+    def _run_callback(
+        self, response: BatchResponse, metrics: Optional[BatchRequestMetrics] = None
+    ) -> None:
+        if self._callback is None:
+            return
+        start = time.perf_counter()
+        # We don't know if user-supplied functions are threadsafe
+        with self._callback_lock:
+            self._callback(response)
+        if metrics is not None:
+            metrics.callback_time += time.perf_counter() - start
+
+    def _add_item_future(self, batch_request: BatchRequest) -> BatchItemFuture:
+        """
+        Create the future of the item that was just added to a batch.
+
+        Parameters
+        ----------
+        batch_request : BatchRequest
+            The batch the item was added to, as its last item.
+
+        Returns
+        -------
+        BatchItemFuture
+            The future.
+        """
+
+        future = BatchItemFuture()
+        batch_request._futures[id(batch_request._items[-1])] = future
+        return future
+
+    def _match_item_futures(
+        self, data_type: str, batch_request: BatchRequest, response: BatchResponse
+    ) -> Dict[int, BatchItemFuture]:
+        """
+        Match the items of a batch response with the futures of the items of the batch request
+        it answers. Only the futures of this batch request are matched, so an object that was
+        added again to a later batch keeps its own future. Items without a result in the response
+        were written, their futures are resolved with the item that was sent.
+
+        Parameters
+        ----------
+        data_type : str
+            Either 'objects' or 'references'.
+        batch_request : BatchRequest
+            The batch request that was sent.
+        response : BatchResponse
+            The decoded batch response.
+
+        Returns
+        -------
+        Dict[int, BatchItemFuture]
+            The futures, by the id() of the item of the response.
+        """
+
+        if len(batch_request._futures) == 0:
+            return {}
+        pending: Dict[Tuple[Optional[str], ...], Deque[Tuple[Dict[str, Any], BatchItemFuture]]]
+        pending = {}
+        for item in batch_request._items:
+            future = batch_request._futures.get(id(item))
+            if future is not None:
+                pending.setdefault(_item_key(data_type, item), deque()).append((item, future))
+        matched = {}
+        for item in response:
+            futures = pending.get(_item_key(data_type, item))
+            if futures is not None and len(futures) > 0:
+                matched[id(item)] = futures.popleft()[1]
+        for futures in pending.values():
+            for item, future in futures:
+                future._set_result(item)
+        return matched
+
+    def _resolve_item_futures(
+        self, response: BatchResponse, futures: Dict[int, BatchItemFuture]
+    ) -> None:
+        """
+        Resolve the futures of the items of a batch response whose results are final.
+
+        Parameters
+        ----------
+        response : BatchResponse
+            The decoded batch response, or the part of it that is final.
+        futures : Dict[int, BatchItemFuture]
+            The futures of the response items, see `_match_item_futures`. Resolved futures are
+            removed.
+        """
+
+        if len(futures) == 0:
+            return
+        for item in response:
+            future = futures.pop(id(item), None)
+            if future is None:
+                continue
+            if "errors" in (item.get("result") or {}):
+                future._set_exception(BatchItemFailedException(item))
+            else:
+                future._set_result(item)
+
+    def _batch_retry_after_timeout(
+        self, data_type: str, batch_request: BatchRequest
+    ) -> BatchRequest:
+        """
+        Readds items (objects or references) that were not added due to a timeout.
+
+        Parameters
+        ----------
+        data_type : str
+            The Batch Request type, can be either 'objects' or 'references'.
+        batch_request : BatchRequest
+            The Batch Request that TimeOuted.
+
+        Returns
+        -------
+        BatchRequest
+            New Batch Request with objects that were not added or not updated.
+        """
+
+        if data_type == "objects":
+            assert isinstance(batch_request, ObjectsBatchRequest)
+            return self._readd_objects_after_timeout(batch_request)
+        else:
+            assert isinstance(batch_request, ReferenceBatchRequest)
+            return self._readd_references_after_timeout(batch_request)
+
+    def _readd_objects_after_timeout(
+        self, batch_request: ObjectsBatchRequest
+    ) -> ObjectsBatchRequest:
+        """
+        Read all objects that were not created or updated because of a TimeOut error. The objects
+        are fetched in parallel with one GET request per object.
+
+        Parameters
+        ----------
+        batch_request : ObjectsBatchRequest
+            The ObjectsBatchRequest from which to check if items where created or updated.
+
+        Returns
+        -------
+        ObjectsBatchRequest
+            New ObjectsBatchRequest with only the objects that were not created or updated.
+        """
+
+        objects = batch_request.get_request_body()["objects"]
+        new_batch = ObjectsBatchRequest()
+        if len(objects) == 0:
+            return new_batch
+
+        max_workers = min(len(objects), _MAX_PARALLEL_RECOVERY_REQUESTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            was_written = list(executor.map(self._object_was_written, objects))
+
+        for obj, written in zip(objects, was_written):
+            future = batch_request._futures.get(id(obj))
+            if written:
+                if future is not None:
+                    future._set_result(obj)
+                continue
+            new_batch.add(
+                class_name=_capitalize_first_letter(obj["class"]),
+                data_object=obj["properties"],
+                uuid=obj["id"],
+                vector=obj.get("vector", None),
+                tenant=obj.get("tenant", None),
+                copy_object=False,
+            )
+            if future is not None:
+                new_batch._futures[id(new_batch._items[-1])] = future
+        return new_batch
+
+    def _object_was_written(self, obj: dict) -> bool:
+        """
+        Check if an object of a timed out batch was written to weaviate. The update time of the
+        object is not used, it is set by the server clock and may come from another writer.
+
+        Parameters
+        ----------
+        obj : dict
+            The object as it was sent in the batch.
+
+        Returns
+        -------
+        bool
+            True if the object exists and has the same properties and vector, False otherwise.
+        """
+
+        params: Dict[str, str] = {}
+        if "vector" in obj:
+            params["include"] = "vector"
+        if "tenant" in obj:
+            params["tenant"] = obj["tenant"]
+        response = self._connection.get(
+            path="/objects/" + obj["class"] + "/" + obj["id"],
+            params=params,
+        )
+        if response.status_code == 404:
+            return False
+
+        obj_weav = _decode_json_response_dict(response, "Re-add objects")
+        assert obj_weav is not None
+        return obj_weav.get("properties") == obj["properties"] and _same_vector(
+            obj.get("vector"), obj_weav.get("vector")
+        )
+
+    def _readd_references_after_timeout(
+        self, batch_request: ReferenceBatchRequest
+    ) -> ReferenceBatchRequest:
+        """
+        Read all objects that were not created or updated because of a TimeOut error.
+
+        Parameters
+        ----------
+        batch_request : ReferenceBatchRequest
+            The ReferenceBatchRequest from which to check if items where created or updated.
+
+        Returns
+        -------
+        ReferenceBatchRequest
+            New ReferenceBatchRequest with only the references that were not created or updated.
+        """
+
+        new_batch = ReferenceBatchRequest()
+        for ref in batch_request.get_request_body():
+            new_batch.add(
+                from_object_class_name=ref["from_object_class_name"],
                 from_object_uuid=ref["from_object_uuid"],
                 from_property_name=ref["from_property_name"],
                 to_object_uuid=ref["to_object_uuid"],
@@ -951,28 +2110,41 @@ class Batch:
             If weaviate reports a none OK status.
         """
 
-        if len(self._objects_batch) != 0:
-            _Warnings.manual_batching()
-
-            response = self._create_data(
-                data_type="objects",
-                batch_request=self._objects_batch,
-            )
-            self._objects_batch = ObjectsBatchRequest()
+        with self._batch_lock:
+            if len(self._objects_batch) != 0:
+                _Warnings.manual_batching()
+
+                results = []
+                objects_batches = self._split_objects_batch(self._objects_batch)
+                if self._spool is not None:
+                    self._hold_segment(
+                        self._spool.seal(),
+                        objects_batches,
+                        keep_back=len(self._reference_batch) > 0,
+                    )
+                for objects_batch in objects_batches:
+                    response = self._create_data(
+                        data_type="objects",
+                        batch_request=objects_batch,
+                    )
+                    res = _decode_json_response_list(response, "batch add objects")
+                    assert res is not None
+                    results.extend(res)
+                    if self._spool is not None:
+                        self._spool.ack(objects_batch)
+                self._objects_batch = self._new_objects_batch()
 
-            self._objects_throughput_frame.append(
-                len(self._objects_batch) / response.elapsed.total_seconds()
-            )
-            obj_per_second = sum(self._objects_throughput_frame) / len(
-                self._objects_throughput_frame
-            )
+                self._objects_throughput_frame.append(
+                    len(self._objects_batch) / response.elapsed.total_seconds()
+                )
+                obj_per_second = sum(self._objects_throughput_frame) / len(
+                    self._objects_throughput_frame
+                )
 
-            self._recommended_num_objects = max(round(obj_per_second * self._creation_time), 1)
+                self._recommended_num_objects = max(round(obj_per_second * self._creation_time), 1)
 
-            res = _decode_json_response_list(response, "batch add objects")
-            assert res is not None
-            return res
-        return []
+                return results
+            return []
 
     def create_references(self) -> list:
         """
@@ -1048,28 +2220,37 @@ class Batch:
             If weaviate reports a none OK status.
         """
 
-        if len(self._reference_batch) != 0:
-            _Warnings.manual_batching()
+        with self._batch_lock:
+            if len(self._reference_batch) != 0:
+                _Warnings.manual_batching()
 
-            response = self._create_data(
-                data_type="references",
-                batch_request=self._reference_batch,
-            )
-            self._reference_batch = ReferenceBatchRequest()
+                if self._spool is not None:
+                    self._hold_segment(
+                        self._spool.seal(),
+                        [self._reference_batch],
+                        keep_back=len(self._objects_batch) > 0,
+                    )
+                response = self._create_data(
+                    data_type="references",
+                    batch_request=self._reference_batch,
+                )
+                if self._spool is not None:
+                    self._spool.ack(self._reference_batch)
+                self._reference_batch = ReferenceBatchRequest()
 
-            self._references_throughput_frame.append(
-                len(self._reference_batch) / response.elapsed.total_seconds()
-            )
-            ref_per_sec = sum(self._references_throughput_frame) / len(
-                self._references_throughput_frame
-            )
+                self._references_throughput_frame.append(
+                    len(self._reference_batch) / response.elapsed.total_seconds()
+                )
+                ref_per_sec = sum(self._references_throughput_frame) / len(
+                    self._references_throughput_frame
+                )
 
-            self._recommended_num_references = round(ref_per_sec * self._creation_time)
+                self._recommended_num_references = round(ref_per_sec * self._creation_time)
 
-            res = _decode_json_response_list(response, "Create references")
-            assert res is not None
-            return res
-        return []
+                res = _decode_json_response_list(response, "Create references")
+                assert res is not None
+                return res
+            return []
 
     def _flush_in_thread(
         self,
@@ -1091,158 +2272,903 @@ class Batch:
 
         Returns
         -------
-        Tuple[requests.Response, int]
-            The request response and number of items sent with the BatchRequest as tuple.
+        Tuple[requests.Response, int]
+            The request response and number of items sent with the BatchRequest as tuple.
+        """
+
+        segment_id = self._spool.segment(batch_request) if self._spool is not None else None
+        try:
+            result: Tuple[Optional[Response], int] = (None, 0)
+            if len(batch_request) != 0 and self._min_bisect_size is not None:
+                result = (
+                    self._create_data_bisecting(data_type, batch_request, segment_id),
+                    len(batch_request),
+                )
+            elif len(batch_request) != 0:
+                response = self._create_data(
+                    data_type=data_type,
+                    batch_request=batch_request,
+                    delay_retries=True,
+                    segment_id=segment_id,
+                )
+                result = response, len(batch_request)
+            if self._spool is not None:
+                self._spool.ack(batch_request)
+            return result
+        except Exception as error:
+            if data_type == "objects" and len(self._retry_attempts) > 0:
+                # the retries in this batch request gave up
+                with self._retry_lock:
+                    for item in batch_request._items:
+                        if self._retry_attempts.pop(_item_key(data_type, item), None) is not None:
+                            self._count_retrying_object(item["id"], -1)
+            if len(batch_request._futures) > 0:
+                # the futures of items in the delayed retry queue are resolved by the retry
+                with self._retry_lock:
+                    delayed = {id(entry[4]) for entry in self._retry_queue}
+                for future in batch_request._futures.values():
+                    if id(future) not in delayed:
+                        future._set_exception(error)
+            raise
+        finally:
+            self._release_buffered_bytes(batch_request)
+
+    def _send_batch_requests(self, force_wait: bool) -> None:
+        """
+        Send BatchRequest in a separate thread/process. This methods submits a task to create only
+        the ObjectsBatchRequests to the BatchExecutor and adds the ReferencesBatchRequests to a
+        queue, then it carries on in the main thread until `num_workers` tasks have been submitted.
+        When we have reached number of tasks to be equal to `num_workers` it waits for all the
+        tasks to finish and handles the responses. After all ObjectsBatchRequests have been handled
+        it created separate tasks for each ReferencesBatchRequests, then it handles their responses
+        as well. This mechanism of creating References after Objects is constructed in this manner
+        to eliminate potential error when creating references from a object that does not yet
+        exists (object that is part of another task). A ReferencesBatchRequest is submitted as soon
+        as all ObjectsBatchRequests of the wave that contain its source or target objects are done.
+        In streaming mode the BatchRequests are instead handed over to the sender threads, see
+        `_enqueue_batch_requests`.
+
+        Parameters
+        ----------
+        force_wait : bool
+            Whether to wait on all created tasks even if we do not have `num_workers` tasks created
+        """
+        with self._send_lock:
+            self._raise_sender_error()
+            if self._streaming:
+                self._enqueue_batch_requests()
+                if force_wait:
+                    self._wait_for_senders()
+                return
+            self._send_waves(force_wait)
+
+    def _send_waves(self, force_wait: bool) -> None:
+        """
+        Submit the current batches to the BatchExecutor and wait for the wave of batch requests
+        if it is complete, see `_send_batch_requests`. Must be called with the send lock held.
+
+        Parameters
+        ----------
+        force_wait : bool
+            Whether to wait on all created tasks even if we do not have `num_workers` tasks created
+        """
+
+        if self._executor is None:
+            self.start()
+        elif self._executor.is_shutdown():
+            warnings.warn(
+                message=BATCH_EXECUTOR_SHUTDOWN_W,
+                category=RuntimeWarning,
+                stacklevel=1,
+            )
+            self.start()
+
+        assert self._executor is not None
+        with self._batch_lock:
+            objects_batches, reference_batches = self._take_batch_requests()
+        for objects_batch in objects_batches:
+            self._reserve_buffered_bytes(objects_batch)
+            future = self._executor.submit(
+                self._flush_in_thread,
+                data_type="objects",
+                batch_request=objects_batch,
+            )
+
+            self._future_pool.append(future)
+            for uuid in objects_batch.get_uuids():
+                self._wave_objects[uuid] = future
+        for reference_batch in reference_batches:
+            self._reference_batch_queue.append(reference_batch)
+            if self._max_buffered_bytes is not None:
+                with self._buffer_condition:
+                    self._queued_reference_bytes += reference_batch.num_bytes
+
+        if (
+            not force_wait
+            and self._active_num_workers > 1
+            and len(self._future_pool) < self._active_num_workers
+        ):
+            return
+
+        # references only wait for the objects batches that contain their objects
+        reference_future_pool = []
+        waiting_references = []
+        for reference_batch in self._reference_batch_queue:
+            dependencies = {
+                self._wave_objects[uuid]
+                for uuid in reference_batch.get_uuids()
+                if uuid in self._wave_objects
+            }
+            if len(dependencies) == 0 and not self._waits_for_retries(reference_batch):
+                reference_future_pool.append(self._submit_references(reference_batch))
+            else:
+                waiting_references.append((dependencies, reference_batch))
+
+        timeout_occurred = False
+        for done_future in as_completed(self._future_pool):
+            response_objects, nr_objects = done_future.result()
+            self._observe_objects_batch(response_objects, nr_objects)
+
+            # handle objects response
+            if response_objects is not None:
+                self._objects_throughput_frame.append(
+                    nr_objects / response_objects.elapsed.total_seconds()
+                )
+
+            else:
+                timeout_occurred = True
+
+            still_waiting = []
+            for dependencies, reference_batch in waiting_references:
+                dependencies.discard(done_future)
+                if len(dependencies) == 0 and not self._waits_for_retries(reference_batch):
+                    reference_future_pool.append(self._submit_references(reference_batch))
+                else:
+                    still_waiting.append((dependencies, reference_batch))
+            waiting_references = still_waiting
+
+        self._update_recommended_num_objects(timeout_occurred)
+
+        timeout_occurred = False
+        for done_future in as_completed(reference_future_pool):
+            response_references, nr_references = done_future.result()
+
+            # handle references response
+            if response_references is not None:
+                self._references_throughput_frame.append(
+                    nr_references / response_references.elapsed.total_seconds()
+                )
+            else:
+                timeout_occurred = True
+
+        self._update_recommended_num_references(timeout_occurred)
+
+        self._future_pool = []
+        self._wave_objects = {}
+        # references to objects that are retried later are sent in the wave of the retry
+        self._reference_batch_queue = [reference_batch for _, reference_batch in waiting_references]
+        self._adapt_num_workers()
+        return
+
+    def _submit_references(self, reference_batch: ReferenceBatchRequest) -> Future:
+        """
+        Submit a task that creates the references of a ReferenceBatchRequest to the BatchExecutor.
+
+        Parameters
+        ----------
+        reference_batch : ReferenceBatchRequest
+            The references to create.
+
+        Returns
+        -------
+        Future
+            The future of the task.
+        """
+
+        assert self._executor is not None
+        if self._max_buffered_bytes is not None:
+            with self._buffer_condition:
+                self._queued_reference_bytes -= reference_batch.num_bytes
+        self._reserve_buffered_bytes(reference_batch)
+        return self._executor.submit(
+            self._flush_in_thread,
+            data_type="references",
+            batch_request=reference_batch,
+        )
+
+    def _observe_objects_batch(self, response: Optional[Response], nr_objects: int) -> None:
+        """
+        Report the latency of a sent objects batch to the batch size controller, if there is one.
+
+        Parameters
+        ----------
+        response : Optional[requests.Response]
+            The response of the batch request, None if it did not return a response.
+        nr_objects : int
+            The number of objects in the batch request.
+        """
+
+        if self._batch_size_controller is None or nr_objects == 0:
+            return
+        self._batch_size_controller.observe(
+            nr_objects, None if response is None else response.elapsed.total_seconds()
+        )
+
+    def _adapt_num_workers(self) -> None:
+        """
+        Apply the number of workers recommended by the batch size controller. Only called between
+        two waves of batch requests, when the BatchExecutor is idle. The configured `num_workers`
+        is kept, so configuring the same value again does not restart the BatchExecutor.
+        """
+
+        if (
+            self._batch_size_controller is None
+            or self._batch_size_controller.num_workers == self._active_num_workers
+        ):
+            return
+        self._active_num_workers = self._batch_size_controller.num_workers
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = BatchExecutor(max_workers=self._active_num_workers)
+
+    def _update_recommended_num_objects(self, timeout_occurred: bool) -> None:
+        """
+        Recompute the recommended number of objects from the measured objects throughput, or take
+        it from the batch size controller if there is one.
+
+        Parameters
+        ----------
+        timeout_occurred : bool
+            Whether one of the handled object batches did not return a response.
+        """
+
+        if self._batch_size_controller is not None:
+            self._recommended_num_objects = self._batch_size_controller.batch_size
+            return
+        if timeout_occurred and self._recommended_num_objects is not None:
+            self._recommended_num_objects = max(self._recommended_num_objects // 2, 1)
+        elif (
+            len(self._objects_throughput_frame) != 0
+            and self._recommended_num_objects is not None
+            and not self._new_dynamic_batching
+        ):
+            obj_per_second = (
+                sum(self._objects_throughput_frame) / len(self._objects_throughput_frame) * 0.75
+            )
+            self._recommended_num_objects = max(
+                min(
+                    round(obj_per_second * self._creation_time),
+                    self._recommended_num_objects + 250,
+                ),
+                1,
+            )
+
+    def _update_recommended_num_references(self, timeout_occurred: bool) -> None:
+        """
+        Recompute the recommended number of references from the measured references throughput.
+
+        Parameters
+        ----------
+        timeout_occurred : bool
+            Whether one of the handled reference batches did not return a response.
+        """
+
+        if timeout_occurred and self._recommended_num_references is not None:
+            self._recommended_num_references = max(self._recommended_num_references // 2, 1)
+        elif (
+            len(self._references_throughput_frame) != 0
+            and self._recommended_num_references is not None
+        ):
+            ref_per_sec = sum(self._references_throughput_frame) / len(
+                self._references_throughput_frame
+            )
+            self._recommended_num_references = min(
+                round(ref_per_sec * self._creation_time),
+                self._recommended_num_references * 2,
+            )
+
+    def _enqueue_batch_requests(self) -> None:
+        """
+        Hand the current objects and references batches over to the sender threads (streaming
+        mode). Blocks only if `max_queued_batches` batch requests are already queued or in-flight.
+        References are held back until the enqueued object batches that contain their source or
+        target objects are done, so that references are never created from objects that do not
+        exist yet.
+        """
+
+        self._raise_sender_error()
+        if len(self._sender_threads) == 0:
+            self.start()
+        assert self._send_slots is not None
+
+        with self._batch_lock:
+            objects_batches, reference_batches = self._take_batch_requests()
+        for objects_batch in objects_batches:
+            if len(objects_batch) == 0:
+                continue
+            self._send_slots.acquire()
+            self._reserve_buffered_bytes(objects_batch)
+            batch_id = next(self._batch_ids)
+            with self._sender_lock:
+                for uuid in objects_batch.get_uuids():
+                    self._objects_in_flight[uuid] = batch_id
+            self._send_queue.put(("objects", batch_id, objects_batch))
+
+        for reference_batch in reference_batches:
+            self._send_slots.acquire()
+            self._reserve_buffered_bytes(reference_batch)
+            with self._sender_lock:
+                dependencies = {
+                    self._objects_in_flight[uuid]
+                    for uuid in reference_batch.get_uuids()
+                    if uuid in self._objects_in_flight
+                }
+                if len(dependencies) > 0 or self._waits_for_retries(reference_batch):
+                    self._waiting_references.append((dependencies, reference_batch))
+                else:
+                    self._send_queue.put(("references", next(self._batch_ids), reference_batch))
+
+    def _release_references(
+        self, objects_batch_id: int, objects_batch: ObjectsBatchRequest
+    ) -> None:
+        """
+        Mark an objects batch as done and enqueue all references that no longer wait on any
+        objects batch or on the retry of one of their objects.
+
+        Parameters
+        ----------
+        objects_batch_id : int
+            The id of the finished objects batch.
+        objects_batch : ObjectsBatchRequest
+            The finished objects batch.
+        """
+
+        with self._sender_lock:
+            for uuid in objects_batch.get_uuids():
+                # the object might have been added again in a later batch
+                if self._objects_in_flight.get(uuid) == objects_batch_id:
+                    del self._objects_in_flight[uuid]
+            still_waiting = []
+            for dependencies, reference_batch in self._waiting_references:
+                dependencies.discard(objects_batch_id)
+                if len(dependencies) == 0 and not self._waits_for_retries(reference_batch):
+                    self._send_queue.put(("references", next(self._batch_ids), reference_batch))
+                else:
+                    still_waiting.append((dependencies, reference_batch))
+            self._waiting_references = still_waiting
+
+    def _sender_loop(self) -> None:
+        """
+        Main loop of a sender thread (streaming mode). Sends queued batch requests, handles their
+        responses and updates the recommended batch sizes until it receives None.
+        """
+
+        assert self._send_slots is not None
+        while True:
+            item = self._send_queue.get()
+            if item is None:
+                self._send_queue.task_done()
+                return
+
+            data_type, batch_id, batch_request = item
+            try:
+                response, nr_items = self._flush_in_thread(data_type, batch_request)
+                if data_type == "objects":
+                    self._observe_objects_batch(response, nr_items)
+                    if response is not None:
+                        self._objects_throughput_frame.append(
+                            nr_items / response.elapsed.total_seconds()
+                        )
+                    self._update_recommended_num_objects(response is None)
+                else:
+                    if response is not None:
+                        self._references_throughput_frame.append(
+                            nr_items / response.elapsed.total_seconds()
+                        )
+                    self._update_recommended_num_references(response is None)
+            except Exception as error:  # re-raised in the producer thread
+                with self._sender_lock:
+                    if self._sender_error is None:
+                        self._sender_error = error
+            finally:
+                if data_type == "objects":
+                    assert isinstance(batch_request, ObjectsBatchRequest)
+                    self._release_references(batch_id, batch_request)
+                self._send_slots.release()
+                self._send_queue.task_done()
+
+    def _wait_for_senders(self) -> None:
+        """
+        Block until all queued batch requests have been sent (streaming mode) and re-raise the
+        first error of a sender thread, if there was one.
+        """
+
+        self._send_queue.join()
+        self._raise_sender_error()
+
+    def _raise_sender_error(self) -> None:
+        """Re-raise the first error that occurred in one of the sender threads."""
+
+        with self._sender_lock:
+            error, self._sender_error = self._sender_error, None
+        if error is not None:
+            raise error
+
+    def _new_objects_batch(self) -> ObjectsBatchRequest:
+        """
+        Create an empty ObjectsBatchRequest that tracks its size if `max_batch_bytes` or
+        `max_buffered_bytes` is set.
+
+        Returns
+        -------
+        ObjectsBatchRequest
+            The new ObjectsBatchRequest.
+        """
+
+        return ObjectsBatchRequest(
+            track_size=self._max_batch_bytes is not None or self._max_buffered_bytes is not None
+        )
+
+    def _split_objects_batch(self, objects_batch: ObjectsBatchRequest) -> List[ObjectsBatchRequest]:
+        """
+        Split an ObjectsBatchRequest into requests of at most `max_batch_bytes` bytes.
+
+        Parameters
+        ----------
+        objects_batch : ObjectsBatchRequest
+            The ObjectsBatchRequest to split.
+
+        Returns
+        -------
+        List[ObjectsBatchRequest]
+            The split requests, or only `objects_batch` if `max_batch_bytes` is not set.
+        """
+
+        if self._max_batch_bytes is None:
+            return [objects_batch]
+        return objects_batch.split(self._max_batch_bytes)
+
+    def _reserve_buffered_bytes(self, batch_request: BatchRequest) -> None:
+        """
+        Count a batch request that is handed over to the workers as in-flight until it is done,
+        see `_release_buffered_bytes`. Only used if `max_buffered_bytes` is set.
+
+        Parameters
+        ----------
+        batch_request : weaviate.batch.BatchRequest
+            The batch request that is handed over.
+        """
+
+        if self._max_buffered_bytes is None:
+            return
+        num_bytes = batch_request.num_bytes
+        with self._buffer_condition:
+            self._reserved_bytes[id(batch_request)] = num_bytes
+            self._in_flight_bytes += num_bytes
+
+    def _release_buffered_bytes(self, batch_request: BatchRequest) -> None:
+        """
+        Stop counting a done batch request as in-flight and wake up the blocked producers.
+
+        Parameters
+        ----------
+        batch_request : weaviate.batch.BatchRequest
+            The batch request that is done.
+        """
+
+        with self._buffer_condition:
+            num_bytes = self._reserved_bytes.pop(id(batch_request), None)
+            if num_bytes is None:
+                return
+            self._in_flight_bytes -= num_bytes
+            self._buffer_condition.notify_all()
+
+    def _wait_for_buffer_space(self) -> None:
+        """
+        Block while more than `max_buffered_bytes` are buffered and in-flight batch requests
+        still free some of them. Never blocks if nothing is in-flight, so the current batches
+        can always be filled and sent. Never blocks with a spool either, batch requests are
+        spilled to disk instead, see `_take_batch_requests`.
+        """
+
+        if self._max_buffered_bytes is None or self._spool is not None:
+            return
+        with self._buffer_condition:
+            while self._in_flight_bytes > 0 and self.buffered_bytes > self._max_buffered_bytes:
+                self._buffer_condition.wait()
+
+    def _has_buffer_space(self, num_bytes: int, pending: bool = False) -> bool:
+        """
+        Check whether batch requests of `num_bytes` bytes can be sent without exceeding
+        `max_buffered_bytes`.
+
+        Parameters
+        ----------
+        num_bytes : int
+            The size of the batch requests, including the pending ones.
+        pending : bool, optional
+            Whether some of the batch requests are already about to be sent, by default False.
+
+        Returns
+        -------
+        bool
+            True if they fit into the buffer, or if nothing is in-flight or pending so that the
+            import always makes progress.
+        """
+
+        if self._max_buffered_bytes is None:
+            return True
+        with self._buffer_condition:
+            if self._in_flight_bytes == 0 and not pending:
+                return True
+            return self.buffered_bytes + num_bytes <= self._max_buffered_bytes
+
+    def _spool_added(self, data_type: str, start: int) -> None:
+        """
+        Append the objects or references added to the current batch to the spool, if there is one.
+
+        Parameters
+        ----------
+        data_type : str
+            Either 'objects' or 'references'.
+        start : int
+            The index of the first added item in the current batch.
+        """
+
+        if self._spool is None:
+            return
+        if data_type == "objects":
+            items = self._objects_batch.get_request_body()["objects"][start:]
+        else:
+            items = self._reference_batch.get_request_body()[start:]
+        self._spool.append(data_type, items)
+
+    def _take_batch_requests(
+        self,
+    ) -> Tuple[List[ObjectsBatchRequest], List[ReferenceBatchRequest]]:
+        """
+        Take the current objects and references batches to send them and replace them with empty
+        ones. Items of the delayed retry queue whose backoff is over are added to them first. With a
+        spool, the sealed segment of the current batches is bound to the batch
+        requests, or spilled to disk if earlier segments are spilled or there is no buffer space
+        for them. Spilled segments are loaded again, oldest first, as long as there is space.
+
+        Returns
+        -------
+        Tuple[List[ObjectsBatchRequest], List[ReferenceBatchRequest]]
+            The objects batches, split by `max_batch_bytes`, and the non-empty reference batches
+            to send.
+        """
+
+        self._add_due_retries()
+        self._oldest_item_time = None
+        objects_batches = self._split_objects_batch(self._objects_batch)
+        reference_batches = [self._reference_batch] if len(self._reference_batch) > 0 else []
+        self._objects_batch = self._new_objects_batch()
+        self._reference_batch = ReferenceBatchRequest()
+        if self._spool is None:
+            return objects_batches, reference_batches
+
+        segment_id = self._spool.seal()
+        batch_requests: List[BatchRequest] = [
+            batch for batch in [*objects_batches, *reference_batches] if len(batch) > 0
+        ]
+        if self._carried_segment is not None:
+            # the kept back items of the carried segment are only in memory
+            self._hold_segment(segment_id, batch_requests)
+            return objects_batches, reference_batches
+        if segment_id is None and len(self._spilled_segments) == 0:
+            return objects_batches, reference_batches
+        if segment_id is not None:
+            if len(self._spilled_segments) == 0 and self._has_buffer_space(
+                sum(batch.num_bytes for batch in batch_requests)
+            ):
+                self._spool.hold(segment_id, batch_requests)
+                return objects_batches, reference_batches
+            # the in-memory batches are dropped, the items are read from disk when there is space
+            self._spilled_segments.append(segment_id)
+            if any(len(batch._futures) > 0 for batch in batch_requests):
+                self._spilled_futures[segment_id] = {
+                    data_type: deque(
+                        batch._futures.get(id(item)) for batch in batches for item in batch._items
+                    )
+                    for data_type, batches in (
+                        ("objects", objects_batches),
+                        ("references", reference_batches),
+                    )
+                }
+        return self._load_spilled_segments()
+
+    def _hold_segment(
+        self,
+        segment_id: Optional[int],
+        batch_requests: Sequence[BatchRequest],
+        keep_back: bool = False,
+    ) -> None:
+        """
+        Bind a sealed spool segment to the batch requests that are sent. If there is a carried
+        segment, whose objects or references were kept back in the current batches, it is kept
+        until the new segment is deleted, or bound to the batch requests itself if nothing was
+        appended since it was sealed.
+
+        Parameters
+        ----------
+        segment_id : Optional[int]
+            The id of the sealed segment, None if the active segment was empty.
+        batch_requests : Sequence[weaviate.batch.BatchRequest]
+            The batch requests that are sent.
+        keep_back : bool, optional
+            Whether items of the segment are kept back in the current batches, e.g. the
+            references when only the objects are created. The segment is then carried to the
+            next call, by default False.
+        """
+
+        assert self._spool is not None
+        carried, self._carried_segment = self._carried_segment, None
+        if segment_id is None:
+            if carried is None:
+                return
+            segment_id = carried
+        elif carried is not None:
+            self._spool.chain(segment_id, carried)
+            carried = None
+        self._spool.hold(segment_id, batch_requests)
+        if keep_back:
+            self._spool.retain(segment_id)
+            self._carried_segment = segment_id
+        if carried is not None:
+            self._spool.release(carried)
+
+    def _delay_retries(
+        self,
+        data_type: str,
+        response: BatchResponse,
+        futures: Dict[int, BatchItemFuture],
+        segment_id: Optional[int] = None,
+    ) -> Tuple[BatchResponse, int]:
+        """
+        Put the items of a batch response that failed with a retryable error into the delayed
+        retry queue, see `WeaviateErrorRetryConf.backoff`.
+
+        Parameters
+        ----------
+        data_type : str
+            Either 'objects' or 'references'.
+        response : BatchResponse
+            The decoded batch response.
+        futures : Dict[int, BatchItemFuture]
+            The futures of the response items, see `_match_item_futures`. The futures of the
+            delayed items are moved to the delayed retry queue.
+        segment_id : Optional[int], optional
+            The spool segment of the items. It is retained for every delayed item until the
+            item is added to the current batches and the spool again, so the item survives a crash
+            during its backoff. By default None.
+
+        Returns
+        -------
+        Tuple[BatchResponse, int]
+            The items that are done, with the number of times they were sent as "attempts", and
+            the number of items that are retried later.
         """
 
-        if len(batch_request) != 0:
-            response = self._create_data(
-                data_type=data_type,
-                batch_request=batch_request,
-            )
-            return response, len(batch_request)
-        return None, 0
+        conf = self._weaviate_error_retry
+        assert conf is not None and conf.backoff is not None
+        done: BatchResponse = []
+        num_delayed = 0
+        now = time.monotonic()
+        with self._retry_lock:
+            for item in response:
+                key = _item_key(data_type, item)
+                attempts = self._retry_attempts.pop(key, 0) + 1
+                if attempts > 1 and data_type == "objects":
+                    self._count_retrying_object(item["id"], -1)
+                if attempts > conf.number_retries or BatchRequest._skip_objects_retry(
+                    item, conf.errors_to_exclude, conf.errors_to_include
+                ):
+                    item["attempts"] = attempts
+                    done.append(item)
+                    continue
+                self._retry_attempts[key] = attempts
+                if data_type == "objects":
+                    self._count_retrying_object(item["id"], 1)
+                delay = min(conf.backoff * 2 ** (attempts - 1), conf.max_backoff)
+                heapq.heappush(
+                    self._retry_queue,
+                    (
+                        now + delay,
+                        next(self._retry_ids),
+                        data_type,
+                        item,
+                        futures.pop(id(item), None),
+                        segment_id,
+                    ),
+                )
+                if segment_id is not None:
+                    assert self._spool is not None
+                    self._spool.retain(segment_id)
+                num_delayed += 1
+        return done, num_delayed
 
-    def _send_batch_requests(self, force_wait: bool) -> None:
+    def _count_retrying_object(self, uuid: str, delta: int) -> None:
         """
-        Send BatchRequest in a separate thread/process. This methods submits a task to create only
-        the ObjectsBatchRequests to the BatchExecutor and adds the ReferencesBatchRequests to a
-        queue, then it carries on in the main thread until `num_workers` tasks have been submitted.
-        When we have reached number of tasks to be equal to `num_workers` it waits for all the
-        tasks to finish and handles the responses. After all ObjectsBatchRequests have been handled
-        it created separate tasks for each ReferencesBatchRequests, then it handles their responses
-        as well. This mechanism of creating References after Objects is constructed in this manner
-        to eliminate potential error when creating references from a object that does not yet
-        exists (object that is part of another task).
+        Change the number of objects with a UUID that wait for a retry or whose retry is in
+        flight. Must be called with the retry lock held.
 
         Parameters
         ----------
-        force_wait : bool
-            Whether to wait on all created tasks even if we do not have `num_workers` tasks created
+        uuid : str
+            The UUID of the object.
+        delta : int
+            1 if an object is put into the delayed retry queue, -1 if its retry is done.
         """
-        if self._executor is None:
-            self.start()
-        elif self._executor.is_shutdown():
-            warnings.warn(
-                message=BATCH_EXECUTOR_SHUTDOWN_W,
-                category=RuntimeWarning,
-                stacklevel=1,
-            )
-            self.start()
 
-        assert self._executor is not None
-        future = self._executor.submit(
-            self._flush_in_thread,
-            data_type="objects",
-            batch_request=self._objects_batch,
-        )
+        count = self._retrying_objects.get(uuid, 0) + delta
+        if count > 0:
+            self._retrying_objects[uuid] = count
+        else:
+            self._retrying_objects.pop(uuid, None)
 
-        self._future_pool.append(future)
-        if len(self._reference_batch) > 0:
-            self._reference_batch_queue.append(self._reference_batch)
+    def _waits_for_retries(self, reference_batch: ReferenceBatchRequest) -> bool:
+        """
+        Check if the source or target object of one of the references of a batch waits for a
+        delayed retry, or if its retry is in flight. Such references are held back until the
+        retry succeeded or gave up.
 
-        self._objects_batch = ObjectsBatchRequest()
-        self._reference_batch = ReferenceBatchRequest()
+        Parameters
+        ----------
+        reference_batch : ReferenceBatchRequest
+            The references.
 
-        if not force_wait and self._num_workers > 1 and len(self._future_pool) < self._num_workers:
-            return
-        timeout_occurred = False
-        for done_future in as_completed(self._future_pool):
-            response_objects, nr_objects = done_future.result()
+        Returns
+        -------
+        bool
+            Whether the references have to wait.
+        """
 
-            # handle objects response
-            if response_objects is not None:
-                self._objects_throughput_frame.append(
-                    nr_objects / response_objects.elapsed.total_seconds()
-                )
+        with self._retry_lock:
+            if len(self._retrying_objects) == 0:
+                return False
+            return any(uuid in self._retrying_objects for uuid in reference_batch.get_uuids())
 
-            else:
-                timeout_occurred = True
+    def _add_due_retries(self) -> None:
+        """
+        Move the items of the delayed retry queue whose backoff is over into the current batches.
+        """
 
-        if timeout_occurred and self._recommended_num_objects is not None:
-            self._recommended_num_objects = max(self._recommended_num_objects // 2, 1)
-        elif (
-            len(self._objects_throughput_frame) != 0
-            and self._recommended_num_objects is not None
-            and not self._new_dynamic_batching
-        ):
-            obj_per_second = (
-                sum(self._objects_throughput_frame) / len(self._objects_throughput_frame) * 0.75
-            )
-            self._recommended_num_objects = max(
-                min(
-                    round(obj_per_second * self._creation_time),
-                    self._recommended_num_objects + 250,
-                ),
-                1,
-            )
+        now = time.monotonic()
+        due = []
+        with self._retry_lock:
+            while len(self._retry_queue) > 0 and self._retry_queue[0][0] <= now:
+                due.append(heapq.heappop(self._retry_queue))
+        for _, _, data_type, item, future, segment_id in due:
+            start = len(self._objects_batch if data_type == "objects" else self._reference_batch)
+            _add_batch_item(self._objects_batch, self._reference_batch, data_type, item, future)
+            self._spool_added(data_type, start)
+            if segment_id is not None and self._spool is not None:
+                # the item is in the active segment now
+                self._spool.release(segment_id)
+
+    def _next_retry_delay(self) -> Optional[float]:
+        """
+        The time until the backoff of the next item in the delayed retry queue is over.
 
-        # Create references after all the objects have been created
-        reference_future_pool = []
-        for reference_batch in self._reference_batch_queue:
-            future = self._executor.submit(
-                self._flush_in_thread,
-                data_type="references",
-                batch_request=reference_batch,
-            )
-            reference_future_pool.append(future)
+        Returns
+        -------
+        Optional[float]
+            The time in seconds, None if the delayed retry queue is empty.
+        """
 
-        timeout_occurred = False
-        for done_future in as_completed(reference_future_pool):
-            response_references, nr_references = done_future.result()
+        with self._retry_lock:
+            if len(self._retry_queue) == 0:
+                return None
+            return max(self._retry_queue[0][0] - time.monotonic(), 0)
 
-            # handle references response
-            if response_references is not None:
-                self._references_throughput_frame.append(
-                    nr_references / response_references.elapsed.total_seconds()
-                )
-            else:
-                timeout_occurred = True
+    def _load_spilled_segments(
+        self,
+    ) -> Tuple[List[ObjectsBatchRequest], List[ReferenceBatchRequest]]:
+        """
+        Load spilled spool segments, oldest first, while they fit into `max_buffered_bytes`. The
+        size of a segment file is used as the size of its batch requests.
 
-        if timeout_occurred and self._recommended_num_references is not None:
-            self._recommended_num_references = max(self._recommended_num_references // 2, 1)
-        elif (
-            len(self._references_throughput_frame) != 0
-            and self._recommended_num_references is not None
+        Returns
+        -------
+        Tuple[List[ObjectsBatchRequest], List[ReferenceBatchRequest]]
+            The objects and reference batches of the loaded segments.
+        """
+
+        assert self._spool is not None
+        objects_batches: List[ObjectsBatchRequest] = []
+        reference_batches: List[ReferenceBatchRequest] = []
+        num_bytes = 0
+        while len(self._spilled_segments) > 0 and self._has_buffer_space(
+            num_bytes + self._spool.size(self._spilled_segments[0]),
+            pending=len(objects_batches) + len(reference_batches) > 0,
         ):
-            ref_per_sec = sum(self._references_throughput_frame) / len(
-                self._references_throughput_frame
-            )
-            self._recommended_num_references = min(
-                round(ref_per_sec * self._creation_time),
-                self._recommended_num_references * 2,
-            )
+            segment_id = self._spilled_segments.popleft()
+            objects_batch, reference_batch = self._load_segment(segment_id)
+            loaded_objects = [
+                batch for batch in self._split_objects_batch(objects_batch) if len(batch) > 0
+            ]
+            loaded_references = [reference_batch] if len(reference_batch) > 0 else []
+            self._spool.hold(segment_id, [*loaded_objects, *loaded_references])
+            objects_batches.extend(loaded_objects)
+            reference_batches.extend(loaded_references)
+            num_bytes += sum(batch.num_bytes for batch in [*loaded_objects, *loaded_references])
+        return objects_batches, reference_batches
+
+    def _load_segment(self, segment_id: int) -> Tuple[ObjectsBatchRequest, ReferenceBatchRequest]:
+        """
+        Read the objects and references of a spool segment into new batches.
 
-        self._future_pool = []
-        self._reference_batch_queue = []
-        return
+        Parameters
+        ----------
+        segment_id : int
+            The id of the segment.
+
+        Returns
+        -------
+        Tuple[ObjectsBatchRequest, ReferenceBatchRequest]
+            The objects and the references of the segment.
+        """
+
+        assert self._spool is not None
+        objects_batch = self._new_objects_batch()
+        reference_batch = ReferenceBatchRequest()
+        futures = self._spilled_futures.pop(segment_id, None)
+        for data_type, item in self._spool.read(segment_id):
+            future = futures[data_type].popleft() if futures is not None else None
+            _add_batch_item(objects_batch, reference_batch, data_type, item, future)
+        return objects_batch, reference_batch
 
     def _auto_create(self) -> None:
         """
         Auto create both objects and references in the batch. This protected method works with a
         fixed batch size and with dynamic batching. For a 'fixed' batching type it auto-creates
         when the sum of both objects and references equals batch_size. For dynamic batching it
-        creates both batch requests when only one is full.
+        creates both batch requests when only one is full. Must not be called with the batch lock
+        held, so other threads can add items while the batch requests are sent.
         """
 
-        # greater or equal in case the self._batch_size is changed manually
-        if self._batching_type == "fixed":
-            assert self._batch_size is not None
-            if sum(self.shape) >= self._batch_size:
-                self._send_batch_requests(force_wait=False)
+        if not self._is_batch_full():
             return
-        elif self._batching_type == "dynamic":
-            if (
-                self.num_objects() >= self._recommended_num_objects
-                or self.num_references() >= self._recommended_num_references
-            ):
-                while self._recommended_num_objects == 0:
-                    time.sleep(1)  # block if weaviate is overloaded
-
+        if self._batching_type == "dynamic":
+            while self._recommended_num_objects == 0:
+                time.sleep(1)  # block if weaviate is overloaded
+        with self._send_lock:
+            # another thread may have sent the batches in the meantime
+            if self._is_batch_full():
                 self._send_batch_requests(force_wait=False)
-            return
-        # just in case
-        raise ValueError(f'Unsupported batching type "{self._batching_type}"')
+
+    def _is_batch_full(self) -> bool:
+        """
+        Check if the current batches have to be created, see `_auto_create`.
+
+        Returns
+        -------
+        bool
+            Whether the current batches are full.
+        """
+
+        with self._batch_lock:
+            # create the batch if another object of average size would not fit into max_batch_bytes
+            bytes_budget_reached = (
+                self._max_batch_bytes is not None
+                and len(self._objects_batch) > 0
+                and self._objects_batch.num_bytes * (len(self._objects_batch) + 1)
+                > self._max_batch_bytes * len(self._objects_batch)
+            )
+            # greater or equal in case the self._batch_size is changed manually
+            if self._batching_type == "fixed":
+                assert self._batch_size is not None
+                return sum(self.shape) >= self._batch_size or bytes_budget_reached
+            elif self._batching_type == "dynamic":
+                return (
+                    self.num_objects() >= self._recommended_num_objects
+                    or self.num_references() >= self._recommended_num_references
+                    or bytes_budget_reached
+                )
+            # just in case
+            raise ValueError(f'Unsupported batching type "{self._batching_type}"')
 
     def flush(self) -> None:
         """
@@ -1250,6 +3176,57 @@ class Batch:
         if one is provided. (See the docs for `configure` or `__call__` for how to set one.)
         """
         self._send_batch_requests(force_wait=True)
+        while True:
+            retry_delay = self._next_retry_delay()
+            if len(self._spilled_segments) == 0:
+                if retry_delay is None:
+                    break
+                time.sleep(retry_delay)
+            self._send_batch_requests(force_wait=True)
+
+    def resume(self, spool_dir: str) -> int:
+        """
+        Send the objects and references that were left in a spool directory by an earlier run,
+        e.g. after a crash, and flush the batch. Only items that were not acknowledged by weaviate
+        are sent again. Enables the spool for this batch if it was not configured with
+        `spool_dir` (see `configure`).
+        NOTE: Items that were sent but not acknowledged before the crash are sent a second
+        time. This replaces the objects with themselves but can duplicate references.
+
+        Parameters
+        ----------
+        spool_dir : str
+            The spool directory of the earlier run.
+
+        Returns
+        -------
+        int
+            The number of objects and references that were sent again.
+
+        Raises
+        ------
+        ValueError
+            If the batch is configured with a different spool directory.
+        """
+
+        if self._spool is None:
+            self._spool = BatchSpool(spool_dir)
+        elif self._spool.directory != os.path.abspath(spool_dir):
+            raise ValueError(
+                f"The batch is configured with the spool directory {self._spool.directory}, "
+                f"it cannot resume from {spool_dir}."
+            )
+
+        leftover_segments = [
+            segment_id
+            for segment_id in self._spool.segments()
+            if segment_id not in self._spilled_segments
+        ]
+        num_items = sum(1 for segment_id in leftover_segments for _ in self._spool.read(segment_id))
+        # older than all segments of this run
+        self._spilled_segments.extendleft(reversed(leftover_segments))
+        self.flush()
+        return num_items
 
     def delete_objects(
         self,
@@ -1413,7 +3390,8 @@ class Batch:
             If batch is empty or index is out of range.
         """
 
-        return self._objects_batch.pop(index)
+        with self._batch_lock:
+            return self._objects_batch.pop(index)
 
     def pop_reference(self, index: int = -1) -> dict:
         """
@@ -1435,21 +3413,24 @@ class Batch:
             If batch is empty or index is out of range.
         """
 
-        return self._reference_batch.pop(index)
+        with self._batch_lock:
+            return self._reference_batch.pop(index)
 
     def empty_objects(self) -> None:
         """
         Remove all the objects from the batch.
         """
 
-        self._objects_batch.empty()
+        with self._batch_lock:
+            self._objects_batch.empty()
 
     def empty_references(self) -> None:
         """
         Remove all the references from the batch.
         """
 
-        self._reference_batch.empty()
+        with self._batch_lock:
+            self._reference_batch.empty()
 
     def is_empty_objects(self) -> bool:
         """
@@ -1609,6 +3590,61 @@ class Batch:
 
         return self._recommended_num_references
 
+    @property
+    def buffered_bytes(self) -> int:
+        """
+        The approximate size in bytes of all objects and references held by the batch: the
+        current batches plus the queued and in-flight batch requests. Only the current batches
+        are counted if `max_buffered_bytes` is not set.
+
+        Returns
+        -------
+        int
+            The approximate number of buffered bytes.
+        """
+
+        with self._buffer_condition:
+            return (
+                self._in_flight_bytes
+                + self._queued_reference_bytes
+                + self._objects_batch.num_bytes
+                + self._reference_batch.num_bytes
+            )
+
+    @property
+    def stats(self) -> BatchStats:
+        """
+        The overall counters of this batch, the recommended batch sizes and the number of batch
+        requests that are queued or in-flight. Use the `metrics_callback` of `configure` to get
+        the metrics of every single batch request.
+
+        Returns
+        -------
+        BatchStats
+            A snapshot of the current state.
+        """
+
+        if self._streaming:
+            queue_depth = self._send_queue.qsize() + len(self._waiting_references)
+        else:
+            queue_depth = sum(not future.done() for future in self._future_pool) + len(
+                self._reference_batch_queue
+            )
+        with self._counters_lock:
+            return BatchStats(
+                num_requests=self._counters["requests"],
+                num_items=self._counters["items"],
+                timeout_retries=self._counters["timeout_retries"],
+                connection_error_retries=self._counters["connection_error_retries"],
+                error_retries=self._counters["error_retries"],
+                recommended_num_objects=self._recommended_num_objects,
+                recommended_num_references=self._recommended_num_references,
+                queue_depth=queue_depth,
+                buffered_bytes=self.buffered_bytes,
+                delayed_retries=len(self._retry_queue),
+                isolated_items=self._counters["isolated_items"],
+            )
+
     def start(self) -> "Batch":
         """
         Start the BatchExecutor if it was closed.
@@ -1620,22 +3656,58 @@ class Batch:
         """
 
         if self._executor is None or self._executor.is_shutdown():
-            self._executor = BatchExecutor(max_workers=self._num_workers)
+            self._executor = BatchExecutor(max_workers=self._active_num_workers)
 
-        if self._batching_type == "dynamic" and (
-            self._shutdown_background_event is None or self._shutdown_background_event.is_set()
+        if self._streaming and len(self._sender_threads) == 0:
+            self._send_slots = threading.BoundedSemaphore(
+                self._max_queued_batches
+                if self._max_queued_batches is not None
+                else 2 * self._num_workers
+            )
+            for i in range(self._num_workers):
+                sender = threading.Thread(
+                    target=self._sender_loop,
+                    daemon=True,
+                    name=f"batchSender-{i}",
+                )
+                sender.start()
+                self._sender_threads.append(sender)
+
+        if (
+            self._batching_type == "dynamic"
+            and self._batch_size_controller is None
+            and (
+                self._shutdown_background_event is None or self._shutdown_background_event.is_set()
+            )
         ):
             self._update_recommended_batch_size()
 
+        if (
+            self._max_linger_ms is not None
+            and self._batching_type is not None
+            and self._linger_thread is None
+        ):
+            self._start_linger_thread()
+
         return self
 
     def shutdown(self) -> None:
         """
-        Shutdown the BatchExecutor.
+        Shutdown the BatchExecutor and, in streaming mode, the sender threads. Waits for all
+        queued batch requests to be sent.
         """
+        self._stop_linger_thread()
         if not (self._executor is None or self._executor.is_shutdown()):
             self._executor.shutdown()
 
+        if len(self._sender_threads) > 0:
+            self._send_queue.join()
+            for _ in self._sender_threads:
+                self._send_queue.put(None)
+            for sender in self._sender_threads:
+                sender.join()
+            self._sender_threads = []
+
         if self._shutdown_background_event is not None:
             self._shutdown_background_event.set()
 
@@ -1812,7 +3884,7 @@ class Batch:
         self._connection_error_retries = value
 
     def _retry_on_error(
-        self, response: BatchResponse, data_type: str
+        self, response: BatchResponse, data_type: str, futures: Dict[int, BatchItemFuture]
     ) -> Tuple[BatchRequestType, BatchResponse]:
         if data_type == "objects":
             new_batch: Union[ObjectsBatchRequest, ReferenceBatchRequest] = ObjectsBatchRequest()
@@ -1824,12 +3896,247 @@ class Batch:
             self._weaviate_error_retry.errors_to_exclude,
             self._weaviate_error_retry.errors_to_include,
         )
+        if len(futures) > 0:
+            # the failed items are added to the new batch in the order of the response
+            successful = {id(item) for item in successful_responses}
+            failed = [item for item in response if id(item) not in successful]
+            for item, new_item in zip(failed, new_batch._items):
+                future = futures.pop(id(item), None)
+                if future is not None:
+                    new_batch._futures[id(new_item)] = future
         return new_batch, successful_responses
 
 
+def _add_batch_item(
+    objects_batch: ObjectsBatchRequest,
+    reference_batch: ReferenceBatchRequest,
+    data_type: str,
+    item: Dict[str, Any],
+    future: Optional[BatchItemFuture] = None,
+) -> None:
+    """
+    Add an item as it is sent to (or returned by) weaviate to the objects or references batch.
+
+    Parameters
+    ----------
+    objects_batch : ObjectsBatchRequest
+        The batch objects are added to.
+    reference_batch : ReferenceBatchRequest
+        The batch references are added to.
+    data_type : str
+        Either 'objects' or 'references'.
+    item : Dict[str, Any]
+        The object or reference.
+    future : Optional[BatchItemFuture], optional
+        The future of the item, by default None.
+    """
+
+    if data_type == "objects":
+        objects_batch.add(
+            class_name=item["class"],
+            data_object=item["properties"],
+            uuid=item["id"],
+            vector=item.get("vector", None),
+            tenant=item.get("tenant", None),
+            copy_object=False,
+        )
+        if future is not None:
+            objects_batch._futures[id(objects_batch._items[-1])] = future
+        return
+    # beacons: weaviate://localhost/<class>/<uuid>/<property> and .../[<class>/]<uuid>
+    from_parts = item["from"].split("/")
+    to_parts = item["to"].split("/")
+    reference_batch.add(
+        from_object_class_name=from_parts[3],
+        from_object_uuid=from_parts[4],
+        from_property_name=from_parts[5],
+        to_object_uuid=to_parts[-1],
+        to_object_class_name=to_parts[3] if len(to_parts) == 5 else None,
+        tenant=item.get("tenant", None),
+    )
+    if future is not None:
+        reference_batch._futures[id(reference_batch._items[-1])] = future
+
+
+def _item_key(data_type: str, item: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+    """
+    The key of an object or reference, used to match the items of a batch response with the
+    delayed retries and with the futures of the items of the batch request.
+
+    Parameters
+    ----------
+    data_type : str
+        Either 'objects' or 'references'.
+    item : Dict[str, Any]
+        The object or reference.
+
+    Returns
+    -------
+    Tuple[Optional[str], ...]
+        The key.
+    """
+
+    if data_type == "objects":
+        return data_type, item.get("class"), item.get("id"), item.get("tenant")
+    return data_type, item.get("from"), item.get("to"), item.get("tenant")
+
+
+def _same_vector(sent: Optional[Sequence[float]], stored: Optional[Sequence[float]]) -> bool:
+    """
+    Check if a vector as it was sent is the vector stored by weaviate. Weaviate stores vectors as
+    float32, so both are compared with float32 precision.
+
+    Parameters
+    ----------
+    sent : Optional[Sequence[float]]
+        The vector as it was sent, None if none was sent.
+    stored : Optional[Sequence[float]]
+        The vector returned by weaviate, None if it returned none.
+
+    Returns
+    -------
+    bool
+        Whether the vectors are the same.
+    """
+
+    if sent is None or stored is None:
+        return sent is None and stored is None
+    return array("f", sent) == array("f", stored)
+
+
+class _GrpcBatchResponse(Response):
+    """
+    Response of a batch that was sent over gRPC. Holds the per-object results in the same format as
+    the REST endpoint, so both transports share the same response handling.
+    """
+
+    def __init__(self, results: BatchResponse, elapsed: datetime.timedelta):
+        super().__init__()
+        self.status_code = 200
+        self.elapsed = elapsed
+        self._results = results
+
+    def json(self, **kwargs: Any) -> BatchResponse:
+        return self._results
+
+
+def _object_to_grpc(obj: Dict[str, Any]) -> Optional["batch_pb2.BatchObject"]:
+    """
+    Convert an object of an ObjectsBatchRequest to a gRPC BatchObject.
+
+    Parameters
+    ----------
+    obj : Dict[str, Any]
+        The object as it is sent to the REST endpoint.
+
+    Returns
+    -------
+    Optional[batch_pb2.BatchObject]
+        The gRPC object, or None if the properties cannot be represented over gRPC.
+    """
+
+    properties = _properties_to_grpc(obj["properties"])
+    if properties is None:
+        return None
+
+    return batch_pb2.BatchObject(
+        uuid=obj["id"],
+        collection=obj["class"],
+        vector=obj.get("vector", None),
+        properties=properties,
+        tenant=obj.get("tenant", None),
+    )
+
+
+def _properties_to_grpc(properties: Dict[str, Any]) -> Optional["batch_pb2.BatchObject.Properties"]:
+    """
+    Convert the properties of an object to gRPC properties. Only primitive properties and arrays of
+    primitives are supported, references and nested objects are sent over REST.
+
+    Parameters
+    ----------
+    properties : Dict[str, Any]
+        The properties of the object.
+
+    Returns
+    -------
+    Optional[batch_pb2.BatchObject.Properties]
+        The gRPC properties, or None if they contain unsupported values.
+    """
+
+    non_ref_properties: Dict[str, Any] = {}
+    number_arrays: List["base_pb2.NumberArrayProperties"] = []
+    int_arrays: List["base_pb2.IntArrayProperties"] = []
+    text_arrays: List["base_pb2.TextArrayProperties"] = []
+    boolean_arrays: List["base_pb2.BooleanArrayProperties"] = []
+
+    for name, value in properties.items():
+        if isinstance(value, int) and not isinstance(value, bool):
+            # non_ref_properties is a Struct, which stores numbers as doubles
+            if abs(value) > _MAX_EXACT_DOUBLE_INT:
+                return None
+            non_ref_properties[name] = value
+        elif value is None or isinstance(value, (str, bool, float)):
+            non_ref_properties[name] = value
+        elif not isinstance(value, list) or len(value) == 0:
+            return None
+        elif all(isinstance(entry, bool) for entry in value):
+            boolean_arrays.append(base_pb2.BooleanArrayProperties(prop_name=name, values=value))
+        elif all(isinstance(entry, int) and not isinstance(entry, bool) for entry in value):
+            if any(not _INT64_MIN <= entry <= _INT64_MAX for entry in value):
+                return None
+            int_arrays.append(base_pb2.IntArrayProperties(prop_name=name, values=value))
+        elif all(
+            isinstance(entry, (int, float)) and not isinstance(entry, bool) for entry in value
+        ):
+            if any(
+                isinstance(entry, int) and abs(entry) > _MAX_EXACT_DOUBLE_INT for entry in value
+            ):
+                return None
+            number_arrays.append(base_pb2.NumberArrayProperties(prop_name=name, values=value))
+        elif all(isinstance(entry, str) for entry in value):
+            text_arrays.append(base_pb2.TextArrayProperties(prop_name=name, values=value))
+        else:
+            return None
+
+    return batch_pb2.BatchObject.Properties(
+        non_ref_properties=non_ref_properties,
+        number_array_properties=number_arrays,
+        int_array_properties=int_arrays,
+        text_array_properties=text_arrays,
+        boolean_array_properties=boolean_arrays,
+    )
+
+
 N = TypeVar("N", bound=Union[int, float, Real])
 
 
+def _num_rows(
+    properties: Optional[Mapping[str, Sequence]],
+    vectors: Optional[Sequence],
+    uuids: Optional[Sequence[UUID]],
+    tenants: Union[str, Sequence[str], None],
+) -> int:
+    """
+    Get the number of objects of columnar data and check that all columns have the same length.
+
+    Raises
+    ------
+    ValueError
+        If the columns have different lengths.
+    """
+
+    columns: List[Sequence] = list(properties.values()) if properties is not None else []
+    columns += [column for column in (vectors, uuids) if column is not None]
+    if tenants is not None and not isinstance(tenants, str):
+        columns.append(tenants)
+
+    lengths = {len(column) for column in columns}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length. Given lengths: {lengths}")
+    return lengths.pop() if len(lengths) == 1 else 0
+
+
 def _check_non_negative(value: N, arg_name: str, data_type: Type[N]) -> None:
     """
     Check if the `value` of the `arg_name` is a non-negative number.
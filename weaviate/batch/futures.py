@@ -0,0 +1,145 @@
+"""
+Futures returned by `Batch` for single objects and references, see `Batch.add_data_object_future`.
+"""
+import concurrent.futures
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+# one lock for the state of all futures, so a future costs no more than a small object per added
+# item; only futures that are waited for get an event, which wakes up only their own waiters
+_state_lock = threading.Lock()
+
+
+class BatchItemFuture:
+    """
+    The outcome of one object or reference added with `Batch.add_data_object_future` or
+    `Batch.add_reference_future`. It is resolved once weaviate acknowledged the item, after all
+    retries, with the item as returned by weaviate, or with a `BatchItemFailedException` if
+    weaviate reported an error for it. If the batch request fails as a whole, it is resolved with
+    the exception of the batch request.
+
+    The interface follows `concurrent.futures.Future`, without cancellation.
+    """
+
+    __slots__ = ("_result", "_exception", "_done", "_callbacks", "_event")
+
+    def __init__(self) -> None:
+        self._result: Optional[Dict[str, Any]] = None
+        self._exception: Optional[BaseException] = None
+        self._done = False
+        self._callbacks: List[Callable[["BatchItemFuture"], None]] = []
+        self._event: Optional[threading.Event] = None
+
+    def done(self) -> bool:
+        """
+        Whether the item was acknowledged or failed.
+
+        Returns
+        -------
+        bool
+            True if the future is resolved.
+        """
+
+        return self._done
+
+    def result(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for the item to be acknowledged by weaviate.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            The maximal time to wait in seconds, None to wait without limit, by default None.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The object or reference as returned by weaviate.
+
+        Raises
+        ------
+        weaviate.exceptions.BatchItemFailedException
+            If weaviate reported an error for the item.
+        concurrent.futures.TimeoutError
+            If the item is not resolved within `timeout` seconds.
+        Exception
+            The exception of the batch request, if it failed as a whole.
+        """
+
+        self._wait(timeout)
+        if self._exception is not None:
+            raise self._exception
+        assert self._result is not None
+        return self._result
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        """
+        Wait for the item to be resolved and return its exception.
+
+        Parameters
+        ----------
+        timeout : Optional[float], optional
+            The maximal time to wait in seconds, None to wait without limit, by default None.
+
+        Returns
+        -------
+        Optional[BaseException]
+            The exception the future was resolved with, None if the item was acknowledged.
+
+        Raises
+        ------
+        concurrent.futures.TimeoutError
+            If the item is not resolved within `timeout` seconds.
+        """
+
+        self._wait(timeout)
+        return self._exception
+
+    def add_done_callback(self, fn: Callable[["BatchItemFuture"], None]) -> None:
+        """
+        Call a function with the future once it is resolved. It is called right away if the
+        future is already resolved, otherwise in the thread that resolves it.
+
+        Parameters
+        ----------
+        fn : Callable[[BatchItemFuture], None]
+            The function to call.
+        """
+
+        with _state_lock:
+            if not self._done:
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def _set_result(self, result: Dict[str, Any]) -> None:
+        self._resolve(result, None)
+
+    def _set_exception(self, exception: BaseException) -> None:
+        self._resolve(None, exception)
+
+    def _resolve(
+        self, result: Optional[Dict[str, Any]], exception: Optional[BaseException]
+    ) -> None:
+        with _state_lock:
+            if self._done:
+                return
+            self._result, self._exception, self._done = result, exception, True
+            event = self._event
+            callbacks, self._callbacks = self._callbacks, []
+        if event is not None:
+            event.set()
+        for callback in callbacks:
+            callback(self)
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        if self._done:
+            return
+        with _state_lock:
+            if self._done:
+                return
+            if self._event is None:
+                self._event = threading.Event()
+            event = self._event
+        if not event.wait(timeout):
+            raise concurrent.futures.TimeoutError()
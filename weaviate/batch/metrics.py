@@ -0,0 +1,98 @@
+"""
+Metrics reported by `Batch` to tell whether an import is bound by the client or by the server.
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class BatchRequestMetrics:
+    """
+    Metrics of one batch request, passed to the `metrics_callback` of `Batch.configure`. All
+    times are in seconds and summed up over the retries of the request.
+
+    Parameters
+    ----------
+    data_type : str
+        The type of the batch request, either 'objects' or 'references'.
+    num_items : int
+        The number of objects or references in the batch request.
+    num_bytes : int
+        The size of the (uncompressed) request body in bytes.
+    serialization_time : float
+        The time spent serializing the request body.
+    request_time : float
+        The time spent sending the request and waiting for the complete response, i.e. the time
+        on the wire plus the processing time of the server.
+    elapsed : float
+        The time until the response headers arrived, as reported by the response.
+    decode_time : float
+        The time spent decoding the response.
+    callback_time : float
+        The time spent in the `callback` of the batch.
+    timeout_retries : int
+        How often the request was retried because of a ReadTimeout.
+    connection_error_retries : int
+        How often the request was retried because of a ConnectionError.
+    error_retries : int
+        How often items of the request were retried because of errors returned by weaviate, see
+        `WeaviateErrorRetryConf`.
+    """
+
+    data_type: str
+    num_items: int
+    num_bytes: int = 0
+    serialization_time: float = 0.0
+    request_time: float = 0.0
+    elapsed: float = 0.0
+    decode_time: float = 0.0
+    callback_time: float = 0.0
+    timeout_retries: int = 0
+    connection_error_retries: int = 0
+    error_retries: int = 0
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """
+    Snapshot of the overall state of a `Batch`, see `Batch.stats`.
+
+    Parameters
+    ----------
+    num_requests : int
+        The number of batch requests that were sent successfully.
+    num_items : int
+        The number of objects and references in these batch requests.
+    timeout_retries : int
+        The total number of retries because of a ReadTimeout.
+    connection_error_retries : int
+        The total number of retries because of a ConnectionError.
+    error_retries : int
+        The total number of retries because of errors returned by weaviate.
+    recommended_num_objects : Optional[int]
+        The current recommended number of objects per batch.
+    recommended_num_references : Optional[int]
+        The current recommended number of references per batch.
+    queue_depth : int
+        The number of batch requests that are queued or in-flight.
+    buffered_bytes : int
+        The approximate size in bytes of all objects and references held by the batch.
+    delayed_retries : int
+        The number of objects and references in the delayed retry queue, see
+        `WeaviateErrorRetryConf.backoff`.
+    isolated_items : int
+        The number of objects and references that made weaviate fail and were isolated by
+        bisecting the batch requests, see `min_bisect_size` of `Batch.configure`.
+    """
+
+    num_requests: int
+    num_items: int
+    timeout_retries: int
+    connection_error_retries: int
+    error_retries: int
+    recommended_num_objects: Optional[int]
+    recommended_num_references: Optional[int]
+    queue_depth: int
+    buffered_bytes: int
+    delayed_retries: int
+    isolated_items: int
@@ -0,0 +1,266 @@
+"""
+Import driver that runs the preprocessing and batching of an import in several processes.
+"""
+import itertools
+import multiprocessing
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from numbers import Real
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .crud_batch import Batch
+from .requests import BatchResponse
+from ..util import _check_positive_num
+
+# the batch and its failed items of the current worker process, set by `_init_worker`
+_worker_batch: Optional[Batch] = None
+_worker_transform: Optional[Callable[[Any], Iterable[Dict[str, Any]]]] = None
+_worker_failed: BatchResponse = []
+_worker_limiter: Optional["_SharedRateLimiter"] = None
+_worker_counter: Any = None
+
+
+@dataclass
+class ProcessImportResult:
+    """
+    The outcome of `import_with_processes`.
+
+    Parameters
+    ----------
+    num_items : int
+        The number of objects and references that were added to the batches of the workers.
+    failed_items : List[dict]
+        The objects and references for which weaviate reported an error, with the error as
+        "result", as passed to the `callback` of a `Batch`.
+    failed_tasks : List[Tuple[list, BaseException]]
+        The chunks of work items whose transform or batch failed as a whole, with the exception.
+        Items of a failed chunk may have been imported partially.
+    """
+
+    num_items: int = 0
+    failed_items: BatchResponse = field(default_factory=list)
+    failed_tasks: List[Tuple[list, BaseException]] = field(default_factory=list)
+
+
+class _SharedRateLimiter:
+    """
+    Limit the rate of added items across all worker processes. Every worker reserves the time
+    slot of its items in a shared schedule and sleeps until the slot starts, so the limit holds
+    for the sum of all workers without a coordinating process.
+    """
+
+    def __init__(self, items_per_second: float, context: Any):
+        self._interval = 1 / items_per_second
+        self._next_free = context.Value("d", 0.0, lock=False)
+        self._lock = context.Lock()
+
+    def acquire(self, num_items: int) -> None:
+        with self._lock:
+            now = time.time()
+            start = max(now, self._next_free.value)
+            self._next_free.value = start + num_items * self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+def import_with_processes(
+    work_items: Iterable[Any],
+    transform: Callable[[Any], Iterable[Dict[str, Any]]],
+    client_kwargs: Dict[str, Any],
+    batch_kwargs: Optional[Dict[str, Any]] = None,
+    num_processes: Optional[int] = None,
+    chunk_size: int = 1,
+    max_items_per_second: Optional[float] = None,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    mp_context: Optional[Any] = None,
+) -> ProcessImportResult:
+    """
+    Import data with several processes, for imports where parsing, chunking and encoding the
+    data keep one Python process busy. Every worker process creates its own `Client` and `Batch`,
+    transforms the work items it receives and adds the resulting objects and references to its
+    batch. The batch is flushed after every chunk of work items.
+
+    Parameters
+    ----------
+    work_items : Iterable[Any]
+        The units of work, e.g. file names or raw records. It is consumed lazily, at most two
+        chunks per process are pending at a time. Each work item is pickled to be sent to a worker.
+    transform : Callable[[Any], Iterable[Dict[str, Any]]]
+        A picklable function, e.g. defined on module level, that turns a work item into objects
+        and references. Each object is a dict of the arguments of `Batch.add_data_object`
+        (`data_object`, `class_name` and optionally `uuid`, `vector`, `tenant`), each reference a
+        dict of the arguments of `Batch.add_reference` (`from_object_uuid`, ...).
+    client_kwargs : Dict[str, Any]
+        The arguments of `weaviate.Client` for the client of each worker, e.g. `url` and
+        `auth_client_secret`. They must be picklable.
+    batch_kwargs : Optional[Dict[str, Any]], optional
+        The arguments of `Batch.configure` for the batch of each worker. The `callback` is
+        replaced to collect the failed items. With a `spool_dir`, every worker uses its own
+        subdirectory, named after its process id; the empty subdirectories are removed at the
+        end. After a crash, resume every subdirectory that is left, e.g.
+        `for name in os.listdir(spool_dir): client.batch.resume(os.path.join(spool_dir, name))`.
+        By default None, i.e. the default configuration.
+    num_processes : Optional[int], optional
+        The number of worker processes, by default None, i.e. the number of CPUs.
+    chunk_size : int, optional
+        The number of work items sent to a worker at once, by default 1. Use larger chunks for
+        small work items like single records.
+    max_items_per_second : Optional[float], optional
+        The maximal rate of objects and references added by all workers together, to bound the
+        load on the cluster. By default None, i.e. no limit.
+    progress_callback : Optional[Callable[[int, int], None]], optional
+        Called in the calling process after every chunk with the number of work items that are
+        done and the number of objects and references added by all workers so far. By default
+        None.
+    mp_context : Optional[multiprocessing.context.BaseContext], optional
+        The multiprocessing context of the worker processes, by default None, i.e. the default
+        context.
+
+    Returns
+    -------
+    ProcessImportResult
+        The number of added items and the aggregated failures.
+
+    Raises
+    ------
+    TypeError
+        If one of the arguments is of a wrong type.
+    ValueError
+        If `chunk_size`, `num_processes` or `max_items_per_second` is not positive.
+    """
+
+    _check_positive_num(chunk_size, "chunk_size", int)
+    if num_processes is None:
+        num_processes = os.cpu_count() or 1
+    _check_positive_num(num_processes, "num_processes", int)
+    if max_items_per_second is not None:
+        _check_positive_num(max_items_per_second, "max_items_per_second", Real)
+
+    context = mp_context if mp_context is not None else multiprocessing.get_context()
+    counter = context.Value("q", 0)
+    limiter = (
+        _SharedRateLimiter(max_items_per_second, context)
+        if max_items_per_second is not None
+        else None
+    )
+    result = ProcessImportResult()
+    num_done = 0
+
+    with ProcessPoolExecutor(
+        max_workers=num_processes,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(client_kwargs, batch_kwargs or {}, transform, limiter, counter),
+    ) as executor:
+        work_items_iter = iter(work_items)
+        chunks = iter(lambda: list(itertools.islice(work_items_iter, chunk_size)), [])
+        pending: Dict[Future, list] = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < 2 * num_processes:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                pending[executor.submit(_run_chunk, chunk)] = chunk
+            if len(pending) == 0:
+                break
+            done: Set[Future]
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                num_done += len(chunk)
+                try:
+                    num_items, failed_items = future.result()
+                except Exception as error:
+                    result.failed_tasks.append((chunk, error))
+                    continue
+                result.num_items += num_items
+                result.failed_items.extend(failed_items)
+            if progress_callback is not None:
+                progress_callback(num_done, counter.value)
+
+    spool_dir = (batch_kwargs or {}).get("spool_dir")
+    if spool_dir is not None:
+        _remove_empty_spools(spool_dir)
+    return result
+
+
+def _init_worker(
+    client_kwargs: Dict[str, Any],
+    batch_kwargs: Dict[str, Any],
+    transform: Callable[[Any], Iterable[Dict[str, Any]]],
+    limiter: Optional[_SharedRateLimiter],
+    counter: Any,
+) -> None:
+    global _worker_batch, _worker_transform, _worker_limiter, _worker_counter
+    from weaviate.client import Client  # circular import
+
+    client = Client(**client_kwargs)
+    if batch_kwargs.get("spool_dir") is not None:
+        # the segment files are numbered per directory, the workers must not share one
+        batch_kwargs = {
+            **batch_kwargs,
+            "spool_dir": os.path.join(batch_kwargs["spool_dir"], str(os.getpid())),
+        }
+    _worker_batch = client.batch.configure(**{**batch_kwargs, "callback": _collect_failed})
+    _worker_transform = transform
+    _worker_limiter = limiter
+    _worker_counter = counter
+
+
+def _remove_empty_spools(spool_dir: str) -> None:
+    for name in os.listdir(spool_dir):
+        path = os.path.join(spool_dir, name)
+        if name.isdigit() and os.path.isdir(path) and len(os.listdir(path)) == 0:
+            os.rmdir(path)
+
+
+def _collect_failed(response: BatchResponse) -> None:
+    for item in response:
+        if "errors" in (item.get("result") or {}):
+            _worker_failed.append(item)
+
+
+def _run_chunk(chunk: list) -> Tuple[int, BatchResponse]:
+    assert _worker_batch is not None and _worker_transform is not None
+    num_items = 0
+    try:
+        for work_item in chunk:
+            items = list(_worker_transform(work_item))
+            if _worker_limiter is not None:
+                _worker_limiter.acquire(len(items))
+            for item in items:
+                if "from_object_uuid" in item:
+                    _worker_batch.add_reference(**item)
+                else:
+                    _worker_batch.add_data_object(**item)
+            num_items += len(items)
+            with _worker_counter.get_lock():
+                _worker_counter.value += len(items)
+        _worker_batch.flush()
+        return num_items, list(_worker_failed)
+    except Exception as error:
+        # do not send the rest of a failed chunk with the next one
+        _worker_batch.empty_objects()
+        _worker_batch.empty_references()
+        raise _picklable(error)
+    finally:
+        _worker_failed.clear()
+
+
+def _picklable(error: Exception) -> Exception:
+    """
+    The exception itself if it can be sent to the calling process, otherwise a RuntimeError with
+    its message. Exceptions that cannot be unpickled, e.g. `UnexpectedStatusCodeException`, would
+    break the process pool.
+    """
+
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
@@ -2,14 +2,20 @@
 BatchRequest class definitions.
 """
 import copy
+import json
 from abc import ABC, abstractmethod
-from typing import List, Sequence, Optional, Dict, Any, Union
+from typing import List, Literal, Mapping, Sequence, Set, Optional, Dict, Any, Union, cast
 from uuid import uuid4
 
-from weaviate.util import get_valid_uuid, get_vector
+from weaviate.util import get_valid_uuid, get_vector, get_vectors
 from weaviate.types import UUID
+from .futures import BatchItemFuture
 
 BatchResponse = List[Dict[str, Any]]
+CopyObjects = Union[bool, Literal["shallow"]]
+
+# upper bound for the JSON size of a float, e.g. '-0.12345678901234567, '
+APPROXIMATE_FLOAT_BYTES = 22
 
 
 class BatchRequest(ABC):
@@ -19,6 +25,8 @@ class BatchRequest(ABC):
 
     def __init__(self) -> None:
         self._items: List[Dict[str, Any]] = []
+        # the futures of the items, by the id() of the item, see `Batch.add_data_object_future`
+        self._futures: Dict[int, BatchItemFuture] = {}
 
     def __len__(self) -> int:
         return len(self._items)
@@ -41,6 +49,7 @@ class BatchRequest(ABC):
         """
 
         self._items = []
+        self._futures = {}
 
     def pop(self, index: int = -1) -> dict:
         """
@@ -62,12 +71,40 @@ class BatchRequest(ABC):
             If batch is empty or index is out of range.
         """
 
-        return self._items.pop(index)
+        item = self._items.pop(index)
+        self._futures.pop(id(item), None)
+        return item
+
+    def _take_futures(self, batch_request: "BatchRequest") -> None:
+        """
+        Take over the futures of the items of this batch from the batch they were taken from.
+
+        Parameters
+        ----------
+        batch_request : BatchRequest
+            The batch that contained the items of this batch.
+        """
+
+        if len(batch_request._futures) == 0:
+            return
+        for item in self._items:
+            future = batch_request._futures.get(id(item))
+            if future is not None:
+                self._futures[id(item)] = future
 
     @abstractmethod
     def add(self, *args, **kwargs):  # type: ignore
         """Add objects to BatchRequest."""
 
+    @property
+    @abstractmethod
+    def num_bytes(self) -> int:
+        """The approximate size of the request body in bytes."""
+
+    @abstractmethod
+    def bisect(self) -> List["BatchRequest"]:
+        """Split the items into two new batch requests of (almost) equal length."""
+
     @abstractmethod
     def get_request_body(self) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Return the request body to be digested by weaviate that contains all batch items."""
@@ -129,6 +166,32 @@ class ReferenceBatchRequest(BatchRequest):
     Caution this request will miss some validations to be faster.
     """
 
+    def __init__(self) -> None:
+        super().__init__()
+        self._num_bytes = 0
+
+    @property
+    def num_bytes(self) -> int:
+        """
+        The approximate size of the request body in bytes.
+
+        Returns
+        -------
+        int
+            The approximate size of the request body.
+        """
+
+        return self._num_bytes
+
+    def empty(self) -> None:
+        super().empty()
+        self._num_bytes = 0
+
+    def pop(self, index: int = -1) -> dict:
+        item = super().pop(index)
+        self._num_bytes -= _reference_size(item)
+        return item
+
     def add(
         self,
         from_object_class_name: str,
@@ -168,6 +231,44 @@ class ReferenceBatchRequest(BatchRequest):
             If 'uuid' is not valid or cannot be extracted.
         """
 
+        self.add_item(
+            self.create_item(
+                from_object_class_name=from_object_class_name,
+                from_object_uuid=from_object_uuid,
+                from_property_name=from_property_name,
+                to_object_uuid=to_object_uuid,
+                to_object_class_name=to_object_class_name,
+                tenant=tenant,
+            )
+        )
+
+    @staticmethod
+    def create_item(
+        from_object_class_name: str,
+        from_object_uuid: UUID,
+        from_property_name: str,
+        to_object_uuid: UUID,
+        to_object_class_name: Optional[str] = None,
+        tenant: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """
+        Create a reference as it is sent to weaviate, without adding it to a batch. See `add` for
+        the arguments. It touches no state of a batch, so it can be called without holding the
+        lock of a batch that is shared between threads.
+
+        Returns
+        -------
+        Dict[str, str]
+            The reference, to be added with `add_item`.
+
+        Raises
+        ------
+        TypeError
+            If arguments are not of type str.
+        ValueError
+            If 'uuid' is not valid or cannot be extracted.
+        """
+
         if not isinstance(from_object_class_name, str):
             raise TypeError("'from_object_class_name' argument must be of type str")
 
@@ -197,8 +298,20 @@ class ReferenceBatchRequest(BatchRequest):
 
         if tenant is not None:
             item["tenant"] = tenant
+        return item
+
+    def add_item(self, item: Dict[str, str]) -> None:
+        """
+        Add a reference that was created with `create_item` to this batch.
+
+        Parameters
+        ----------
+        item : Dict[str, str]
+            The reference.
+        """
 
         self._items.append(item)
+        self._num_bytes += _reference_size(item)
 
     def get_request_body(self) -> List[Dict[str, Any]]:
         """
@@ -213,6 +326,34 @@ class ReferenceBatchRequest(BatchRequest):
 
         return self._items
 
+    def bisect(self) -> List["BatchRequest"]:
+        middle = len(self._items) // 2
+        halves: List[BatchRequest] = []
+        for items in (self._items[:middle], self._items[middle:]):
+            half = ReferenceBatchRequest()
+            half._items = items
+            half._num_bytes = sum(_reference_size(item) for item in items)
+            half._take_futures(self)
+            halves.append(half)
+        return halves
+
+    def get_uuids(self) -> Set[str]:
+        """
+        Get the UUIDs of all objects the references are created from or point to.
+
+        Returns
+        -------
+        Set[str]
+            The UUIDs of the source and target objects.
+        """
+
+        uuids = set()
+        for item in self._items:
+            # beacons: weaviate://localhost/<class>/<uuid>/<property> and .../[<class>/]<uuid>
+            uuids.add(item["from"].rsplit("/", 2)[-2])
+            uuids.add(item["to"].rsplit("/", 1)[-1])
+        return uuids
+
     def add_failed_objects_from_response(
         self,
         response: BatchResponse,
@@ -225,7 +366,9 @@ class ReferenceBatchRequest(BatchRequest):
             if self._skip_objects_retry(ref, errors_to_exclude, errors_to_include):
                 successful_responses.append(ref)
                 continue
-            self._items.append({"from": ref["from"], "to": ref["to"]})
+            item = {"from": ref["from"], "to": ref["to"]}
+            self._items.append(item)
+            self._num_bytes += _reference_size(item)
         return successful_responses
 
 
@@ -233,8 +376,113 @@ class ObjectsBatchRequest(BatchRequest):
     """
     Collect objects for one batch request to weaviate.
     Caution this batch will not be validated through weaviate.
+
+    Parameters
+    ----------
+    track_size : bool, optional
+        Whether to keep track of the approximate size of the request body while objects are
+        added, see `num_bytes`, by default False.
     """
 
+    def __init__(self, track_size: bool = False) -> None:
+        super().__init__()
+        self._item_sizes: Optional[List[int]] = None
+        self._num_bytes = 0
+        if track_size:
+            self.track_size()
+
+    def track_size(self) -> None:
+        """
+        Start keeping track of the approximate size of the request body, including all objects
+        that were already added.
+        """
+
+        if self._item_sizes is None:
+            self._item_sizes = [_approximate_size(item) for item in self._items]
+            self._num_bytes = sum(self._item_sizes)
+
+    @property
+    def num_bytes(self) -> int:
+        """
+        The approximate size of the request body in bytes. Vectors are estimated instead of
+        serialized, so this is an upper bound for them.
+
+        Returns
+        -------
+        int
+            The approximate size of the request body.
+        """
+
+        if self._item_sizes is None:
+            return sum(_approximate_size(item) for item in self._items)
+        return self._num_bytes
+
+    def split(self, max_bytes: int) -> List["ObjectsBatchRequest"]:
+        """
+        Split this batch into batches with a request body of at most `max_bytes` bytes (see
+        `num_bytes`). An object that is larger than `max_bytes` is put in a batch of its own.
+
+        Parameters
+        ----------
+        max_bytes : int
+            The maximal size of the request body of one batch.
+
+        Returns
+        -------
+        List[ObjectsBatchRequest]
+            The batches, this batch itself if it does not need to be split.
+        """
+
+        sizes = (
+            self._item_sizes
+            if self._item_sizes is not None
+            else [_approximate_size(item) for item in self._items]
+        )
+        if sum(sizes) <= max_bytes or len(self._items) <= 1:
+            return [self]
+
+        track_size = self._item_sizes is not None
+        batches = [ObjectsBatchRequest(track_size=track_size)]
+        num_bytes = 0
+        for item, size in zip(self._items, sizes):
+            if num_bytes + size > max_bytes and len(batches[-1]) > 0:
+                batches[-1]._num_bytes = num_bytes
+                batches.append(ObjectsBatchRequest(track_size=track_size))
+                num_bytes = 0
+            batches[-1]._items.append(item)
+            if track_size:
+                cast(List[int], batches[-1]._item_sizes).append(size)
+            num_bytes += size
+        batches[-1]._num_bytes = num_bytes
+        for batch in batches:
+            batch._take_futures(self)
+        return batches
+
+    def bisect(self) -> List["BatchRequest"]:
+        middle = len(self._items) // 2
+        halves: List[BatchRequest] = []
+        for start, end in ((0, middle), (middle, len(self._items))):
+            half = ObjectsBatchRequest()
+            half._items = self._items[start:end]
+            if self._item_sizes is not None:
+                half._item_sizes = self._item_sizes[start:end]
+                half._num_bytes = sum(half._item_sizes)
+            half._take_futures(self)
+            halves.append(half)
+        return halves
+
+    def empty(self) -> None:
+        super().empty()
+        if self._item_sizes is not None:
+            self._item_sizes = []
+            self._num_bytes = 0
+
+    def pop(self, index: int = -1) -> dict:
+        item = super().pop(index)
+        if self._item_sizes is not None:
+            self._num_bytes -= self._item_sizes.pop(index)
+        return item
+
     def add(
         self,
         data_object: dict,
@@ -242,6 +490,7 @@ class ObjectsBatchRequest(BatchRequest):
         uuid: Optional[UUID] = None,
         vector: Optional[Sequence] = None,
         tenant: Optional[str] = None,
+        copy_object: CopyObjects = True,
     ) -> str:
         """
         Add one object to this batch. Does NOT validate the consistency of the object against
@@ -266,6 +515,10 @@ class ObjectsBatchRequest(BatchRequest):
             by default None.
         tenant: str, optional
             Tenant of the object
+        copy_object: bool or "shallow", optional
+            How `data_object` is stored in the batch. True stores a deep copy, "shallow" a copy of
+            the top-level dict only and False stores `data_object` itself, i.e. the batch takes
+            ownership and the object must not be modified afterwards. By default True.
 
         Returns
         -------
@@ -280,12 +533,58 @@ class ObjectsBatchRequest(BatchRequest):
             If 'uuid' is not of a proper form.
         """
 
+        item = self.create_item(
+            data_object=data_object,
+            class_name=class_name,
+            uuid=uuid,
+            vector=vector,
+            tenant=tenant,
+            copy_object=copy_object,
+        )
+        self.add_item(item)
+        return cast(str, item["id"])
+
+    @staticmethod
+    def create_item(
+        data_object: dict,
+        class_name: str,
+        uuid: Optional[UUID] = None,
+        vector: Optional[Sequence] = None,
+        tenant: Optional[str] = None,
+        copy_object: CopyObjects = True,
+    ) -> Dict[str, Any]:
+        """
+        Create an object as it is sent to weaviate, without adding it to a batch. See `add` for
+        the arguments. Copying the object and converting the vector is most of the cost of `add`
+        and touches no state of a batch, so it can be done without holding the lock of a batch
+        that is shared between threads.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The object, to be added with `add_item`.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If 'uuid' is not of a proper form.
+        """
+
         if not isinstance(data_object, dict):
             raise TypeError("Object must be of type dict")
         if not isinstance(class_name, str):
             raise TypeError("Class name must be of type str")
 
-        batch_item = {"class": class_name, "properties": copy.deepcopy(data_object)}
+        if copy_object is True:
+            properties = copy.deepcopy(data_object)
+        elif copy_object == "shallow":
+            properties = copy.copy(data_object)
+        else:
+            properties = data_object
+
+        batch_item = {"class": class_name, "properties": properties}
         if uuid is not None:
             valid_uuid = get_valid_uuid(uuid)
         else:
@@ -296,10 +595,116 @@ class ObjectsBatchRequest(BatchRequest):
             batch_item["vector"] = get_vector(vector)
         if tenant is not None:
             batch_item["tenant"] = tenant
+        return batch_item
 
-        self._items.append(batch_item)
+    def add_item(self, item: Dict[str, Any], num_bytes: Optional[int] = None) -> None:
+        """
+        Add an object that was created with `create_item` to this batch.
 
-        return valid_uuid
+        Parameters
+        ----------
+        item : Dict[str, Any]
+            The object.
+        num_bytes : Optional[int], optional
+            The approximate size of the object, computed if it is needed and None. By default
+            None.
+        """
+
+        self._items.append(item)
+        if self._item_sizes is not None:
+            self._item_sizes.append(_approximate_size(item) if num_bytes is None else num_bytes)
+            self._num_bytes += self._item_sizes[-1]
+
+    def add_many(
+        self,
+        class_name: str,
+        properties: Optional[Mapping[str, Sequence]] = None,
+        vectors: Optional[Sequence] = None,
+        uuids: Optional[Sequence[UUID]] = None,
+        tenants: Union[str, Sequence[str], None] = None,
+    ) -> List[str]:
+        """
+        Add multiple objects of one class to this batch from columns, i.e. one sequence per
+        property instead of one dict per object. Columns are converted as a whole (e.g. with
+        `numpy.ndarray.tolist`), which avoids the per-object overhead of `add`. The created
+        property dicts are owned by the batch and never copied.
+
+        Parameters
+        ----------
+        class_name : str
+            The name of the class all objects belong to.
+        properties : Optional[Mapping[str, Sequence]], optional
+            Mapping of property names to one value per object. Supported column types are `list`,
+            `numpy.ndarray`, `torch.Tensor` and `tf.Tensor`, by default None.
+        vectors : Optional[Sequence], optional
+            One vector per object, e.g. a 2D `numpy.ndarray`. See `weaviate.util.get_vectors` for
+            the supported types, by default None.
+        uuids : Optional[Sequence[UUID]], optional
+            One UUID per object. If None UUIDv4s will be generated, by default None.
+        tenants : Union[str, Sequence[str], None], optional
+            The tenant of all objects or one tenant per object, by default None.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the added objects.
+
+        Raises
+        ------
+        TypeError
+            If an argument passed is not of an appropriate type.
+        ValueError
+            If the columns have different lengths or one of the 'uuids' is not of a proper form.
+        """
+
+        if not isinstance(class_name, str):
+            raise TypeError("Class name must be of type str")
+
+        columns = {name: _column_to_list(column) for name, column in (properties or {}).items()}
+        vector_rows = get_vectors(vectors) if vectors is not None else None
+        tenant_rows = (
+            _column_to_list(tenants)
+            if tenants is not None and not isinstance(tenants, str)
+            else None
+        )
+
+        lengths = {len(column) for column in columns.values()}
+        for column in (vector_rows, uuids, tenant_rows):
+            if column is not None:
+                lengths.add(len(column))
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length. Given lengths: {lengths}")
+        if len(lengths) == 0:
+            return []
+        num_objects = lengths.pop()
+
+        if uuids is not None:
+            valid_uuids = [get_valid_uuid(uuid) for uuid in _column_to_list(uuids)]
+        else:
+            valid_uuids = [str(uuid4()) for _ in range(num_objects)]
+
+        names = list(columns)
+        if len(names) > 0:
+            rows: Sequence[Dict[str, Any]] = [
+                dict(zip(names, row)) for row in zip(*columns.values())
+            ]
+        else:
+            rows = [{} for _ in range(num_objects)]
+
+        for i in range(num_objects):
+            batch_item = {"class": class_name, "properties": rows[i], "id": valid_uuids[i]}
+            if vector_rows is not None:
+                batch_item["vector"] = vector_rows[i]
+            if tenant_rows is not None:
+                batch_item["tenant"] = tenant_rows[i]
+            elif tenants is not None:
+                batch_item["tenant"] = tenants
+            self._items.append(batch_item)
+            if self._item_sizes is not None:
+                self._item_sizes.append(_approximate_size(batch_item))
+                self._num_bytes += self._item_sizes[-1]
+
+        return valid_uuids
 
     def get_request_body(self) -> Dict[str, Any]:
         """
@@ -313,6 +718,18 @@ class ObjectsBatchRequest(BatchRequest):
 
         return {"fields": ["ALL"], "objects": self._items}
 
+    def get_uuids(self) -> List[str]:
+        """
+        Get the UUIDs of all objects in this batch.
+
+        Returns
+        -------
+        List[str]
+            The UUIDs of the objects.
+        """
+
+        return [item["id"] for item in self._items]
+
     def add_failed_objects_from_response(
         self,
         response: BatchResponse,
@@ -333,3 +750,71 @@ class ObjectsBatchRequest(BatchRequest):
                 tenant=obj.get("tenant", None),
             )
         return successful_responses
+
+
+def _column_to_list(column: Sequence) -> list:
+    """
+    Convert a column to a list of python objects, as a whole if possible.
+
+    Parameters
+    ----------
+    column : Sequence
+        A `list`, `numpy.ndarray`, `torch.Tensor`, `tf.Tensor` or any other sequence.
+
+    Returns
+    -------
+    list
+        The column as a list.
+    """
+
+    if isinstance(column, list):
+        return column
+    if hasattr(column, "tolist"):
+        # numpy.ndarray, torch.Tensor
+        return cast(list, column.tolist())
+    if hasattr(column, "numpy"):
+        # tf.Tensor
+        return cast(list, column.numpy().tolist())
+    return list(column)
+
+
+def _approximate_size(item: Dict[str, Any]) -> int:
+    """
+    Approximate the JSON size of one batch item in bytes. Vectors are not serialized, their size
+    is estimated with `APPROXIMATE_FLOAT_BYTES` per element.
+
+    Parameters
+    ----------
+    item : Dict[str, Any]
+        The batch item.
+
+    Returns
+    -------
+    int
+        The approximate size of the item.
+    """
+
+    vector = item.get("vector")
+    if vector is None:
+        return len(json.dumps(item)) + 2  # plus the separator between items
+    without_vector = {key: value for key, value in item.items() if key != "vector"}
+    return len(json.dumps(without_vector)) + 14 + len(vector) * APPROXIMATE_FLOAT_BYTES
+
+
+def _reference_size(item: Dict[str, str]) -> int:
+    """
+    Approximate the JSON size of one reference batch item in bytes.
+
+    Parameters
+    ----------
+    item : Dict[str, str]
+        The reference batch item.
+
+    Returns
+    -------
+    int
+        The approximate size of the item.
+    """
+
+    # '"key": "value", ' per entry, the braces and the separator between items
+    return sum(len(key) + len(value) + 8 for key, value in item.items()) + 2
@@ -0,0 +1,268 @@
+"""
+On-disk spool that keeps batch items until weaviate acknowledged them.
+"""
+import json
+import os
+import threading
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .requests import BatchRequest
+
+SEGMENT_SUFFIX = ".jsonl"
+
+
+class BatchSpool:
+    """
+    Write-ahead log of a `Batch`, split into segments. Every added object and reference is
+    appended to the active segment. When the batch hands its objects and references over to be
+    sent, the active segment is sealed and bound to the resulting batch requests. The segment file
+    is deleted once all of them succeeded and all of its items that are retried later were added
+    to the batch again, so the files left in the directory after a crash contain exactly the items
+    that were not acknowledged by weaviate (plus the ones that were not sent yet). If only the
+    objects or only the references of a segment are sent, the segment is kept until the rest of
+    its items were acknowledged as well.
+
+    Parameters
+    ----------
+    directory : str
+        The directory of the segment files, created if it does not exist.
+    """
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = os.path.abspath(directory)
+
+        self._lock = threading.Lock()
+        self._active: Optional[IO[str]] = None
+        self._active_id: Optional[int] = None
+        self._next_id = max(self._segments_on_disk(), default=-1) + 1
+        # segment id -> number of batch requests that were not acknowledged yet, plus the number
+        # of retained items
+        self._pending: Dict[int, int] = {}
+        # id of a batch request -> its segment id
+        self._held: Dict[int, int] = {}
+        # segment id -> retained earlier segments that are released when it is deleted
+        self._chained: Dict[int, List[int]] = {}
+
+    def append(self, data_type: str, items: Sequence[Dict[str, Any]]) -> None:
+        """
+        Append items to the active segment, which is created if there is none. The items are
+        written to the operating system right away, so they survive a crash of the process.
+
+        Parameters
+        ----------
+        data_type : str
+            The type of the items, either 'objects' or 'references'.
+        items : Sequence[Dict[str, Any]]
+            The batch items as they are sent to weaviate.
+        """
+
+        if len(items) == 0:
+            return
+        lines = "".join(json.dumps([data_type, item]) + "\n" for item in items)
+        with self._lock:
+            if self._active is None:
+                self._active_id = self._next_id
+                self._next_id += 1
+                self._active = open(self._path(self._active_id), "w", encoding="utf-8")
+            self._active.write(lines)
+            self._active.flush()
+
+    def seal(self) -> Optional[int]:
+        """
+        Close the active segment and sync it to disk.
+
+        Returns
+        -------
+        Optional[int]
+            The id of the sealed segment, None if there was no active segment.
+        """
+
+        with self._lock:
+            if self._active is None:
+                return None
+            os.fsync(self._active.fileno())
+            self._active.close()
+            segment_id, self._active, self._active_id = self._active_id, None, None
+            return segment_id
+
+    def hold(self, segment_id: int, batch_requests: Sequence[BatchRequest]) -> None:
+        """
+        Bind a sealed segment to the batch requests created from it. The segment is deleted
+        right away if there are none and nothing else holds it. A segment can be bound again if
+        some of its items were kept back, e.g. when only the objects were sent.
+
+        Parameters
+        ----------
+        segment_id : int
+            The id of the sealed segment.
+        batch_requests : Sequence[BatchRequest]
+            The batch requests that contain the items of the segment.
+        """
+
+        with self._lock:
+            if len(batch_requests) == 0:
+                if segment_id not in self._pending:
+                    self._remove(segment_id)
+                return
+            self._pending[segment_id] = self._pending.get(segment_id, 0) + len(batch_requests)
+            for batch_request in batch_requests:
+                self._held[id(batch_request)] = segment_id
+
+    def ack(self, batch_request: BatchRequest) -> None:
+        """
+        Mark a batch request as acknowledged by weaviate. Deletes its segment if all batch
+        requests of the segment are acknowledged.
+
+        Parameters
+        ----------
+        batch_request : BatchRequest
+            The batch request that succeeded.
+        """
+
+        with self._lock:
+            segment_id = self._held.pop(id(batch_request), None)
+            if segment_id is not None:
+                self._release(segment_id)
+
+    def segment(self, batch_request: BatchRequest) -> Optional[int]:
+        """
+        The segment a batch request is bound to.
+
+        Parameters
+        ----------
+        batch_request : BatchRequest
+            The batch request.
+
+        Returns
+        -------
+        Optional[int]
+            The id of the segment, None if the batch request is not bound to one.
+        """
+
+        with self._lock:
+            return self._held.get(id(batch_request))
+
+    def retain(self, segment_id: int) -> None:
+        """
+        Keep a segment on disk until `release` is called, even if all its batch requests are
+        acknowledged. Used for an item of the segment that is retried later.
+
+        Parameters
+        ----------
+        segment_id : int
+            The id of a segment that is bound to batch requests.
+        """
+
+        with self._lock:
+            self._pending[segment_id] += 1
+
+    def release(self, segment_id: int) -> None:
+        """
+        Release a segment retained with `retain`, once the retried item was added to the
+        active segment again. Deletes the segment if nothing holds it anymore.
+
+        Parameters
+        ----------
+        segment_id : int
+            The id of the retained segment.
+        """
+
+        with self._lock:
+            self._release(segment_id)
+
+    def chain(self, segment_id: int, earlier_segment_id: int) -> None:
+        """
+        Keep a retained earlier segment on disk until a later segment is deleted, instead of
+        until `release` is called. Used if items of the earlier segment that were not sent yet
+        are sent together with the items of the later one.
+
+        Parameters
+        ----------
+        segment_id : int
+            The id of the later segment.
+        earlier_segment_id : int
+            The id of the retained earlier segment.
+        """
+
+        with self._lock:
+            self._chained.setdefault(segment_id, []).append(earlier_segment_id)
+
+    def read(self, segment_id: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Read the items of a segment. A last line that was only partially written before a crash
+        is skipped.
+
+        Parameters
+        ----------
+        segment_id : int
+            The id of the segment.
+
+        Yields
+        ------
+        Tuple[str, Dict[str, Any]]
+            The data type and the batch item.
+        """
+
+        with open(self._path(segment_id), encoding="utf-8") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    return
+                data_type, item = json.loads(line)
+                yield data_type, item
+
+    def size(self, segment_id: int) -> int:
+        """
+        The size of a segment file in bytes.
+
+        Parameters
+        ----------
+        segment_id : int
+            The id of the segment.
+
+        Returns
+        -------
+        int
+            The size of the segment file.
+        """
+
+        return os.path.getsize(self._path(segment_id))
+
+    def segments(self) -> List[int]:
+        """
+        The segments on disk that are neither active nor bound to batch requests, oldest first.
+        These are left over from an earlier run, or spilled and not sent yet.
+
+        Returns
+        -------
+        List[int]
+            The segment ids.
+        """
+
+        with self._lock:
+            return [
+                segment_id
+                for segment_id in self._segments_on_disk()
+                if segment_id != self._active_id and segment_id not in self._pending
+            ]
+
+    def _segments_on_disk(self) -> List[int]:
+        return sorted(
+            int(name[: -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX) and name[: -len(SEGMENT_SUFFIX)].isdigit()
+        )
+
+    def _release(self, segment_id: int) -> None:
+        self._pending[segment_id] -= 1
+        if self._pending[segment_id] == 0:
+            del self._pending[segment_id]
+            self._remove(segment_id)
+
+    def _remove(self, segment_id: int) -> None:
+        os.remove(self._path(segment_id))
+        for earlier_segment_id in self._chained.pop(segment_id, []):
+            self._release(earlier_segment_id)
+
+    def _path(self, segment_id: int) -> str:
+        return os.path.join(self.directory, f"{segment_id:012d}{SEGMENT_SUFFIX}")
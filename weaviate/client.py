@@ -1,7 +1,7 @@
 """
 Client class definition.
 """
-from typing import Optional, Tuple, Union, Dict, Any
+from typing import Optional, Tuple, Union, Dict, Any, List
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
@@ -53,7 +53,7 @@ class Client:
 
     def __init__(
         self,
-        url: Optional[str] = None,
+        url: Union[str, List[str], None] = None,
         auth_client_secret: Optional[AuthCredentials] = None,
         timeout_config: TIMEOUT_TYPE = (10, 60),
         proxies: Union[dict, str, None] = None,
@@ -68,8 +68,11 @@ class Client:
 
         Parameters
         ----------
-        url : str
-            The URL to the weaviate instance.
+        url : str or list of str
+            The URL to the weaviate instance, or the URLs of several nodes of a weaviate cluster.
+            With several URLs, the requests are spread across the nodes by the client, and nodes
+            that fail are skipped for a while, see `node_failure_threshold` and
+            `node_ejection_time` of `weaviate.ConnectionConfig`.
         auth_client_secret : weaviate.AuthCredentials or None, optional
         # fmt: off
             Authenticate to weaviate by using one of the given authentication modes:
@@ -128,6 +131,12 @@ class Client:
         ...     auth_client_secret = my_credentials
         ... )
 
+        Spreading the requests across the nodes of a cluster.
+
+        >>> client = Client(
+        ...     url = ['http://weaviate-0:8080', 'http://weaviate-1:8080', 'http://weaviate-2:8080']
+        ... )
+
         Creating a client with an embedded database:
 
         >>> from weaviate import EmbeddedOptions
@@ -274,8 +283,8 @@ class Client:
 
     @staticmethod
     def __parse_url_and_embedded_db(
-        url: Optional[str], embedded_options: Optional[EmbeddedOptions]
-    ) -> Tuple[str, Optional[EmbeddedDB]]:
+        url: Union[str, List[str], None], embedded_options: Optional[EmbeddedOptions]
+    ) -> Tuple[Union[str, List[str]], Optional[EmbeddedDB]]:
         if embedded_options is None and url is None:
             raise TypeError("Either url or embedded options must be present.")
         elif embedded_options is not None and url is not None:
@@ -288,6 +297,10 @@ class Client:
             embedded_db.start()
             return f"http://localhost:{embedded_db.options.port}", embedded_db
 
+        if isinstance(url, list):
+            if len(url) == 0 or not all(isinstance(node_url, str) for node_url in url):
+                raise TypeError(f"URL is expected to be a non-empty list of strings but is {url}")
+            return [node_url.strip("/") for node_url in url], None
         if not isinstance(url, str):
             raise TypeError(f"URL is expected to be string but is {type(url)}")
         return url.strip("/"), None
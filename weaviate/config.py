@@ -1,11 +1,46 @@
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Literal, Optional
+
+Compression = Literal["gzip", "zstd"]
+JSONCodec = Literal["json", "orjson"]
+
+
+@dataclass
+class HedgingConfig:
+    percentile: float = 95.0
+    budget: float = 0.05
+    min_delay: float = 0.005
+    window: int = 1000
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.percentile, (int, float)):
+            raise TypeError(f"percentile must be {float}, received {type(self.percentile)}")
+        if not 0 < self.percentile <= 100:
+            raise ValueError(f"percentile must be in (0, 100], received {self.percentile}")
+        if not isinstance(self.budget, (int, float)):
+            raise TypeError(f"budget must be {float}, received {type(self.budget)}")
+        if self.budget < 0:
+            raise ValueError(f"budget must not be negative, received {self.budget}")
+        if not isinstance(self.min_delay, (int, float)):
+            raise TypeError(f"min_delay must be {float}, received {type(self.min_delay)}")
+        if not isinstance(self.window, int):
+            raise TypeError(f"window must be {int}, received {type(self.window)}")
+        if self.window < 1:
+            raise ValueError(f"window must be positive, received {self.window}")
 
 
 @dataclass
 class ConnectionConfig:
     session_pool_connections: int = 20
     session_pool_maxsize: int = 20
+    compression: Optional[Compression] = None
+    compression_threshold: int = 1024
+    compression_level: Optional[int] = None
+    http2: bool = False
+    json_codec: JSONCodec = "json"
+    node_failure_threshold: int = 3
+    node_ejection_time: float = 10.0
+    hedging: Optional[HedgingConfig] = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.session_pool_connections, int):
@@ -16,6 +51,34 @@ class ConnectionConfig:
             raise TypeError(
                 f"session_pool_maxsize must be {int}, received {type(self.session_pool_maxsize)}"
             )
+        if self.compression not in (None, "gzip", "zstd"):
+            raise ValueError(
+                f"compression must be None, 'gzip' or 'zstd', received {self.compression}"
+            )
+        if not isinstance(self.compression_threshold, int):
+            raise TypeError(
+                f"compression_threshold must be {int}, received {type(self.compression_threshold)}"
+            )
+        if self.compression_level is not None and not isinstance(self.compression_level, int):
+            raise TypeError(
+                f"compression_level must be {int}, received {type(self.compression_level)}"
+            )
+        if not isinstance(self.http2, bool):
+            raise TypeError(f"http2 must be {bool}, received {type(self.http2)}")
+        if self.json_codec not in ("json", "orjson"):
+            raise ValueError(f"json_codec must be 'json' or 'orjson', received {self.json_codec}")
+        if not isinstance(self.node_failure_threshold, int):
+            raise TypeError(
+                f"node_failure_threshold must be {int}, received {type(self.node_failure_threshold)}"
+            )
+        if not isinstance(self.node_ejection_time, (int, float)):
+            raise TypeError(
+                f"node_ejection_time must be {float}, received {type(self.node_ejection_time)}"
+            )
+        if self.hedging is not None and not isinstance(self.hedging, HedgingConfig):
+            raise TypeError(
+                f"hedging must be {HedgingConfig} or None, received {type(self.hedging)}"
+            )
 
 
 @dataclass
@@ -0,0 +1,112 @@
+"""
+Client-side load balancing of the requests of a connection across several weaviate nodes.
+"""
+import random
+import threading
+import time
+from typing import List
+
+# response status codes of a node that is overloaded, shutting down or not ready
+NODE_FAILURE_STATUS_CODES = (502, 503, 504)
+
+
+class _Node:
+    __slots__ = ("url", "in_flight", "failures", "ejected_until")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.in_flight = 0
+        self.failures = 0
+        self.ejected_until = 0.0
+
+
+class NodeBalancer:
+    """
+    Spread requests across weaviate nodes with the power of two choices: each request goes to the
+    node with fewer requests in flight of two randomly picked nodes. Nodes are health checked
+    passively, a node that fails `failure_threshold` requests in a row is ejected for
+    `ejection_time` seconds. Afterwards it receives requests again, and is ejected again by its
+    next failure unless a request succeeds first. If all nodes are ejected, the node whose
+    ejection ends first is used.
+    """
+
+    def __init__(self, urls: List[str], failure_threshold: int, ejection_time: float):
+        """
+        Initialize a NodeBalancer class instance.
+
+        Parameters
+        ----------
+        urls : list of str
+            The URLs of the weaviate nodes.
+        failure_threshold : int
+            The number of consecutive failed requests after which a node is ejected.
+        ejection_time : float
+            How long a failing node is ejected, in seconds.
+        """
+
+        self._nodes = [_Node(url) for url in urls]
+        self._failure_threshold = failure_threshold
+        self._ejection_time = ejection_time
+        self._lock = threading.Lock()
+
+    def acquire(self) -> _Node:
+        """
+        Pick the node for a request. Every acquired node must be released with `release`.
+
+        Returns
+        -------
+        _Node
+            The node to send the request to.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            healthy = [node for node in self._nodes if node.ejected_until <= now]
+            if len(healthy) == 0:
+                node = min(self._nodes, key=lambda node: node.ejected_until)
+            elif len(healthy) == 1:
+                node = healthy[0]
+            else:
+                first, second = random.sample(healthy, 2)
+                node = first if first.in_flight <= second.in_flight else second
+            node.in_flight += 1
+            return node
+
+    def release(self, node: _Node, failed: bool) -> None:
+        """
+        Record the outcome of a request to a node.
+
+        Parameters
+        ----------
+        node : _Node
+            The node returned by `acquire`.
+        failed : bool
+            Whether the node failed to answer the request.
+        """
+
+        with self._lock:
+            node.in_flight -= 1
+            if not failed:
+                node.failures = 0
+                return
+            node.failures += 1
+            if node.failures >= self._failure_threshold:
+                node.ejected_until = time.monotonic() + self._ejection_time
+
+    @property
+    def urls(self) -> List[str]:
+        """
+        The URLs of all nodes.
+        """
+
+        return [node.url for node in self._nodes]
+
+    @property
+    def healthy_urls(self) -> List[str]:
+        """
+        The URLs of the nodes that are currently not ejected.
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            return [node.url for node in self._nodes if node.ejected_until <= now]
@@ -0,0 +1,136 @@
+"""
+JSON codecs used to encode the request bodies and decode the responses of a connection.
+"""
+import json
+from typing import Any, Union
+
+from weaviate.config import JSONCodec
+
+try:
+    import orjson
+
+    has_orjson = True
+
+except ImportError:
+    has_orjson = False
+
+
+class _JSONCodec:
+    """
+    JSON codec based on the standard library `json` module.
+    """
+
+    name: JSONCodec = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode an object as UTF-8 encoded JSON. NaN and infinite floats raise a ValueError, array
+        types like `numpy.ndarray` or `torch.Tensor` are encoded as lists.
+
+        Parameters
+        ----------
+        obj : Any
+            The object to encode.
+
+        Returns
+        -------
+        bytes
+            The encoded object.
+        """
+
+        return json.dumps(obj, allow_nan=False, default=_default).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decode a JSON document.
+
+        Parameters
+        ----------
+        data : bytes or str
+            The JSON document.
+
+        Returns
+        -------
+        Any
+            The decoded document.
+
+        Raises
+        ------
+        json.JSONDecodeError
+            If `data` is not a valid JSON document.
+        """
+
+        return json.loads(data)
+
+    def decode_response(self, response: Any, *args: Any, **kwargs: Any) -> Any:
+        """
+        A response hook for `requests` and `httpx` that decodes the body of the response with
+        this codec when its `json()` method is called.
+        """
+
+        response_json = response.json
+
+        def decode(**json_kwargs: Any) -> Any:
+            if len(json_kwargs) > 0:
+                return response_json(**json_kwargs)
+            return self.loads(response.content)
+
+        response.json = decode
+        return response
+
+
+class _ORJSONCodec(_JSONCodec):
+    """
+    JSON codec based on `orjson`. Encodes `numpy.ndarray` without converting it to a list first.
+    Unlike the `json` codec, NaN and infinite floats are encoded as null.
+    """
+
+    name: JSONCodec = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+
+def get_json_codec(name: JSONCodec) -> _JSONCodec:
+    """
+    Get the JSON codec for the `json_codec` setting of `weaviate.ConnectionConfig`. `orjson` is
+    only used if it is selected explicitly, because it encodes NaN and infinite floats as null
+    instead of raising a ValueError.
+
+    Parameters
+    ----------
+    name : "json" or "orjson"
+        The name of the codec.
+
+    Returns
+    -------
+    _JSONCodec
+        The JSON codec.
+
+    Raises
+    ------
+    ImportError
+        If `name` is "orjson" and `orjson` is not installed.
+    """
+
+    if name == "orjson" and not has_orjson:
+        raise ImportError(
+            "The 'orjson' JSON codec requires 'orjson', install it with 'pip install orjson'."
+        )
+    if name == "orjson":
+        return _ORJSONCodec()
+    return _JSONCodec()
+
+
+def _default(obj: Any) -> Any:
+    # numpy.ndarray and numpy scalars, torch.Tensor, tf.Tensor
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    if hasattr(obj, "numpy"):
+        return obj.numpy().tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
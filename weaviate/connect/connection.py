@@ -4,24 +4,29 @@ Connection class definition.
 from __future__ import annotations
 
 import datetime
+import gzip
 import os
 import socket
 import time
 from threading import Thread, Event
-from typing import Any, Dict, Optional, Tuple, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union, cast
 from urllib.parse import urlparse
 
 import requests
 from authlib.integrations.requests_client import OAuth2Session  # type: ignore
-from requests.adapters import HTTPAdapter
-from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout, Timeout
 from requests.exceptions import HTTPError as RequestsHTTPError
 from requests.exceptions import JSONDecodeError
 
 from weaviate import __version__ as client_version
 from weaviate.auth import AuthCredentials, AuthClientCredentials, AuthApiKey
-from weaviate.config import ConnectionConfig
+from weaviate.config import Compression, ConnectionConfig
 from weaviate.connect.authentication import _Auth
+from weaviate.connect.balancer import NODE_FAILURE_STATUS_CODES, NodeBalancer
+from weaviate.connect.codec import _JSONCodec, get_json_codec
+from weaviate.connect.hedging import Hedger
+from weaviate.connect.http2 import HTTP2Adapter
 from weaviate.embedded import EmbeddedDB
 from weaviate.exceptions import (
     AuthenticationFailedException,
@@ -48,11 +53,21 @@ try:
 except ImportError:
     has_grpc = False
 
+try:
+    import zstandard
+
+    has_zstd = True
+
+except ImportError:
+    has_zstd = False
+
 
 JSONPayload = Union[dict, list]
+T = TypeVar("T")
 Session = Union[requests.sessions.Session, OAuth2Session]
 TIMEOUT_TYPE_RETURN = Tuple[NUMBERS, NUMBERS]
 INIT_CHECK_TIMEOUT = 0.5
+DEFAULT_COMPRESSION_LEVELS = {"gzip": 1, "zstd": 3}
 
 
 class Connection:
@@ -62,7 +77,7 @@ class Connection:
 
     def __init__(
         self,
-        url: str,
+        url: Union[str, List[str]],
         auth_client_secret: Optional[AuthCredentials],
         timeout_config: TIMEOUT_TYPE_RETURN,
         proxies: Union[dict, str, None],
@@ -78,8 +93,10 @@ class Connection:
 
         Parameters
         ----------
-        url : str
-            URL to a running weaviate instance.
+        url : str or list of str
+            URL to a running weaviate instance, or the URLs of several nodes of a weaviate cluster.
+            The requests are spread across the nodes, see `weaviate.connect.balancer.NodeBalancer`.
+            The first URL is used for the authentication, the startup check and gRPC.
         auth_client_secret : weaviate.auth.AuthCredentials, optional
             Credentials to authenticate with a weaviate instance. The credentials are not saved within the client and
             authentication is done via authentication tokens.
@@ -113,12 +130,34 @@ class Connection:
         """
 
         self._api_version_path = "/v1"
-        self.url = url  # e.g. http://localhost:80
+        urls = [url] if isinstance(url, str) else url
+        self.url = urls[0]  # e.g. http://localhost:80
+        self._balancer: Optional[NodeBalancer] = None
+        if len(urls) > 1:
+            self._balancer = NodeBalancer(
+                urls,
+                failure_threshold=connection_config.node_failure_threshold,
+                ejection_time=connection_config.node_ejection_time,
+            )
         self.timeout_config: TIMEOUT_TYPE_RETURN = timeout_config
         self.embedded_db = embedded_db
 
         self._grpc_stub: Optional[weaviate_pb2_grpc.WeaviateStub] = None
 
+        self._compression = connection_config.compression
+        self._compression_threshold = connection_config.compression_threshold
+        self._compression_level = connection_config.compression_level
+        if self._compression == "zstd" and not has_zstd:
+            raise ImportError(
+                "zstd compression requires 'zstandard', install it with 'pip install zstandard'."
+            )
+        self._json_codec = get_json_codec(connection_config.json_codec)
+        self._hedger: Optional[Hedger] = None
+        if connection_config.hedging is not None:
+            self._hedger = Hedger(
+                connection_config.hedging, max_workers=2 * connection_config.session_pool_maxsize
+            )
+
         # create GRPC channel. If weaviate does not support GRPC, fallback to GraphQL is used.
         if has_grpc and grcp_port is not None:
             parsed_url = urlparse(self.url)
@@ -167,6 +206,7 @@ class Connection:
 
         self._create_sessions(auth_client_secret)
         self._add_adapter_to_session(connection_config)
+        self._session.hooks["response"].append(self._json_codec.decode_response)
 
         self._server_version = self.get_meta()["version"]
         if self._server_version < "1.14":
@@ -263,10 +303,17 @@ class Connection:
         return ""
 
     def _add_adapter_to_session(self, connection_config: ConnectionConfig) -> None:
-        adapter = HTTPAdapter(
-            pool_connections=connection_config.session_pool_connections,
-            pool_maxsize=connection_config.session_pool_maxsize,
-        )
+        adapter: BaseAdapter
+        if connection_config.http2:
+            adapter = HTTP2Adapter(
+                max_connections=connection_config.session_pool_maxsize,
+                max_keepalive_connections=connection_config.session_pool_connections,
+            )
+        else:
+            adapter = HTTPAdapter(
+                pool_connections=connection_config.session_pool_connections,
+                pool_maxsize=connection_config.session_pool_maxsize,
+            )
         self._session.mount("http://", adapter)
         self._session.mount("https://", adapter)
 
@@ -330,6 +377,8 @@ class Connection:
             self._shutdown_background_event.set()
         if hasattr(self, "_session"):
             self._session.close()
+        if hasattr(self, "_hedger") and self._hedger is not None:
+            self._hedger.close()
 
     def _get_request_header(self) -> dict:
         """
@@ -342,6 +391,63 @@ class Connection:
         """
         return self._headers
 
+    def _send(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a request to the weaviate instance, or to one of the weaviate nodes if the connection
+        has several URLs. Reads are hedged if configured, see `weaviate.HedgingConfig`.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        path : str
+            Sub-path to the Weaviate resources, without version.
+        **kwargs
+            Further arguments of `requests.Session.request`. The headers, the timeout and the
+            proxies of the connection are used if not given.
+
+        Returns
+        -------
+        requests.Response
+            The response, if request was successful.
+
+        Raises
+        ------
+        requests.ConnectionError
+            If the request could not be made.
+        """
+
+        if self.embedded_db is not None:
+            self.embedded_db.ensure_running()
+        kwargs.setdefault("headers", self._get_request_header())
+        kwargs.setdefault("timeout", self._timeout_config)
+        kwargs.setdefault("proxies", self._proxies)
+
+        # GraphQL queries are reads as well, weaviate has no GraphQL mutations
+        if self._hedger is not None and (method in ("GET", "HEAD") or path == "/graphql"):
+            return self._hedger.run(lambda: self._send_to_node(method, path, kwargs))
+        return self._send_to_node(method, path, kwargs)
+
+    def _send_to_node(self, method: str, path: str, kwargs: Dict[str, Any]) -> requests.Response:
+        if self._balancer is None:
+            return self._session.request(
+                method, url=self.url + self._api_version_path + path, **kwargs
+            )
+
+        node = self._balancer.acquire()
+        try:
+            response = self._session.request(
+                method, url=node.url + self._api_version_path + path, **kwargs
+            )
+        except (RequestsConnectionError, Timeout):
+            self._balancer.release(node, failed=True)
+            raise
+        except BaseException:
+            self._balancer.release(node, failed=False)
+            raise
+        self._balancer.release(node, failed=response.status_code in NODE_FAILURE_STATUS_CODES)
+        return response
+
     def delete(
         self,
         path: str,
@@ -371,16 +477,10 @@ class Connection:
         requests.ConnectionError
             If the DELETE request could not be made.
         """
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.delete(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
-            timeout=self._timeout_config,
-            proxies=self._proxies,
+        return self._send(
+            "DELETE",
+            path,
+            data=None if weaviate_object is None else self._json_codec.dumps(weaviate_object),
             params=params,
         )
 
@@ -412,35 +512,31 @@ class Connection:
         requests.ConnectionError
             If the PATCH request could not be made.
         """
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.patch(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
-            timeout=self._timeout_config,
-            proxies=self._proxies,
+        return self._send(
+            "PATCH",
+            path,
+            data=self._json_codec.dumps(weaviate_object),
             params=params,
         )
 
     def post(
         self,
         path: str,
-        weaviate_object: JSONPayload,
+        weaviate_object: Union[JSONPayload, bytes],
         params: Optional[Dict[str, Any]] = None,
     ) -> requests.Response:
         """
-        Make a POST request to the Weaviate server instance.
+        Make a POST request to the Weaviate server instance. If compression is configured in the
+        `ConnectionConfig`, payloads of at least `compression_threshold` bytes are compressed in
+        the calling thread, i.e. in the worker threads for batch requests.
 
         Parameters
         ----------
         path : str
             Sub-path to the Weaviate resources. Must be a valid Weaviate sub-path.
             e.g. '/meta' or '/objects', without version.
-        weaviate_object : dict
-            Object is used as payload for POST request.
+        weaviate_object : dict, list or bytes
+            Object is used as payload for POST request. Bytes are sent as already serialized JSON.
         params : dict, optional
             Additional request parameters, by default None
         external_url: Is an external (non-weaviate) url called
@@ -455,18 +551,15 @@ class Connection:
         requests.ConnectionError
             If the POST request could not be made.
         """
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.post(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
-            timeout=self._timeout_config,
-            proxies=self._proxies,
-            params=params,
-        )
+        headers = self._get_request_header()
+        if isinstance(weaviate_object, bytes):
+            body = weaviate_object
+        else:
+            body = self._json_codec.dumps(weaviate_object)
+        if self._compression is not None and len(body) >= self._compression_threshold:
+            body = _compress(body, self._compression, self._compression_level)
+            headers = dict(headers, **{"content-encoding": self._compression})
+        return self._send("POST", path, data=body, headers=headers, params=params)
 
     def put(
         self,
@@ -496,16 +589,10 @@ class Connection:
         requests.ConnectionError
             If the PUT request could not be made.
         """
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
-
-        return self._session.put(
-            url=request_url,
-            json=weaviate_object,
-            headers=self._get_request_header(),
-            timeout=self._timeout_config,
-            proxies=self._proxies,
+        return self._send(
+            "PUT",
+            path,
+            data=self._json_codec.dumps(weaviate_object),
             params=params,
         )
 
@@ -533,23 +620,21 @@ class Connection:
         requests.ConnectionError
             If the GET request could not be made.
         """
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
         if params is None:
             params = {}
 
         if external_url:
-            request_url = path
-        else:
-            request_url = self.url + self._api_version_path + path
-
-        return self._session.get(
-            url=request_url,
-            headers=self._get_request_header(),
-            timeout=self._timeout_config,
-            params=params,
-            proxies=self._proxies,
-        )
+            if self.embedded_db is not None:
+                self.embedded_db.ensure_running()
+            return self._session.get(
+                url=path,
+                headers=self._get_request_header(),
+                timeout=self._timeout_config,
+                params=params,
+                proxies=self._proxies,
+            )
+
+        return self._send("GET", path, params=params)
 
     def head(
         self,
@@ -577,17 +662,27 @@ class Connection:
         requests.ConnectionError
             If the HEAD request could not be made.
         """
-        if self.embedded_db is not None:
-            self.embedded_db.ensure_running()
-        request_url = self.url + self._api_version_path + path
+        return self._send("HEAD", path, params=params, allow_redirects=False)
 
-        return self._session.head(
-            url=request_url,
-            headers=self._get_request_header(),
-            timeout=self._timeout_config,
-            proxies=self._proxies,
-            params=params,
-        )
+    def hedged(self, request: Callable[[], T]) -> T:
+        """
+        Run an idempotent read request, e.g. a gRPC query, with hedging if it is configured. The
+        REST and GraphQL reads of the connection are hedged already.
+
+        Parameters
+        ----------
+        request : Callable
+            The request, it must be safe to run it twice at the same time.
+
+        Returns
+        -------
+        Any
+            The result of the request.
+        """
+
+        if self._hedger is None:
+            return request()
+        return self._hedger.run(request)
 
     @property
     def timeout_config(self) -> TIMEOUT_TYPE_RETURN:
@@ -662,6 +757,22 @@ class Connection:
     def grpc_stub(self) -> Optional[weaviate_pb2_grpc.WeaviateStub]:
         return self._grpc_stub
 
+    @property
+    def node_urls(self) -> List[str]:
+        """
+        The URLs of all weaviate nodes of the connection.
+        """
+        if self._balancer is None:
+            return [self.url]
+        return self._balancer.urls
+
+    @property
+    def json_codec(self) -> _JSONCodec:
+        """
+        The JSON codec used to encode the request bodies and decode the responses.
+        """
+        return self._json_codec
+
     @property
     def server_version(self) -> str:
         """
@@ -746,3 +857,29 @@ def _get_proxies(proxies: Union[dict, str, None], trust_env: bool) -> dict:
         proxies["https"] = https_proxy[0] if https_proxy[0] else https_proxy[1]
 
     return proxies
+
+
+def _compress(data: bytes, compression: Compression, level: Optional[int]) -> bytes:
+    """
+    Compress a request body.
+
+    Parameters
+    ----------
+    data : bytes
+        The request body.
+    compression : "gzip" or "zstd"
+        The compression algorithm.
+    level : int or None
+        The compression level. If None, 1 is used for gzip and 3 for zstd.
+
+    Returns
+    -------
+    bytes
+        The compressed request body.
+    """
+
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS[compression]
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=level)
+    return zstandard.ZstdCompressor(level=level).compress(data)
@@ -0,0 +1,149 @@
+"""
+Hedging of read requests: if a request takes longer than most recent requests, a duplicate is sent
+and the first response is used.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Optional, TypeVar
+
+from weaviate.config import HedgingConfig
+
+T = TypeVar("T")
+
+# no request is hedged before enough latencies are known to estimate the percentile
+MIN_LATENCY_SAMPLES = 20
+# the number of hedges that can be sent in a burst
+MAX_BUDGET_TOKENS = 10.0
+
+
+class Hedger:
+    """
+    Run idempotent requests with hedging. Each request runs on a worker thread. If it has not
+    finished after the `percentile` of the latencies of the last `window` requests, but at least
+    after `min_delay` seconds, a duplicate request is started, and the result of the request that
+    finishes first is returned. If that request failed, the result of the other one is returned.
+    The request that finished last is not cancelled, its result is dropped.
+
+    The hedges are limited to the fraction `budget` of the requests: every request adds `budget`
+    tokens, up to 10, and every hedge takes one. Requests never wait for a worker thread: if all
+    `max_workers` workers are busy, a request runs on the calling thread and is not hedged.
+    """
+
+    def __init__(self, config: HedgingConfig, max_workers: int):
+        """
+        Initialize a Hedger class instance.
+
+        Parameters
+        ----------
+        config : weaviate.HedgingConfig
+            The hedging policy.
+        max_workers : int
+            The maximal number of requests, including hedges, that run on worker threads at the
+            same time.
+        """
+
+        self._percentile = config.percentile
+        self._budget = config.budget
+        self._min_delay = config.min_delay
+        self._latencies: Deque[float] = deque(maxlen=config.window)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._num_running = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.num_hedged = 0
+
+    def run(self, request: Callable[[], T]) -> T:
+        """
+        Run a request, and a duplicate of it if it is slow.
+
+        Parameters
+        ----------
+        request : Callable
+            The request, it must be safe to run it twice at the same time.
+
+        Returns
+        -------
+        Any
+            The result of the first successful request.
+        """
+
+        with self._lock:
+            self._tokens = min(self._tokens + self._budget, MAX_BUDGET_TOKENS)
+            delay = self._delay()
+            # a worker is reserved for every submitted request, so none of them is queued and
+            # the delay is measured from the start of the request
+            if delay is not None and self._num_running < self._max_workers:
+                self._num_running += 1
+            else:
+                delay = None
+        if delay is None:
+            return self._timed(request)
+
+        executor = self._get_executor()
+        first = executor.submit(self._run_on_worker, request)
+        done, _ = wait([first], timeout=delay)
+        if len(done) > 0 or not self._take_hedge():
+            return first.result()
+
+        second = executor.submit(self._run_on_worker, request)
+        done, pending = wait([first, second], return_when=FIRST_COMPLETED)
+        winner: "Future[T]" = first if first in done else second
+        if winner.exception() is not None and len(pending) > 0:
+            # the other request may still succeed
+            other = pending.pop()
+            if other.exception() is None:
+                return other.result()
+        return winner.result()
+
+    def close(self) -> None:
+        """
+        Stop the worker threads, running requests are not waited for.
+        """
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _delay(self) -> Optional[float]:
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self._percentile / 100), len(latencies) - 1)
+        return max(latencies[index], self._min_delay)
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._tokens < 1 or self._num_running >= self._max_workers:
+                return False
+            self._tokens -= 1
+            self._num_running += 1
+            self.num_hedged += 1
+            return True
+
+    def _run_on_worker(self, request: Callable[[], T]) -> T:
+        try:
+            return self._timed(request)
+        finally:
+            with self._lock:
+                self._num_running -= 1
+
+    def _timed(self, request: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        try:
+            return request()
+        finally:
+            latency = time.perf_counter() - start
+            with self._lock:
+                self._latencies.append(latency)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="weaviate-hedging"
+                )
+            return self._executor
@@ -0,0 +1,189 @@
+"""
+Transport adapter that sends the requests of a `requests.Session` over HTTP/2.
+"""
+import os
+import ssl
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    ConnectTimeout,
+    ProxyError,
+    ReadTimeout,
+)
+from requests.structures import CaseInsensitiveDict
+from requests.utils import DEFAULT_CA_BUNDLE_PATH, get_encoding_from_headers, select_proxy
+
+try:
+    import httpx
+
+    has_httpx = True
+
+except ImportError:
+    has_httpx = False
+
+try:
+    import h2  # noqa: F401
+
+    has_h2 = True
+
+except ImportError:
+    has_h2 = False
+
+
+CERT_TYPE = Union[None, bytes, str, Tuple[Union[bytes, str], Union[bytes, str]]]
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    A `requests` transport adapter backed by an `httpx.Client` with HTTP/2 enabled. Concurrent
+    requests from several threads are multiplexed as streams over a few connections, instead of
+    every in-flight request holding a pooled socket of its own. HTTP/2 is negotiated during the
+    TLS handshake, i.e. for https URLs; servers without HTTP/2 support and plain http URLs are
+    served over HTTP/1.1 by the same pool.
+
+    The session keeps handling headers, authentication and retries, the adapter only replaces
+    how the prepared request is sent.
+    """
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 20):
+        """
+        Initialize an HTTP2Adapter class instance.
+
+        Parameters
+        ----------
+        max_connections : int, optional
+            The maximal number of connections per proxy and TLS configuration, by default 20.
+        max_keepalive_connections : int, optional
+            The maximal number of idle connections that are kept open, by default 20.
+
+        Raises
+        ------
+        ImportError
+            If `httpx` or `h2` is not installed.
+        """
+
+        if not has_httpx or not has_h2:
+            raise ImportError(
+                "HTTP/2 requires 'httpx' and 'h2', install them with 'pip install httpx[http2]'."
+            )
+        super().__init__()
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        # one client per proxy and TLS configuration, the session passes them per request
+        self._clients: Dict[Tuple[Optional[str], Any, Any], "httpx.Client"] = {}
+        self._clients_lock = threading.Lock()
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Union[None, float, Tuple[Optional[float], Optional[float]]] = None,
+        verify: Union[bool, str] = True,
+        cert: CERT_TYPE = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> Response:
+        """
+        Send a prepared request, see `requests.adapters.BaseAdapter.send`. The body is always read
+        completely, `stream` is ignored.
+        """
+
+        assert request.url is not None and request.method is not None
+        client = self._get_client(select_proxy(request.url, proxies), verify, cert)
+        if isinstance(timeout, tuple):
+            httpx_timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+
+        try:
+            response = client.request(
+                request.method,
+                request.url,
+                content=request.body,
+                headers=dict(request.headers),
+                timeout=httpx_timeout,
+            )
+        except httpx.ConnectTimeout as error:
+            raise ConnectTimeout(error, request=request) from error
+        except httpx.TimeoutException as error:
+            raise ReadTimeout(error, request=request) from error
+        except httpx.ProxyError as error:
+            raise ProxyError(error, request=request) from error
+        except httpx.TransportError as error:
+            raise RequestsConnectionError(error, request=request) from error
+        return self._build_response(request, response)
+
+    def close(self) -> None:
+        """
+        Close all connections.
+        """
+
+        with self._clients_lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+    def _get_client(
+        self,
+        proxy: Optional[str],
+        verify: Union[bool, str],
+        cert: CERT_TYPE,
+    ) -> "httpx.Client":
+        key = (proxy, verify, cert)
+        with self._clients_lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = httpx.Client(
+                    http2=True,
+                    limits=self._limits,
+                    proxy=proxy,
+                    verify=_ssl_context(verify, cert),
+                    trust_env=False,
+                )
+                self._clients[key] = client
+            return client
+
+    def _build_response(self, request: PreparedRequest, response: "httpx.Response") -> Response:
+        """
+        Convert the `httpx` response like `requests.adapters.HTTPAdapter.build_response`.
+        """
+
+        built = Response()
+        built.status_code = response.status_code
+        built.headers = CaseInsensitiveDict(response.headers)
+        built.encoding = get_encoding_from_headers(built.headers)
+        built.reason = response.reason_phrase
+        built.url = str(request.url)
+        built.request = request
+        built.connection = self  # type: ignore[assignment]
+        built._content = response.content
+        return built
+
+
+def _ssl_context(verify: Union[bool, str], cert: CERT_TYPE) -> Union[bool, ssl.SSLContext]:
+    """
+    The `verify` argument of `httpx.Client` for the `verify` and `cert` arguments of `requests`.
+    """
+
+    if verify is True and cert is None:
+        return True
+    if verify is False:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str) and os.path.isdir(verify):
+        context = ssl.create_default_context(capath=verify)
+    elif isinstance(verify, str):
+        context = ssl.create_default_context(cafile=verify)
+    else:
+        context = ssl.create_default_context(cafile=DEFAULT_CA_BUNDLE_PATH)
+    if isinstance(cert, tuple):
+        context.load_cert_chain(cert[0], cert[1])
+    elif cert is not None:
+        context.load_cert_chain(cert)
+    return context
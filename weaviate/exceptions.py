@@ -2,7 +2,11 @@
 Weaviate Exceptions.
 """
 
-from requests import Response, exceptions
+import json
+
+from requests import exceptions
+
+from weaviate.types import HTTPResponse
 
 ERROR_CODE_EXPLANATION = {
     413: """Payload Too Large. Try to decrease the batch size or increase the maximum request size on your weaviate
@@ -35,7 +39,7 @@ class UnexpectedStatusCodeException(WeaviateBaseError):
     not handled in the client implementation and suggests an error.
     """
 
-    def __init__(self, message: str, response: Response):
+    def __init__(self, message: str, response: HTTPResponse):
         """
         Is raised in case the status code returned from Weaviate is
         not handled in the client implementation and suggests an error.
@@ -48,7 +52,7 @@ class UnexpectedStatusCodeException(WeaviateBaseError):
         ----------
         message: str
             An error message specific to the context, in which the error occurred.
-        response: requests.Response
+        response: requests.Response or httpx.Response
             The request response of which the status code was unexpected.
         """
         self._status_code: int = response.status_code
@@ -56,7 +60,7 @@ class UnexpectedStatusCodeException(WeaviateBaseError):
 
         try:
             body = response.json()
-        except exceptions.JSONDecodeError:
+        except (exceptions.JSONDecodeError, json.JSONDecodeError):
             body = None
 
         msg = (
@@ -74,14 +78,14 @@ class UnexpectedStatusCodeException(WeaviateBaseError):
 
 
 class ResponseCannotBeDecodedException(WeaviateBaseError):
-    def __init__(self, location: str, response: Response):
+    def __init__(self, location: str, response: HTTPResponse):
         """Raised when a weaviate response cannot be decoded to json
 
         Parameters
         ----------
         location: str
             From which code path the exception was raised.
-        response: requests.Response
+        response: requests.Response or httpx.Response
             The request response of which the status code was unexpected.
         """
         msg = f"Cannot decode response from weaviate {response} with content {response.text} for request from {location}"
@@ -157,3 +161,20 @@ class WeaviateEmbeddedInvalidVersion(WeaviateBaseError):
         Url provided was: {url}.
         """
         super().__init__(msg)
+
+
+class BatchItemFailedException(WeaviateBaseError):
+    """Is raised by a `BatchItemFuture` if weaviate reported an error for the object or reference."""
+
+    def __init__(self, item: dict):
+        """
+        Parameters
+        ----------
+        item: dict
+            The object or reference as returned by weaviate, including the errors.
+        """
+
+        self.item = item
+        errors = item.get("result", {}).get("errors", {}).get("error", [])
+        msg = "; ".join(str(error.get("message")) for error in errors)
+        super().__init__(f"Batch item failed: {msg}")
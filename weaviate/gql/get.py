@@ -1809,7 +1809,25 @@ class GetBuilder(GraphQL):
         weaviate.UnexpectedStatusCodeException
             If weaviate reports a none OK status.
         """
-        grpc_enabled = (  # only implemented for some scenarios
+        if self._is_grpc_query():
+            try:
+                request, metadata = self._grpc_request(), self._grpc_metadata()
+                res, _ = self._connection.hedged(
+                    lambda: self._connection.grpc_stub.Search.with_call(  # type: ignore
+                        request, metadata=metadata
+                    )
+                )
+                return self._grpc_results(res)
+            except grpc.RpcError as e:
+                return {"errors": [e.details()]}
+        else:
+            return super().do()
+
+    def _is_grpc_query(self) -> bool:
+        """
+        Whether the query can be sent over gRPC, which is only implemented for some scenarios.
+        """
+        return (
             self._connection.grpc_stub is not None
             and (
                 self._near_clause is None
@@ -1830,79 +1848,68 @@ class GetBuilder(GraphQL):
                 if isinstance(prop, str)
             )  # no ref props as strings
         )
-        if grpc_enabled:
-            metadata: Union[Tuple, Tuple[Tuple[Literal["authorization"], str]]] = ()
-            access_token = self._connection.get_current_bearer_token()
-            if len(access_token) > 0:
-                metadata = (("authorization", access_token),)
 
-            try:
-                res, _ = self._connection.grpc_stub.Search.with_call(  # type: ignore
-                    search_get_pb2.SearchRequest(
-                        collection=self._class_name,
-                        limit=self._limit,
-                        near_vector=search_get_pb2.NearVector(
-                            vector=self._near_clause.content["vector"],
-                            certainty=self._near_clause.content.get("certainty", None),
-                            distance=self._near_clause.content.get("distance", None),
-                        )
-                        if self._near_clause is not None
-                        and isinstance(self._near_clause, NearVector)
-                        else None,
-                        near_object=search_get_pb2.NearObject(
-                            id=self._near_clause.content["id"],
-                            certainty=self._near_clause.content.get("certainty", None),
-                            distance=self._near_clause.content.get("distance", None),
-                        )
-                        if self._near_clause is not None
-                        and isinstance(self._near_clause, NearObject)
-                        else None,
-                        properties=self._convert_references_to_grpc(self._properties),
-                        metadata=search_get_pb2.MetadataRequest(
-                            uuid=self._additional_dataclass.uuid,
-                            vector=self._additional_dataclass.vector,
-                            creation_time_unix=self._additional_dataclass.creationTimeUnix,
-                            last_update_time_unix=self._additional_dataclass.lastUpdateTimeUnix,
-                            distance=self._additional_dataclass.distance,
-                            explain_score=self._additional_dataclass.explainScore,
-                            score=self._additional_dataclass.score,
-                        )
-                        if self._additional_dataclass is not None
-                        else None,
-                        bm25_search=search_get_pb2.BM25(
-                            properties=self._bm25.properties, query=self._bm25.query
-                        )
-                        if self._bm25 is not None
-                        else None,
-                        hybrid_search=search_get_pb2.Hybrid(
-                            properties=self._hybrid.properties,
-                            query=self._hybrid.query,
-                            alpha=self._hybrid.alpha,
-                            vector=self._hybrid.vector,
-                        )
-                        if self._hybrid is not None
-                        else None,
-                    ),
-                    metadata=metadata,
-                )
-
-                objects = []
-                for result in res.results:
-                    obj = self._convert_references_to_grpc_result(result.properties)
-                    additional = self._extract_additional_properties(result.metadata)
-                    if len(additional) > 0:
-                        obj["_additional"] = additional
-                    objects.append(obj)
+    def _grpc_metadata(self) -> Union[Tuple, Tuple[Tuple[Literal["authorization"], str]]]:
+        access_token = self._connection.get_current_bearer_token()
+        if len(access_token) > 0:
+            return (("authorization", access_token),)
+        return ()
+
+    def _grpc_request(self) -> "search_get_pb2.SearchRequest":
+        return search_get_pb2.SearchRequest(
+            collection=self._class_name,
+            limit=self._limit,
+            near_vector=search_get_pb2.NearVector(
+                vector=self._near_clause.content["vector"],
+                certainty=self._near_clause.content.get("certainty", None),
+                distance=self._near_clause.content.get("distance", None),
+            )
+            if self._near_clause is not None and isinstance(self._near_clause, NearVector)
+            else None,
+            near_object=search_get_pb2.NearObject(
+                id=self._near_clause.content["id"],
+                certainty=self._near_clause.content.get("certainty", None),
+                distance=self._near_clause.content.get("distance", None),
+            )
+            if self._near_clause is not None and isinstance(self._near_clause, NearObject)
+            else None,
+            properties=self._convert_references_to_grpc(self._properties),
+            metadata=search_get_pb2.MetadataRequest(
+                uuid=self._additional_dataclass.uuid,
+                vector=self._additional_dataclass.vector,
+                creation_time_unix=self._additional_dataclass.creationTimeUnix,
+                last_update_time_unix=self._additional_dataclass.lastUpdateTimeUnix,
+                distance=self._additional_dataclass.distance,
+                explain_score=self._additional_dataclass.explainScore,
+                score=self._additional_dataclass.score,
+            )
+            if self._additional_dataclass is not None
+            else None,
+            bm25_search=search_get_pb2.BM25(
+                properties=self._bm25.properties, query=self._bm25.query
+            )
+            if self._bm25 is not None
+            else None,
+            hybrid_search=search_get_pb2.Hybrid(
+                properties=self._hybrid.properties,
+                query=self._hybrid.query,
+                alpha=self._hybrid.alpha,
+                vector=self._hybrid.vector,
+            )
+            if self._hybrid is not None
+            else None,
+        )
 
-                results: Union[Dict[str, Dict[str, Dict[str, List]]], Dict[str, List]] = {
-                    "data": {"Get": {self._class_name: objects}}
-                }
+    def _grpc_results(self, res: "search_get_pb2.SearchReply") -> dict:
+        objects = []
+        for result in res.results:
+            obj = self._convert_references_to_grpc_result(result.properties)
+            additional = self._extract_additional_properties(result.metadata)
+            if len(additional) > 0:
+                obj["_additional"] = additional
+            objects.append(obj)
 
-            except grpc.RpcError as e:
-                results = {"errors": [e.details()]}
-            return results
-        else:
-            return super().do()
+        return {"data": {"Get": {self._class_name: objects}}}
 
     def _extract_additional_properties(
         self, props: "search_get_pb2.MetadataResult"
@@ -12,8 +12,8 @@ from google.protobuf.internal import builder as _builder
 _sym_db = _symbol_database.Default()
 
 
-from proto.v1 import batch_pb2 as v1_dot_batch__pb2
-from proto.v1 import search_get_pb2 as v1_dot_search__get__pb2
+from weaviate.proto.v1 import batch_pb2 as v1_dot_batch__pb2
+from weaviate.proto.v1 import search_get_pb2 as v1_dot_search__get__pb2
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
@@ -1,5 +1,20 @@
 import uuid
-from typing import Union
+from typing import Any, Protocol, Union
 
 UUID = Union[str, uuid.UUID]
 NUMBERS = Union[int, float]
+
+
+class HTTPResponse(Protocol):
+    """
+    The parts of a `requests.Response` or `httpx.Response` used to handle responses.
+    """
+
+    status_code: int
+
+    @property
+    def text(self) -> str:
+        ...
+
+    def json(self, **kwargs: Any) -> Any:
+        ...
@@ -19,7 +19,7 @@ from weaviate.exceptions import (
     UnexpectedStatusCodeException,
     ResponseCannotBeDecodedException,
 )
-from weaviate.types import NUMBERS
+from weaviate.types import NUMBERS, HTTPResponse
 
 PYPI_PACKAGE_URL = "https://pypi.org/pypi/weaviate-client/json"
 MAXIMUM_MINOR_VERSION_DELTA = 3  # The maximum delta between minor versions of Weaviate Client that will not trigger an upgrade warning.
@@ -411,6 +411,44 @@ def get_vector(vector: Sequence) -> list:
             ) from None
 
 
+def get_vectors(vectors: Sequence) -> List[list]:
+    """
+    Get weaviate compatible format of multiple embedding vectors at once. Converting a whole
+    2D array at once is much faster than converting each row with `get_vector`.
+
+    Parameters
+    ----------
+    vectors: Sequence
+        The embeddings of multiple objects, one per row. Supported types are a `list` of
+        vectors (see `get_vector`) and 2D `numpy.ndarray`, `torch.Tensor` and `tf.Tensor`.
+
+    Returns
+    -------
+    List[list]
+        The embeddings as a list of lists.
+
+    Raises
+    ------
+    TypeError
+        If 'vectors' is not of a supported type.
+    """
+
+    if isinstance(vectors, list):
+        return [get_vector(vector) for vector in vectors]
+    try:
+        # if vectors is numpy.ndarray or torch.Tensor
+        return vectors.tolist()  # type: ignore
+    except AttributeError:
+        try:
+            # if vectors is tf.Tensor
+            return vectors.numpy().tolist()  # type: ignore
+        except AttributeError:
+            raise TypeError(
+                "The type of the 'vectors' argument is not supported!\n"
+                "Supported types are `list`, 'numpy.ndarray`, `torch.Tensor` and `tf.Tensor`"
+            ) from None
+
+
 def get_domain_from_weaviate_url(url: str) -> str:
     """
     Get the domain from a weaviate URL.
@@ -782,9 +820,7 @@ def _type_request_response(json_response: Any) -> Optional[Dict[str, Any]]:
     return json_response
 
 
-def _decode_json_response_dict(
-    response: requests.Response, location: str
-) -> Optional[Dict[str, Any]]:
+def _decode_json_response_dict(response: HTTPResponse, location: str) -> Optional[Dict[str, Any]]:
     if response is None:
         return None
 
@@ -792,14 +828,14 @@ def _decode_json_response_dict(
         try:
             json_response = cast(dict, response.json())
             return json_response
-        except JSONDecodeError:
+        except (JSONDecodeError, json.JSONDecodeError):
             raise ResponseCannotBeDecodedException(location, response)
 
     raise UnexpectedStatusCodeException(location, response)
 
 
 def _decode_json_response_list(
-    response: requests.Response, location: str
+    response: HTTPResponse, location: str
 ) -> Optional[List[Dict[str, Any]]]:
     if response is None:
         return None
@@ -808,6 +844,6 @@ def _decode_json_response_list(
         try:
             json_response = response.json()
             return cast(list, json_response)
-        except JSONDecodeError:
+        except (JSONDecodeError, json.JSONDecodeError):
             raise ResponseCannotBeDecodedException(location, response)
     raise UnexpectedStatusCodeException(location, response)
@@ -134,3 +134,23 @@ class _Warnings:
             category=DeprecationWarning,
             stacklevel=1,
         )
+
+    @staticmethod
+    def batch_grpc_fallback_to_rest(exc: Exception) -> None:
+        warnings.warn(
+            message=f"""Bat001: Could not send the batch over gRPC, the REST endpoint is used instead.
+            Exception: {exc}
+            """,
+            category=UserWarning,
+            stacklevel=1,
+        )
+
+    @staticmethod
+    def batch_spool_not_empty(directory: str, num_segments: int) -> None:
+        warnings.warn(
+            message=f"""Bat002: The batch spool directory {directory} contains {num_segments} segment(s) with items
+            that were not acknowledged by weaviate in an earlier run. Call `batch.resume("{directory}")` to send them.
+            """,
+            category=UserWarning,
+            stacklevel=1,
+        )